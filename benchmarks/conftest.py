@@ -0,0 +1,100 @@
+"""Sections used for benchmarking the section analysis."""
+
+import pytest
+from shapely import Polygon
+from shapely.geometry import Point
+
+from structuralcodes.geometry import (
+    HE,
+    CompoundGeometry,
+    SurfaceGeometry,
+    add_reinforcement_circle,
+    add_reinforcement_line,
+)
+from structuralcodes.materials.concrete import ConcreteMC2010
+from structuralcodes.materials.constitutive_laws import ElasticPlastic
+from structuralcodes.materials.reinforcement import ReinforcementMC2010
+from structuralcodes.sections import GenericSection
+
+
+def _materials():
+    """Return the concrete and the reinforcement used for benchmarks."""
+    concrete = ConcreteMC2010(30)
+    steel = ReinforcementMC2010(fyk=500, Es=200000, ftk=540, epsuk=0.075)
+    return concrete, steel
+
+
+def create_rectangle():
+    """Small size: rectangular section with 8 bars."""
+    concrete, steel = _materials()
+    geo = SurfaceGeometry(
+        Polygon(((0, 0), (300, 0), (300, 600), (0, 600))), concrete
+    )
+    geo = add_reinforcement_line(geo, (40, 40), (260, 40), 20, steel, n=4)
+    geo = add_reinforcement_line(geo, (40, 560), (260, 560), 20, steel, n=4)
+    return geo.translate(-150, -300)
+
+
+def create_t_section():
+    """Medium size: T section with 24 bars."""
+    concrete, steel = _materials()
+    web = SurfaceGeometry(
+        Polygon(((-150, 0), (150, 0), (150, 800), (-150, 800))), concrete
+    )
+    flange = SurfaceGeometry(
+        Polygon(((-750, 800), (750, 800), (750, 1000), (-750, 1000))),
+        concrete,
+    )
+    geo = web + flange
+    geo = add_reinforcement_line(geo, (-110, 40), (110, 40), 25, steel, n=4)
+    geo = add_reinforcement_line(geo, (-110, 90), (110, 90), 25, steel, n=4)
+    geo = add_reinforcement_line(geo, (-710, 960), (710, 960), 12, steel, n=16)
+    return geo.translate(0, -700)
+
+
+def create_circle():
+    """Large size: circular pile with 200 bars."""
+    concrete, steel = _materials()
+    geo = SurfaceGeometry(Point(0, 0).buffer(1000, quad_segs=32), concrete)
+    geo = add_reinforcement_circle(geo, (0, 0), 920, 20, steel, n=100)
+    return add_reinforcement_circle(geo, (0, 0), 860, 20, steel, n=100)
+
+
+def create_steel_profile():
+    """Steel section: HE 500 B profile."""
+    steel = ElasticPlastic(E=210000, fy=355, eps_su=0.07)
+    return CompoundGeometry([SurfaceGeometry(HE.get_polygon('HEB500'), steel)])
+
+
+SECTIONS = {
+    'rectangle': create_rectangle,
+    't_section': create_t_section,
+    'circle': create_circle,
+    'steel_profile': create_steel_profile,
+}
+INTEGRATORS = ['marin', 'fiber']
+
+
+@pytest.fixture(params=list(SECTIONS))
+def geometry(request):
+    """The geometry of each benchmarked section."""
+    return SECTIONS[request.param]()
+
+
+@pytest.fixture(params=INTEGRATORS)
+def integrator(request):
+    """The name of each benchmarked integrator."""
+    return request.param
+
+
+@pytest.fixture
+def section(geometry, integrator):
+    """A section with the mesh for the fiber integrator already created."""
+    sec = GenericSection(geometry, integrator=integrator, mesh_size=0.001)
+    # Create the fiber mesh before benchmarking
+    calc = sec.section_calculator
+    if hasattr(calc.integrator, 'prepare_triangulated_data'):
+        calc.triangulated_data = calc.integrator.prepare_triangulated_data(
+            geo=sec.geometry, mesh_size=calc.mesh_size
+        )
+    return sec
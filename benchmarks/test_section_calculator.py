@@ -0,0 +1,67 @@
+"""Benchmarks for the GenericSectionCalculator.
+
+Run with ``make bench`` or ``python -m pytest benchmarks``. Each benchmark is
+run for all the sections and integrators defined in conftest.py.
+"""
+
+import numpy as np
+
+# The domains are expensive: run them a fixed number of rounds
+DOMAIN_ROUNDS = 3
+
+
+def test_gross_properties(benchmark, section):
+    """Benchmark the gross properties."""
+    calc = section.section_calculator
+    benchmark(calc._calculate_gross_section_properties)
+
+
+def test_bending_strength(benchmark, section):
+    """Benchmark the bending strength for a skew neutral axis."""
+    calc = section.section_calculator
+    # Compute and store the axial limits checked by the calculation outside
+    # the benchmark
+    n = 0.3 * calc.n_min
+    benchmark(calc.calculate_bending_strength, theta=np.pi / 6, n=n)
+
+
+def test_moment_curvature(benchmark, section):
+    """Benchmark the moment curvature for a skew neutral axis."""
+    calc = section.section_calculator
+    n = 0.3 * calc.n_min
+    benchmark.pedantic(
+        calc.calculate_moment_curvature,
+        kwargs={'theta': np.pi / 6, 'n': n},
+        rounds=DOMAIN_ROUNDS,
+    )
+
+
+def test_nm_interaction_domain(benchmark, section):
+    """Benchmark the NM interaction domain."""
+    calc = section.section_calculator
+    benchmark.pedantic(
+        calc.calculate_nm_interaction_domain,
+        kwargs={'theta': np.pi / 6},
+        rounds=DOMAIN_ROUNDS,
+    )
+
+
+def test_nmm_interaction_domain(benchmark, section):
+    """Benchmark the NMM interaction domain."""
+    calc = section.section_calculator
+    benchmark.pedantic(
+        calc.calculate_nmm_interaction_domain,
+        kwargs={'num_theta': 16},
+        rounds=DOMAIN_ROUNDS,
+    )
+
+
+def test_mm_interaction_domain(benchmark, section):
+    """Benchmark the MM interaction domain."""
+    calc = section.section_calculator
+    n = 0.3 * calc.n_min
+    benchmark.pedantic(
+        calc.calculate_mm_interaction_domain,
+        kwargs={'n': n, 'num_theta': 16},
+        rounds=DOMAIN_ROUNDS,
+    )
@@ -0,0 +1,51 @@
+"""Deterministic fingerprints of objects."""
+
+from __future__ import annotations
+
+import hashlib
+import typing as t
+
+import numpy as np
+
+
+def _update_hash(h: t.Any, value: t.Any) -> None:
+    """Updates a hash object with a value."""
+    if hasattr(value, 'fingerprint') and not isinstance(value, type):
+        h.update(value.fingerprint().encode())
+    elif isinstance(value, np.ndarray):
+        h.update(str((value.dtype.str, value.shape)).encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, bytes):
+        h.update(value)
+    elif isinstance(value, (list, tuple)):
+        h.update(f'{type(value).__name__}{len(value)}'.encode())
+        for v in value:
+            _update_hash(h, v)
+    elif isinstance(value, dict):
+        _update_hash(h, sorted(value.items()))
+    elif isinstance(value, (bool, np.bool_)):
+        h.update(f'bool:{bool(value)}'.encode())
+    elif isinstance(value, (int, float, np.integer, np.floating)):
+        # Equal numbers give the same fingerprint whatever their type
+        h.update(f'float:{float(value)!r}'.encode())
+    else:
+        h.update(f'{type(value).__name__}:{value!r}'.encode())
+
+
+def fingerprint(*values: t.Any) -> str:
+    """Returns a deterministic fingerprint of a set of values.
+
+    The fingerprint is a SHA-256 digest, stable across runs and processes.
+    Objects with a fingerprint method contribute with their own fingerprint,
+    numpy arrays with their data, lists, tuples and dicts with their items,
+    numbers with their value as float and other values with their repr.
+
+    Arguments:
+        values (Any): The values.
+
+    Returns:
+        str: The hexadecimal fingerprint.
+    """
+    h = hashlib.sha256()
+    _update_hash(h, values)
+    return h.hexdigest()
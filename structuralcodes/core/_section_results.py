@@ -2,9 +2,12 @@
 
 from __future__ import annotations  # To have clean hints of ArrayLike in docs
 
+import typing as t
 from dataclasses import dataclass, field, fields
 
+import numpy as np
 from numpy.typing import ArrayLike
+from scipy.spatial import ConvexHull
 
 
 @dataclass
@@ -159,6 +162,42 @@ class MomentCurvatureResults:
     # The stresses can be recomputed if needed on the fly? Or storing them?
 
 
+@dataclass
+class MomentCurvatureFamilyResults:
+    """Class for storing the moment curvature results for several axial
+    loads and a given inclination of n.a.
+
+    Each row of the arrays of curvatures, axial strains and moments is the
+    moment-curvature relation for an axial load. Rows of relations with
+    fewer points are padded with nan.
+    """
+
+    theta: float = 0  # the inclination of n.a.
+    n: ArrayLike = None  # the axial loads - mantained constant
+    chi_y: ArrayLike = None  # the curvatures
+    chi_z: ArrayLike = None  # the curvatures
+    eps_axial: ArrayLike = None  # the axial strains (at section 0,0)
+    m_y: ArrayLike = None  # the moments
+    m_z: ArrayLike = None  # the moments
+
+    def __len__(self) -> int:
+        """Returns the number of axial loads."""
+        return len(self.n)
+
+    def __getitem__(self, i: int) -> MomentCurvatureResults:
+        """Returns the moment-curvature relation for the i-th axial load."""
+        valid = ~np.isnan(self.chi_y[i])
+        return MomentCurvatureResults(
+            theta=self.theta,
+            n=self.n[i],
+            chi_y=self.chi_y[i][valid],
+            chi_z=self.chi_z[i][valid],
+            eps_axial=self.eps_axial[i][valid],
+            m_y=self.m_y[i][valid],
+            m_z=self.m_z[i][valid],
+        )
+
+
 @dataclass
 class UltimateBendingMomentResults:
     """Class for storing the ultimate bending moment computation for a given
@@ -174,6 +213,17 @@ class UltimateBendingMomentResults:
     eps_a: float = 0  # the axial strain at 0,0 corresponding to Mult
 
 
+@dataclass
+class UtilizationResults(UltimateBendingMomentResults):
+    """Class for storing the utilization of a section for a load case.
+
+    The ultimate forces and strain profile are the ones found along the ray
+    from the origin through the load point.
+    """
+
+    utilization: float = 0  # the ratio between the load and ultimate forces
+
+
 @dataclass
 class InteractionDomain:
     """Class for storing common data on all interaction domain results.
@@ -236,6 +286,84 @@ class InteractionDomain:
             return None
         return self.strains[:, 2]
 
+    def _project(self, forces: np.ndarray) -> np.ndarray:
+        """Project the forces (N, My, Mz) in the space of the domain."""
+        return forces
+
+    def _get_facets(self) -> t.Tuple[np.ndarray, np.ndarray]:
+        """Return the facets of the convex hull of the domain.
+
+        The hull is computed in coordinates scaled with the maximum absolute
+        value of each component, and it is computed again only if the
+        forces are replaced.
+
+        Returns:
+            Tuple(ndarray, ndarray): The scale of the coordinates, and the
+            normals of the facets divided by their distance from the origin,
+            with shape (n_facets, n_dim).
+        """
+        cached = self.__dict__.get('_facets')
+        if cached is not None and cached[0] is self.forces:
+            return cached[1:]
+        points = self._project(np.asarray(self.forces, dtype=float))
+        scale = np.abs(points).max(axis=0)
+        scale[scale == 0] = 1.0
+        hull = ConvexHull(points / scale)
+        # Facets are given as normal * x + offset <= 0 with unit normals
+        normals, offsets = hull.equations[:, :-1], hull.equations[:, -1]
+        if np.any(offsets >= 0):
+            raise ValueError('The origin should be inside the domain')
+        facets = normals / -offsets[:, None]
+        self._facets = (self.forces, scale, facets)
+        return scale, facets
+
+    def get_utilization(
+        self, forces: ArrayLike, chunk_size: int = 4096
+    ) -> np.ndarray:
+        """Return the utilization ratios of a set of load points.
+
+        The utilization ratio is the ratio between the distance of the load
+        point from the origin and the distance of the boundary of the domain
+        along the same ray. The domain is represented by the convex hull of
+        its points, and the facet planes of the hull are computed once and
+        reused for all the load points.
+
+        Arguments:
+            forces (ArrayLike): The load points as an array with shape (k, 3)
+                where each row is given in the format (N, My, Mz).
+            chunk_size (int): The number of load points processed at once,
+                limiting the memory used (default = 4096).
+
+        Returns:
+            ndarray: The utilization ratios with shape (k,), less or equal
+            than one for the load points inside the domain.
+
+        Raises:
+            ValueError: If the origin is not strictly inside the domain.
+        """
+        forces = np.atleast_2d(np.asarray(forces, dtype=float))
+        scale, facets = self._get_facets()
+        points = self._project(forces) / scale
+        utilization = np.empty(len(points))
+        for i in range(0, len(points), chunk_size):
+            chunk = points[i : i + chunk_size]
+            # The ray t * p leaves the facet plane where t = 1 / (facet @ p)
+            utilization[i : i + chunk_size] = np.max(chunk @ facets.T, axis=1)
+        return np.maximum(utilization, 0.0)
+
+    def contains(self, forces: ArrayLike) -> np.ndarray:
+        """Check if a set of load points is inside the domain.
+
+        Arguments:
+            forces (ArrayLike): The load points as an array with shape (k, 3)
+                where each row is given in the format (N, My, Mz).
+
+        Returns:
+            ndarray: A boolean array with shape (k,), True for the load points
+            inside the domain.
+        """
+        return self.get_utilization(forces) <= 1.0
+
 
 @dataclass
 class NMMInteractionDomain(InteractionDomain):
@@ -245,17 +373,105 @@ class NMMInteractionDomain(InteractionDomain):
     num_axial: int = 0  # number of discretizations along axial load axis
 
 
+@dataclass
+class NMMInteractionDomainSlice:
+    """Class for storing the slice of the NMM interaction domain for an
+    inclination of n.a.
+
+    Attributes:
+        theta (float): The inclination of n.a.
+        strains (numpy.Array): A numpy array with shape (n, 3) containing ea,
+            ky and kz.
+        forces (numpy.Array): A numpy array with shape (n, 3) containing n, my
+            and mz.
+        field_num (numpy.Array): a numpy array with shape (n,) containing a
+            number between 1 and 6 indicating the failure field.
+    """
+
+    theta: float = 0  # the inclination of n.a.
+    strains: ArrayLike = None
+    forces: ArrayLike = None
+    field_num: ArrayLike = None
+
+
 @dataclass
 class NMInteractionDomain(InteractionDomain):
-    """Class for storing the NM interaction domain results."""
+    """Class for storing the NM interaction domain results.
+
+    The domain is checked in the plane of N and of the component of the
+    moment around the neutral axis.
+    """
 
     theta: float = 0  # the inclination of n.a.
     num_axial: float = 0  # number of discretizations along axial load axis
 
+    def _project(self, forces: np.ndarray) -> np.ndarray:
+        """Project the forces (N, My, Mz) in the plane of the domain."""
+        m = forces[:, 1] * np.cos(self.theta) + forces[:, 2] * np.sin(
+            self.theta
+        )
+        return np.column_stack((forces[:, 0], m))
+
+    def get_utilization(
+        self, forces: ArrayLike, chunk_size: int = 4096
+    ) -> np.ndarray:
+        """Return the utilization ratios of a set of load points.
+
+        The utilization ratio is the ratio between the distance of the load
+        point from the origin and the distance of the boundary of the domain
+        along the same ray. Since the domain for a given inclination of the
+        neutral axis covers only one side of the moment axis, the boundary
+        is the polyline joining the points of the domain.
+
+        Arguments:
+            forces (ArrayLike): The load points as an array with shape (k, 3)
+                where each row is given in the format (N, My, Mz).
+            chunk_size (int): The number of load points processed at once,
+                limiting the memory used (default = 4096).
+
+        Returns:
+            ndarray: The utilization ratios with shape (k,), less or equal
+            than one for the load points inside the domain. The ratio is nan
+            for the load points whose ray does not cross the domain, i.e.
+            that should be checked with the domain for theta + pi.
+        """
+        forces = np.atleast_2d(np.asarray(forces, dtype=float))
+        curve = self._project(np.asarray(self.forces, dtype=float))
+        scale = np.abs(curve).max(axis=0)
+        scale[scale == 0] = 1.0
+        curve = curve / scale
+        points = self._project(forces) / scale
+        # The segments of the boundary a + s * d, with 0 <= s <= 1
+        a, d = curve[:-1], np.diff(curve, axis=0)
+        utilization = np.full(len(points), np.nan)
+        for i in range(0, len(points), chunk_size):
+            p = points[i : i + chunk_size, None, :]
+            # The ray t * p crosses the segments where t * p = a + s * d
+            with np.errstate(divide='ignore', invalid='ignore'):
+                det = p[..., 0] * d[:, 1] - p[..., 1] * d[:, 0]
+                t = (a[:, 0] * d[:, 1] - a[:, 1] * d[:, 0]) / det
+                s = (a[:, 0] * p[..., 1] - a[:, 1] * p[..., 0]) / det
+                valid = (det != 0) & (t > 0) & (s >= 0) & (s <= 1)
+                inverse_t = np.where(valid, 1 / t, -np.inf).max(axis=1)
+            utilization[i : i + chunk_size] = np.where(
+                np.isfinite(inverse_t), inverse_t, np.nan
+            )
+        # The origin has zero utilization
+        utilization[~np.any(points, axis=1)] = 0.0
+        return utilization
+
 
 @dataclass
 class MMInteractionDomain(InteractionDomain):
-    """Class for storing the MM interaction domain results."""
+    """Class for storing the MM interaction domain results.
+
+    The domain is checked in the plane of My and Mz, the axial force of the
+    load points is not considered.
+    """
 
     num_theta: float = 0  # number of discretizations along the angle
     theta: ArrayLike = None  # Array with shape (n,) containing the angle of NA
+
+    def _project(self, forces: np.ndarray) -> np.ndarray:
+        """Project the forces (N, My, Mz) in the plane of the domain."""
+        return forces[:, 1:]
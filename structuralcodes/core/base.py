@@ -11,6 +11,8 @@ from numpy.typing import ArrayLike
 
 import structuralcodes.core._section_results as s_res
 
+from ._fingerprint import fingerprint
+
 
 class Material(abc.ABC):
     """Abstract base class for materials."""
@@ -70,6 +72,11 @@ class ConstitutiveLaw(abc.ABC):
 
     __materials__: t.Tuple[str] = ()
     constitutive_law_counter: t.ClassVar[int] = 0
+    # Attributes cached from the parameters of the law
+    _cached_attributes: t.ClassVar[t.Tuple[str]] = (
+        '_discretized_law',
+        '_fingerprint',
+    )
 
     def __init__(self, name: t.Optional[str] = None) -> None:
         """Initialize a ConstitutiveLaw object."""
@@ -82,6 +89,38 @@ class ConstitutiveLaw(abc.ABC):
         """Returns the name of the constitutive law."""
         return self._name
 
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        """Set an attribute dropping the cached discretization and
+        fingerprint of the law.
+        """
+        # Any change of the parameters invalidates the cached attributes
+        if name not in self._cached_attributes:
+            for cached in self._cached_attributes:
+                self.__dict__.pop(cached, None)
+        super().__setattr__(name, value)
+
+    def fingerprint(self) -> str:
+        """Returns a deterministic fingerprint of the constitutive law.
+
+        The fingerprint depends on the class and on the parameters of the law,
+        but not on its name. It is stable across runs, and it is cached until
+        an attribute of the law is changed.
+
+        Returns:
+            str: The hexadecimal fingerprint.
+        """
+        if '_fingerprint' not in self.__dict__:
+            parameters = {
+                name: value
+                for name, value in vars(self).items()
+                if name not in ('id', '_name', *self._cached_attributes)
+            }
+            cls = type(self)
+            self._fingerprint = fingerprint(
+                f'{cls.__module__}.{cls.__qualname__}', parameters
+            )
+        return self._fingerprint
+
     @classmethod
     def _increase_global_counter(cls):
         cls.constitutive_law_counter += 1
@@ -104,6 +143,25 @@ class ConstitutiveLaw(abc.ABC):
         ultimate strain (negative and positive).
         """
 
+    def get_breakpoints(self) -> np.ndarray:
+        """Return the strains where the constitutive law is not smooth.
+
+        By default these are the zero strain, the yielding strains and the
+        ultimate strains. Strains with an absolute value larger than one
+        are used as a placeholder for unlimited strains and are discarded.
+
+        Returns:
+            ndarray: The sorted strains.
+        """
+        eps = np.array(
+            (
+                0.0,
+                *self.get_ultimate_strain(),
+                *self.get_ultimate_strain(yielding=True),
+            )
+        )
+        return np.unique(eps[np.abs(eps) < 1])
+
     def preprocess_strains_with_limits(self, eps: ArrayLike) -> ArrayLike:
         """Preprocess strain arrays setting those strains sufficiently
         near to ultimate strain limits to exactly ultimate strain limit.
@@ -125,6 +183,20 @@ class ConstitutiveLaw(abc.ABC):
         By default the law is discretized as a piecewise linear
         function. Then marin coefficients are computed based on this
         discretization.
+
+        The discretization is computed once and cached, it is recomputed
+        only if an attribute of the law is changed.
+        """
+        if '_discretized_law' not in self.__dict__:
+            self._discretized_law = self._discretize_piecewise_linear()
+        # Return Marin coefficients for linearized version
+        return self._discretized_law.__marin__(**kwargs)
+
+    def _discretize_piecewise_linear(self) -> ConstitutiveLaw:
+        """Discretize the constitutive law as a piecewise linear function.
+
+        Returns:
+            UserDefined: The piecewise linear constitutive law.
         """
 
         # Discretize the constitutive law in a "smart way"
@@ -167,8 +239,7 @@ class ConstitutiveLaw(abc.ABC):
         sig = self.get_stress(eps)
         from structuralcodes.materials.constitutive_laws import UserDefined
 
-        # Return Marin coefficients for linearized version
-        return UserDefined(eps, sig).__marin__(**kwargs)
+        return UserDefined(eps, sig)
 
     def get_secant(self, eps: float) -> float:
         """Method to return the
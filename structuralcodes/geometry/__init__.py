@@ -4,15 +4,23 @@ from ._geometry import (
     CompoundGeometry,
     Geometry,
     PointGeometry,
+    PointGeometryArray,
     SurfaceGeometry,
     create_line_point_angle,
 )
-from ._reinforcement import add_reinforcement, add_reinforcement_line
+from ._reinforcement import (
+    add_reinforcement,
+    add_reinforcement_circle,
+    add_reinforcement_grid,
+    add_reinforcement_line,
+    add_reinforcement_lines,
+)
 from ._steel_sections import HE, IPE, IPN, UB, UBP, UC, UPN
 
 __all__ = [
     'Geometry',
     'PointGeometry',
+    'PointGeometryArray',
     'SurfaceGeometry',
     'CompoundGeometry',
     'create_line_point_angle',
@@ -25,4 +33,7 @@ __all__ = [
     'UPN',
     'add_reinforcement',
     'add_reinforcement_line',
+    'add_reinforcement_lines',
+    'add_reinforcement_grid',
+    'add_reinforcement_circle',
 ]
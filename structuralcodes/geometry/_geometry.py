@@ -18,6 +18,7 @@ from shapely.geometry import (
 )
 from shapely.ops import split
 
+from structuralcodes.core._fingerprint import fingerprint
 from structuralcodes.core.base import ConstitutiveLaw, Material
 from structuralcodes.materials.concrete import Concrete
 from structuralcodes.materials.constitutive_laws import Elastic
@@ -186,6 +187,24 @@ class PointGeometry(Geometry):
         """Returns the shapely Point object."""
         return self._point
 
+    def fingerprint(self) -> str:
+        """Returns a deterministic fingerprint of the geometry.
+
+        The fingerprint depends on the position, the diameter, the density
+        and the material of the point, but not on its name and group label.
+
+        Returns:
+            str: The hexadecimal fingerprint.
+        """
+        return fingerprint(
+            'PointGeometry',
+            self.x,
+            self.y,
+            self._diameter,
+            self._density,
+            self._material,
+        )
+
     def _repr_svg_(self) -> str:
         """Returns the svg representation."""
         return str(self._point._repr_svg_())
@@ -284,6 +303,325 @@ class PointGeometry(Geometry):
         )
 
 
+class PointGeometryArray(Geometry):
+    """Class for a group of point geometries stored as arrays.
+
+    It is the array counterpart of PointGeometry: coordinates, diameters and
+    the index of the material of each point are stored in contiguous numpy
+    arrays, so that strains and stresses can be evaluated for all the points
+    at once. It is useful for sections with many reinforcement bars.
+    """
+
+    def __init__(
+        self,
+        points: ArrayLike,
+        diameters: t.Union[float, ArrayLike],
+        materials: t.Union[
+            Material,
+            ConstitutiveLaw,
+            t.List[t.Union[Material, ConstitutiveLaw]],
+        ],
+        material_index: t.Optional[ArrayLike] = None,
+        density: t.Optional[float] = None,
+        name: t.Optional[str] = None,
+        group_label: t.Optional[str] = None,
+    ):
+        """Initializes a PointGeometryArray object.
+
+        Arguments:
+            points (ArrayLike): The coordinates of the points as an array with
+                shape (n, 2).
+            diameters (Union(float, ArrayLike)): The diameter of all the
+                points or an array with shape (n,) with the diameter of each
+                point.
+            materials (Union(Material, ConstitutiveLaw, List)): The material
+                of the points (this can be a Material or a ConstitutiveLaw) or
+                a list of materials.
+            material_index (Optional(ArrayLike)): An array with shape (n,)
+                with the index in materials of the material of each point. It
+                is needed only if more than one material is given.
+            density (Optional(float)): When a ConstitutiveLaw is passed as
+                material, the density can be providen by this argument. When
+                the material is a Material object the density is taken from the
+                material.
+            name (Optional(str)): The name to be given to the object.
+            group_label (Optional(str)): A label for grouping several objects
+                (default is None).
+        """
+        super().__init__(name, group_label)
+        coords = np.array(points, dtype=float).reshape(-1, 2)
+        n = coords.shape[0]
+        diameters = np.broadcast_to(
+            np.asarray(diameters, dtype=float), (n,)
+        ).copy()
+        if not isinstance(materials, (list, tuple)):
+            materials = [materials]
+        if material_index is None:
+            if len(materials) > 1:
+                raise ValueError(
+                    'material_index is needed when giving more materials'
+                )
+            material_index = np.zeros(n, dtype=int)
+        material_index = np.array(material_index, dtype=int).reshape(-1)
+        if len(material_index) != n:
+            raise ValueError(
+                'points and material_index should have the same length'
+            )
+        if n > 0 and (
+            material_index.min() < 0 or material_index.max() >= len(materials)
+        ):
+            raise ValueError('material_index out of range of materials')
+        # Pass constitutive laws to the PointGeometryArray
+        self._materials = []
+        self._densities = []
+        for material in materials:
+            if isinstance(material, Material):
+                self._materials.append(material.constitutive_law)
+                self._densities.append(material.density)
+            elif isinstance(material, ConstitutiveLaw):
+                self._materials.append(material)
+                self._densities.append(density)
+            else:
+                raise TypeError(
+                    f'mat should be a valid structuralcodes.base.Material \
+                    or structuralcodes.base.ConstitutiveLaw object. \
+                    {repr(material)}'
+                )
+
+        self._coords = coords
+        self._diameters = diameters
+        self._areas = np.pi * diameters**2 / 4.0
+        self._material_index = material_index
+        # The arrays are shared by the transformed copies, make them immutable
+        for arr in (
+            self._coords,
+            self._diameters,
+            self._areas,
+            self._material_index,
+        ):
+            arr.setflags(write=False)
+
+    def __len__(self) -> int:
+        """Returns the number of points."""
+        return self._coords.shape[0]
+
+    @property
+    def coords(self) -> np.ndarray:
+        """Returns the coordinates of the points with shape (n, 2)."""
+        return self._coords
+
+    @property
+    def x(self) -> np.ndarray:
+        """Returns the x coordinates of the points."""
+        return self._coords[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Returns the y coordinates of the points."""
+        return self._coords[:, 1]
+
+    @property
+    def diameters(self) -> np.ndarray:
+        """Returns the diameters of the points."""
+        return self._diameters
+
+    @property
+    def areas(self) -> np.ndarray:
+        """Returns the areas of the points."""
+        return self._areas
+
+    @property
+    def area(self) -> float:
+        """Returns the total area of the points."""
+        return float(np.sum(self._areas))
+
+    @property
+    def materials(self) -> t.List[ConstitutiveLaw]:
+        """Returns the materials of the points."""
+        return self._materials
+
+    @property
+    def material_index(self) -> np.ndarray:
+        """Returns the index of the material of each point."""
+        return self._material_index
+
+    @property
+    def densities(self) -> t.List[float]:
+        """Returns the density of each material."""
+        return self._densities
+
+    def groups(
+        self,
+    ) -> t.Iterator[t.Tuple[np.ndarray, np.ndarray, np.ndarray, t.Any]]:
+        """Iterates over the points grouped by material.
+
+        Yields:
+            Tuple(ndarray, ndarray, ndarray, ConstitutiveLaw):
+            x-coordinates, y-coordinates, areas and material of the points
+            with the same material.
+        """
+        for i, material in enumerate(self._materials):
+            idx = self._material_index == i
+            if not np.any(idx):
+                continue
+            yield self.x[idx], self.y[idx], self._areas[idx], material
+
+    def fingerprint(self) -> str:
+        """Returns a deterministic fingerprint of the geometry.
+
+        The fingerprint depends on the positions and the diameters of the
+        points and on their materials, but not on the name and group label.
+
+        Returns:
+            str: The hexadecimal fingerprint.
+        """
+        return fingerprint(
+            'PointGeometryArray',
+            self._coords,
+            self._diameters,
+            self._material_index,
+            self._densities,
+            self._materials,
+        )
+
+    def to_point_geometries(self) -> t.List[PointGeometry]:
+        """Returns the points as a list of PointGeometry objects."""
+        return [
+            PointGeometry(
+                point=Point(xy),
+                diameter=d,
+                material=self._materials[i],
+                density=self._densities[i],
+                group_label=self._group_label,
+            )
+            for xy, d, i in zip(
+                self._coords, self._diameters, self._material_index
+            )
+        ]
+
+    def _repr_svg_(self) -> str:
+        """Returns the svg representation."""
+        return str(
+            MultiPolygon(
+                [
+                    Point(xy).buffer(d / 2)
+                    for xy, d in zip(self._coords, self._diameters)
+                ]
+            )._repr_svg_()
+        )
+
+    def _with_coords(
+        self,
+        coords: ArrayLike,
+        materials: t.Optional[t.List[ConstitutiveLaw]] = None,
+    ) -> PointGeometryArray:
+        """Returns a new PointGeometryArray with the same properties and
+        different coordinates or materials.
+        """
+        new = PointGeometryArray.__new__(PointGeometryArray)
+        new._name = self._name
+        new._group_label = self._group_label
+        new._materials = list(
+            materials if materials is not None else self._materials
+        )
+        new._densities = list(self._densities)
+        new._coords = coords
+        new._coords.setflags(write=False)
+        new._diameters = self._diameters
+        new._areas = self._areas
+        new._material_index = self._material_index
+        return new
+
+    def translate(
+        self, dx: float = 0.0, dy: float = 0.0
+    ) -> PointGeometryArray:
+        """Returns a new PointGeometryArray that is translated by dx, dy.
+
+        Arguments:
+            dx (float): Translation in x direction.
+            dy (float): Translation in y direction.
+
+        Returns:
+            PointGeometryArray: A new, translated array of points.
+        """
+        return self._with_coords(self._coords + np.array([dx, dy]))
+
+    def rotate(
+        self,
+        angle: float = 0.0,
+        point: t.Union[t.Tuple[float, float], Point] = (0.0, 0.0),
+        use_radians: bool = True,
+    ) -> PointGeometryArray:
+        """Returns a new PointGeometryArray that is rotated by angle.
+
+        Arguments:
+            angle (float): Rotation angle in radians (if use_radians = True),
+                or degress (if use_radians = False).
+            point (Union(Point, Tuple(float, float))): The origin of the
+                rotation.
+            use_radians (bool): True if angle is in radians, and False if angle
+                is in degrees.
+
+        Returns:
+            PointGeometryArray: A new, rotated array of points.
+        """
+        if not use_radians:
+            angle = np.deg2rad(angle)
+        if isinstance(point, Point):
+            point = (point.x, point.y)
+        origin = np.array(point, dtype=float)
+        T = np.array(
+            [
+                [np.cos(angle), -np.sin(angle)],
+                [np.sin(angle), np.cos(angle)],
+            ]
+        )
+        return self._with_coords((self._coords - origin) @ T.T + origin)
+
+    @staticmethod
+    def from_geometry(
+        geo: PointGeometryArray,
+        new_material: t.Optional[t.Union[Material, ConstitutiveLaw]] = None,
+    ) -> PointGeometryArray:
+        """Create a new PointGeometryArray with a different material.
+
+        Arguments:
+            geo (PointGeometryArray): The geometry.
+            new_material (Optional(Union(Material, ConstitutiveLaw))): A new
+                material to be applied to all the points. If new_material is
+                None an Elastic material with same stiffness as the original
+                material is created for each material.
+
+        Returns:
+            PointGeometryArray: The new PointGeometryArray.
+
+        Note:
+            The arrays are not copied, but just referenced in the returned
+            PointGeometryArray object.
+        """
+        if not isinstance(geo, PointGeometryArray):
+            raise TypeError('geo should be a PointGeometryArray')
+        if new_material is not None:
+            # provided a new_material
+            if isinstance(new_material, Material):
+                new_material = new_material.constitutive_law
+            elif not isinstance(new_material, ConstitutiveLaw):
+                raise TypeError(
+                    f'new_material should be a valid structuralcodes.base.\
+                    Material or structuralcodes.base.ConstitutiveLaw object. \
+                    {repr(new_material)}'
+                )
+            materials = [new_material] * len(geo.materials)
+        else:
+            # new_material not provided, assume elastic material with same
+            # elastic modulus
+            materials = [
+                Elastic(E=material.get_tangent(eps=0)[0])
+                for material in geo.materials
+            ]
+        return geo._with_coords(geo.coords, materials)
+
+
 def create_line_point_angle(
     point: t.Union[Point, t.Tuple[float, float]],
     theta: float,
@@ -415,6 +753,22 @@ class SurfaceGeometry:
         """Returns the Shapely Polygon."""
         return self._polygon
 
+    def fingerprint(self) -> str:
+        """Returns a deterministic fingerprint of the geometry.
+
+        The fingerprint depends on the coordinates of the polygon and its
+        holes, on the density and on the material of the geometry.
+
+        Returns:
+            str: The hexadecimal fingerprint.
+        """
+        return fingerprint(
+            'SurfaceGeometry',
+            self._polygon.wkb,
+            self._density,
+            self._material,
+        )
+
     def calculate_extents(self) -> t.Tuple[float, float, float, float]:
         """Calculate extents of SurfaceGeometry.
 
@@ -666,11 +1020,14 @@ def _process_geometries_multipolygon(
 
 def _process_geometries_list(
     geometries: t.List[Geometry],
-) -> t.Tuple[list[SurfaceGeometry], list[PointGeometry]]:
+) -> t.Tuple[
+    list[SurfaceGeometry], list[PointGeometry], list[PointGeometryArray]
+]:
     """Process geometries for initialization."""
     # a list of SurfaceGeometry is provided
     checked_geometries = []
     checked_point_geometries = []
+    checked_point_geometry_arrays = []
     for geo in geometries:
         if isinstance(geo, SurfaceGeometry):
             checked_geometries.append(geo)
@@ -679,9 +1036,17 @@ def _process_geometries_list(
                 checked_geometries.append(g)
             for pg in geo.point_geometries:
                 checked_point_geometries.append(pg)
+            for pga in geo.point_geometry_arrays:
+                checked_point_geometry_arrays.append(pga)
         elif isinstance(geo, PointGeometry):
             checked_point_geometries.append(geo)
-    return (checked_geometries, checked_point_geometries)
+        elif isinstance(geo, PointGeometryArray):
+            checked_point_geometry_arrays.append(geo)
+    return (
+        checked_geometries,
+        checked_point_geometries,
+        checked_point_geometry_arrays,
+    )
 
 
 class CompoundGeometry(Geometry):
@@ -702,7 +1067,8 @@ class CompoundGeometry(Geometry):
 
         Arguments:
             geometries (Union(List(Geometry), MultiPolygon)): A list of
-                Geometry objects (i.e. PointGeometry or SurfaceGeometry) or a
+                Geometry objects (i.e. PointGeometry, PointGeometryArray or
+                SurfaceGeometry) or a
                 shapely MultiPolygon object (in this latter case also a list of
                 materials should be given).
             materials (Optional(List(Material), Material)): A material (applied
@@ -715,21 +1081,15 @@ class CompoundGeometry(Geometry):
                 geometries, materials
             )
             self.point_geometries = []
-            # useful for representation in svg
-            geoms_representation = [g.polygon for g in self.geometries]
-            self.geom = MultiPolygon(geoms_representation)
-            return
-        if isinstance(geometries, list):
-            self.geometries, self.point_geometries = _process_geometries_list(
-                geometries
-            )
-            # useful for representation in svg
-            geoms_representation = [g.polygon for g in self.geometries]
-            geoms_representation += [
-                pg.point.buffer(pg.diameter / 2)
-                for pg in self.point_geometries
-            ]
-            self.geom = MultiPolygon(geoms_representation)
+            self.point_geometry_arrays = []
+        elif isinstance(geometries, list):
+            (
+                self.geometries,
+                self.point_geometries,
+                self.point_geometry_arrays,
+            ) = _process_geometries_list(geometries)
+        # The representation in svg is computed only when needed
+        self._geom = None
         self._reinforced_concrete = None
 
     # we can add here static methods like
@@ -737,6 +1097,26 @@ class CompoundGeometry(Geometry):
     # from_ascii
     # ...
 
+    @property
+    def geom(self) -> MultiPolygon:
+        """Returns the MultiPolygon used for the representation in svg.
+
+        It is computed on first access and cached.
+        """
+        if self._geom is None:
+            geoms_representation = [g.polygon for g in self.geometries]
+            geoms_representation += [
+                pg.point.buffer(pg.diameter / 2)
+                for pg in self.point_geometries
+            ]
+            geoms_representation += [
+                Point(xy).buffer(d / 2)
+                for pga in self.point_geometry_arrays
+                for xy, d in zip(pga.coords, pga.diameters)
+            ]
+            self._geom = MultiPolygon(geoms_representation)
+        return self._geom
+
     def _repr_svg_(self) -> str:
         """Returns the svg representation."""
         return str(self.geom._repr_svg_())
@@ -752,6 +1132,22 @@ class CompoundGeometry(Geometry):
                     break
         return self._reinforced_concrete
 
+    def fingerprint(self) -> str:
+        """Returns a deterministic fingerprint of the geometry.
+
+        The fingerprint is computed from the fingerprints of all the surface
+        and point geometries, in the order they are stored.
+
+        Returns:
+            str: The hexadecimal fingerprint.
+        """
+        return fingerprint(
+            'CompoundGeometry',
+            self.geometries,
+            self.point_geometries,
+            self.point_geometry_arrays,
+        )
+
     @property
     def area(self) -> float:
         """Return the area of the compound geometry."""
@@ -799,6 +1195,8 @@ class CompoundGeometry(Geometry):
             processed_geoms.append(g.translate(dx, dy))
         for pg in self.point_geometries:
             processed_geoms.append(pg.translate(dx, dy))
+        for pga in self.point_geometry_arrays:
+            processed_geoms.append(pga.translate(dx, dy))
         return CompoundGeometry(geometries=processed_geoms)
 
     def rotate(
@@ -825,6 +1223,8 @@ class CompoundGeometry(Geometry):
             processed_geoms.append(g.rotate(angle, point, use_radians))
         for pg in self.point_geometries:
             processed_geoms.append(pg.rotate(angle, point, use_radians))
+        for pga in self.point_geometry_arrays:
+            processed_geoms.append(pga.rotate(angle, point, use_radians))
         return CompoundGeometry(geometries=processed_geoms)
 
     def __add__(self, other: Geometry) -> CompoundGeometry:
@@ -848,7 +1248,7 @@ class CompoundGeometry(Geometry):
             CompoundGeometry: A new CompoundGeometry.
         """
         # if we subtract a point from a surface we obtain the same surface
-        if isinstance(other, PointGeometry):
+        if isinstance(other, (PointGeometry, PointGeometryArray)):
             return self
         # Otherwise perform subtraction
         processed_geoms = []
@@ -856,6 +1256,8 @@ class CompoundGeometry(Geometry):
             processed_geoms.append(g - other)
         for pg in self.point_geometries:
             processed_geoms.append(pg)
+        for pga in self.point_geometry_arrays:
+            processed_geoms.append(pga)
         return CompoundGeometry(geometries=processed_geoms)
 
     @staticmethod
@@ -886,4 +1288,10 @@ class CompoundGeometry(Geometry):
             processed_geoms.append(
                 PointGeometry.from_geometry(geo=pg, new_material=new_material)
             )
+        for pga in geo.point_geometry_arrays:
+            processed_geoms.append(
+                PointGeometryArray.from_geometry(
+                    geo=pga, new_material=new_material
+                )
+            )
         return CompoundGeometry(geometries=processed_geoms)
@@ -1,14 +1,19 @@
 """Functions related to reinforcement definition."""
 
+from __future__ import annotations  # To have clean hints of ArrayLike in docs
+
 import typing as t
+from math import floor
 
 import numpy as np
+from numpy.typing import ArrayLike
 from shapely import Point
 
 from structuralcodes.core.base import ConstitutiveLaw, Material
 from structuralcodes.geometry import (
     CompoundGeometry,
     PointGeometry,
+    PointGeometryArray,
     SurfaceGeometry,
 )
 
@@ -74,10 +79,31 @@ def add_reinforcement_line(
         CompoundGeometry: A compound geometry with the original geometry and
         the reinforcement.
     """
-    from math import floor
+    coords = _get_line_coordinates(
+        coords_i, coords_j, n=n, s=s, first=first, last=last
+    )
+    # add the bars constructing the compound geometry only once
+    bars = [PointGeometry(Point(xy), diameter, material) for xy in coords]
+    return CompoundGeometry([geo] + bars)
+
 
-    p1 = np.array(coords_i)
-    p2 = np.array(coords_j)
+def _get_line_coordinates(
+    coords_i: t.Tuple[float, float],
+    coords_j: t.Tuple[float, float],
+    n: int = 0,
+    s: float = 0.0,
+    first: bool = True,
+    last: bool = True,
+) -> np.ndarray:
+    """Returns the coordinates of the bars distributed in a line.
+
+    See add_reinforcement_line for the meaning of the arguments.
+
+    Returns:
+        ndarray: The coordinates of the bars with shape (n, 2).
+    """
+    p1 = np.array(coords_i, dtype=float)
+    p2 = np.array(coords_j, dtype=float)
     distance = np.linalg.norm(p2 - p1)
     v = (p2 - p1) / distance
     if n > 0 and s > 0:
@@ -102,14 +128,163 @@ def add_reinforcement_line(
         p1 = p1 + v * (distance - d) / 2.0
     else:
         raise ValueError('At least n or s should be provided')
-    # add the bars
-    for i in range(n):
-        if i == 0 and not first:
-            continue
-        if i == n - 1 and not last:
-            continue
-        coords = p1 + v * s * i
-        geo = add_reinforcement(
-            geo, (coords[0], coords[1]), diameter, material
+    # the positions of the bars along the line
+    i = np.arange(n)
+    if not first:
+        i = i[i != 0]
+    if not last:
+        i = i[i != n - 1]
+    return p1 + np.outer(i * s, v)
+
+
+def add_reinforcement_lines(
+    geo: t.Union[SurfaceGeometry, CompoundGeometry],
+    coords_i: ArrayLike,
+    coords_j: ArrayLike,
+    diameter: float,
+    material: t.Union[Material, ConstitutiveLaw],
+    n: int = 0,
+    s: float = 0.0,
+    first: bool = True,
+    last: bool = True,
+) -> CompoundGeometry:
+    """Adds sets of bars distributed in several lines.
+
+    All the bars are stored in a single PointGeometryArray.
+
+    Arguments:
+        geo (Union(SurfaceGeometry, CompoundGeometry)): The geometry used as
+            input.
+        coords_i (ArrayLike): Coordinates of the initial points of the lines
+            with shape (k, 2).
+        coords_j (ArrayLike): Coordinates of the final points of the lines
+            with shape (k, 2).
+        diameter (float): The diameter of the bars.
+        material (Union(Material, ConstitutiveLaw)): A valid material or
+            constitutive law.
+        n (int): The number of bars to be distributed inside each line
+            (default = 0).
+        s (float): The distance between the bars (default = 0).
+        first (bool): Boolean indicating if placing the first bar of each line
+            (default = True).
+        last (bool): Boolean indicating if placing the last bar of each line
+            (default = True).
+
+    Note:
+        At least n or s should be greater than zero.
+
+    Returns:
+        CompoundGeometry: A compound geometry with the original geometry and
+        the reinforcement.
+    """
+    coords_i = np.atleast_2d(coords_i)
+    coords_j = np.atleast_2d(coords_j)
+    if coords_i.shape != coords_j.shape:
+        raise ValueError('coords_i and coords_j should have the same shape')
+    coords = np.vstack(
+        [
+            _get_line_coordinates(p1, p2, n=n, s=s, first=first, last=last)
+            for p1, p2 in zip(coords_i, coords_j)
+        ]
+    )
+    bars = PointGeometryArray(coords, diameter, material)
+    return CompoundGeometry([geo, bars])
+
+
+def add_reinforcement_grid(
+    geo: t.Union[SurfaceGeometry, CompoundGeometry],
+    coords_i: t.Tuple[float, float],
+    coords_j: t.Tuple[float, float],
+    diameter: float,
+    material: t.Union[Material, ConstitutiveLaw],
+    n_x: int,
+    n_y: int,
+    perimeter: bool = False,
+) -> CompoundGeometry:
+    """Adds a set of bars distributed in a rectangular grid.
+
+    All the bars are stored in a single PointGeometryArray.
+
+    Arguments:
+        geo (Union(SurfaceGeometry, CompoundGeometry)): The geometry used as
+            input.
+        coords_i (Tuple(float, float)): Coordinates of a corner of the grid.
+        coords_j (Tuple(float, float)): Coordinates of the opposite corner of
+            the grid.
+        diameter (float): The diameter of the bars.
+        material (Union(Material, ConstitutiveLaw)): A valid material or
+            constitutive law.
+        n_x (int): The number of bars along x.
+        n_y (int): The number of bars along y.
+        perimeter (bool): If True the bars are placed only on the perimeter
+            of the grid (default = False).
+
+    Returns:
+        CompoundGeometry: A compound geometry with the original geometry and
+        the reinforcement.
+    """
+    if n_x < 1 or n_y < 1:
+        raise ValueError('At least one bar per direction should be provided')
+    x = np.linspace(coords_i[0], coords_j[0], n_x)
+    y = np.linspace(coords_i[1], coords_j[1], n_y)
+    xx, yy = np.meshgrid(x, y)
+    if perimeter:
+        # Keep only the bars on the first and last rows and columns
+        ii, jj = np.meshgrid(np.arange(n_x), np.arange(n_y))
+        mask = (ii == 0) | (ii == n_x - 1) | (jj == 0) | (jj == n_y - 1)
+        xx, yy = xx[mask], yy[mask]
+    coords = np.column_stack((xx.ravel(), yy.ravel()))
+    bars = PointGeometryArray(coords, diameter, material)
+    return CompoundGeometry([geo, bars])
+
+
+def add_reinforcement_circle(
+    geo: t.Union[SurfaceGeometry, CompoundGeometry],
+    center: t.Tuple[float, float],
+    radius: float,
+    diameter: float,
+    material: t.Union[Material, ConstitutiveLaw],
+    n: int = 0,
+    s: float = 0.0,
+    first_angle: float = 0.0,
+) -> CompoundGeometry:
+    """Adds a set of bars distributed in a circle.
+
+    All the bars are stored in a single PointGeometryArray.
+
+    Arguments:
+        geo (Union(SurfaceGeometry, CompoundGeometry)): The geometry used as
+            input.
+        center (Tuple(float, float)): Coordinates of the center of the circle.
+        radius (float): The radius of the circle.
+        diameter (float): The diameter of the bars.
+        material (Union(Material, ConstitutiveLaw)): A valid material or
+            constitutive law.
+        n (int): The number of bars to be distributed in the circle (default
+            = 0).
+        s (float): The maximum distance between the bars along the circle
+            (default = 0). It is used only if n is not given.
+        first_angle (float): The angle in radians of the first bar (default =
+            0).
+
+    Note:
+        At least n or s should be greater than zero.
+
+    Returns:
+        CompoundGeometry: A compound geometry with the original geometry and
+        the reinforcement.
+    """
+    if n <= 0:
+        if s <= 0:
+            raise ValueError('At least n or s should be provided')
+        # Compute the number of bars
+        n = int(np.ceil(2 * np.pi * radius / s))
+    angles = first_angle + np.arange(n) * 2 * np.pi / n
+    coords = np.column_stack(
+        (
+            center[0] + radius * np.cos(angles),
+            center[1] + radius * np.sin(angles),
         )
-    return geo
+    )
+    bars = PointGeometryArray(coords, diameter, material)
+    return CompoundGeometry([geo, bars])
@@ -841,37 +841,23 @@ class UserDefined(ConstitutiveLaw):
             [(0, -0.002), (-0.002, -0.003)]
             [(a0, a1, a2), (a0)]
         """
-        strains = []
-        coeff = []
         if strain[1] == 0:
             # Uniform strain equal to strain[0]
             # understand in which branch are we
             strain[0] = self.preprocess_strains_with_limits(strain[0])[0]
-            found = False
-            for i in range(len(self._x) - 1):
-                if self._x[i] <= strain[0] and self._x[i + 1] >= strain[0]:
-                    strains = None
-                    stiffness = (self._y[i + 1] - self._y[i]) / (
-                        self._x[i + 1] - self._x[i]
-                    )
-                    a0 = stiffness * (strain[0] - self._x[i]) + self._y[i]
-                    a1 = stiffness * strain[1]
-                    coeff.append((a0, a1))
-                    found = True
-                    break
-            if not found:
-                strains = None
-                coeff.append((0.0,))
-        else:
-            for i in range(len(self._x) - 1):
-                # For each branch of the linear piecewise function
-                stiffness = (self._y[i + 1] - self._y[i]) / (
-                    self._x[i + 1] - self._x[i]
-                )
-                strains.append((self._x[i], self._x[i + 1]))
-                a0 = stiffness * (strain[0] - self._x[i]) + self._y[i]
-                a1 = stiffness * strain[1]
-                coeff.append((a0, a1))
+            if not self._x[0] <= strain[0] <= self._x[-1]:
+                return None, [(0.0,)]
+            # The first branch containing strain[0]
+            i = max(np.searchsorted(self._x, strain[0]) - 1, 0)
+            a0 = self._slopes[i] * (strain[0] - self._x[i]) + self._y[i]
+            a1 = self._slopes[i] * strain[1]
+            return None, [(a0, a1)]
+
+        # For each branch of the linear piecewise function
+        strains = list(zip(self._x[:-1], self._x[1:]))
+        a0 = self._slopes * (strain[0] - self._x[:-1]) + self._y[:-1]
+        a1 = self._slopes * strain[1]
+        coeff = list(zip(a0, a1))
 
         return strains, coeff
 
@@ -880,6 +866,14 @@ class UserDefined(ConstitutiveLaw):
         del kwargs
         return (self._ultimate_strain_n, self._ultimate_strain_p)
 
+    def get_breakpoints(self) -> np.ndarray:
+        """Return the strains where the constitutive law is not smooth,
+        i.e. the strains defining the piecewise linear curve and the
+        ultimate strains.
+        """
+        eps = np.concatenate((self._x, [0.0, *self.get_ultimate_strain()]))
+        return np.unique(eps)
+
     def set_ultimate_strain(
         self, eps_su=t.Union[float, t.Tuple[float, float]]
     ) -> None:
@@ -1,20 +1,29 @@
 """Main entry point for sections."""
 
+from ._cache import DomainStore, ResultCache
 from ._generic import GenericSection, GenericSectionCalculator
 from .section_integrators import (
+    FiberData,
     FiberIntegrator,
     MarinIntegrator,
+    PreparedSection,
     SectionIntegrator,
     integrator_factory,
     marin_integration,
+    marin_integration_moments,
 )
 
 __all__ = [
     'GenericSection',
     'GenericSectionCalculator',
+    'DomainStore',
+    'ResultCache',
     'SectionIntegrator',
+    'FiberData',
     'FiberIntegrator',
     'MarinIntegrator',
+    'PreparedSection',
     'integrator_factory',
     'marin_integration',
+    'marin_integration_moments',
 ]
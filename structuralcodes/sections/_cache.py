@@ -0,0 +1,288 @@
+"""A cache for the results of the section calculations."""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import functools
+import inspect
+import os
+import tempfile
+import threading
+import typing as t
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+import structuralcodes
+import structuralcodes.core._section_results as s_res
+from structuralcodes.core._fingerprint import fingerprint
+from structuralcodes.geometry import CompoundGeometry
+
+
+class ResultCache:
+    """A bounded cache of results, discarding the least recently used.
+
+    The cache can be shared by several section calculators, since the keys
+    include a fingerprint of the geometry and of the materials, and by
+    several threads, since it is guarded by a lock.
+
+    Attributes:
+        hits (int): The number of results found in the cache.
+        misses (int): The number of results not found in the cache.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """Initialize a ResultCache.
+
+        Arguments:
+            maxsize (int): The maximum number of results stored (default =
+                128).
+        """
+        if maxsize <= 0:
+            raise ValueError('maxsize should be a positive integer')
+        self._maxsize = maxsize
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self) -> t.Dict[str, t.Any]:
+        """Returns the state for pickling, without the lock."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: t.Dict[str, t.Any]) -> None:
+        """Restores the state after unpickling, with a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int:
+        """Returns the maximum number of results stored."""
+        return self._maxsize
+
+    def __len__(self) -> int:
+        """Returns the number of results stored."""
+        return len(self._results)
+
+    def __contains__(self, key: t.Hashable) -> bool:
+        """Returns True if a result is stored for the key."""
+        return key in self._results
+
+    def get(self, key: t.Hashable, default: t.Any = None) -> t.Any:
+        """Returns a copy of the result stored for the key.
+
+        Arguments:
+            key (Hashable): The key of the result.
+            default (Any): The value returned if the key is not found
+                (default = None).
+
+        Returns:
+            Any: A copy of the stored result, or the default value.
+        """
+        with self._lock:
+            if key not in self._results:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._results.move_to_end(key)
+            value = self._results[key]
+        # The stored results are never changed, copy them outside the lock
+        return copy.deepcopy(value)
+
+    def put(self, key: t.Hashable, value: t.Any) -> None:
+        """Stores a copy of a result, discarding the least recently used
+        result if the cache is full.
+
+        Arguments:
+            key (Hashable): The key of the result.
+            value (Any): The result.
+        """
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._results[key] = value
+            self._results.move_to_end(key)
+            while len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all the results and resets the statistics."""
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class DomainStore:
+    """A directory of interaction domains stored as .npz files.
+
+    Each domain is stored in a file named after a fingerprint of the key of
+    the calculation, i.e. of the section, of the settings of the calculator,
+    of the arguments of the calculation and of the version of the package.
+    The store can therefore be shared by several processes and reused
+    across runs.
+    """
+
+    def __init__(self, path: t.Union[str, os.PathLike]) -> None:
+        """Initialize a DomainStore.
+
+        Arguments:
+            path (Union(str, PathLike)): The directory of the store. It is
+                created if it does not exist.
+        """
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def path(self) -> Path:
+        """Returns the directory of the store."""
+        return self._path
+
+    def _file(self, key: t.Hashable) -> Path:
+        """Returns the file of the domain for a key."""
+        name = fingerprint(structuralcodes.__version__, key)
+        return self._path / f'{name}.npz'
+
+    def __len__(self) -> int:
+        """Returns the number of domains stored."""
+        return sum(1 for _ in self._path.glob('*.npz'))
+
+    def __contains__(self, key: t.Hashable) -> bool:
+        """Returns True if a domain is stored for the key."""
+        return self._file(key).exists()
+
+    def load(self, key: t.Hashable) -> t.Optional[s_res.InteractionDomain]:
+        """Loads the domain stored for a key.
+
+        Arguments:
+            key (Hashable): The key of the domain.
+
+        Returns:
+            Optional(InteractionDomain): The domain, or None if the key is not
+            found.
+        """
+        file = self._file(key)
+        if not file.exists():
+            return None
+        with np.load(file) as data:
+            cls = getattr(s_res, str(data['__class__']))
+            values = {
+                name: data[name] if data[name].ndim > 0 else data[name].item()
+                for name in data.files
+                if name != '__class__'
+            }
+        return cls(**values)
+
+    def save(self, key: t.Hashable, domain: s_res.InteractionDomain) -> None:
+        """Stores a domain.
+
+        The file is written atomically, so that the domain can be stored
+        while other processes are reading the store.
+
+        Arguments:
+            key (Hashable): The key of the domain.
+            domain (InteractionDomain): The domain.
+        """
+        values = {
+            f.name: getattr(domain, f.name)
+            for f in dataclasses.fields(domain)
+            if getattr(domain, f.name) is not None
+        }
+        with tempfile.NamedTemporaryFile(
+            dir=self._path, suffix='.tmp', delete=False
+        ) as f:
+            try:
+                np.savez(f, __class__=type(domain).__name__, **values)
+            except BaseException:
+                # Do not leave the partial file in the store
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, self._file(key))
+
+    def clear(self) -> None:
+        """Removes all the domains."""
+        for file in self._path.glob('*.npz'):
+            file.unlink()
+
+
+def _freeze(value: t.Any) -> t.Hashable:
+    """Returns a hashable representation of an argument."""
+    if isinstance(value, CompoundGeometry):
+        return value.fingerprint()
+    if isinstance(value, np.ndarray):
+        return (value.shape, tuple(value.ravel().tolist()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def cached_result(*ignored: str, persistent: bool = False) -> t.Callable:
+    """Decorator storing the results of a method of a section calculator in
+    its cache.
+
+    The key of a result is given by the name of the method, the fingerprint
+    of the section, the settings of the calculator and the arguments of the
+    call. The method is called as it is if the calculator has no cache, or
+    if it is called with a geometry other than the one of the section (e.g.
+    a rotated one), since fingerprinting that geometry would cost more than
+    most of the calculations on it.
+
+    Arguments:
+        ignored (str): The names of the arguments not affecting the result.
+        persistent (bool): If True the results are also looked for and
+            stored in the domain store of the calculator (default = False).
+    """
+
+    def decorator(method: t.Callable) -> t.Callable:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            store = self.store if persistent else None
+            if self.cache is None and store is None:
+                return method(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            values = {
+                name: value
+                for name, value in bound.arguments.items()
+                if name != 'self' and name not in ignored
+            }
+            if any(
+                isinstance(value, CompoundGeometry)
+                and value is not self.section.geometry
+                for value in values.values()
+            ):
+                return method(self, *args, **kwargs)
+            # The fingerprint of the section is memoized by the calculator
+            arguments = tuple(
+                (
+                    name,
+                    self._section_fingerprint()
+                    if value is self.section.geometry
+                    else _freeze(value),
+                )
+                for name, value in values.items()
+            )
+            key = (method.__name__, self._cache_key(), arguments)
+            if self.cache is not None:
+                result = self.cache.get(key)
+                if result is not None:
+                    return result
+            # Look for the result on disk before computing it
+            result = store.load(key) if store is not None else None
+            if result is None:
+                result = method(self, *args, **kwargs)
+                if store is not None:
+                    store.save(key, result)
+            if self.cache is not None:
+                self.cache.put(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -2,8 +2,13 @@
 
 from __future__ import annotations  # To have clean hints of ArrayLike in docs
 
+import collections
+import functools
+import itertools
+import os
 import typing as t
 import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor
 from math import cos, sin
 
 import numpy as np
@@ -15,12 +20,12 @@ import structuralcodes.core._section_results as s_res
 from structuralcodes.core.base import Section, SectionCalculator
 from structuralcodes.geometry import (
     CompoundGeometry,
-    PointGeometry,
     SurfaceGeometry,
 )
 from structuralcodes.materials.constitutive_laws import Elastic
 
-from .section_integrators import integrator_factory
+from ._cache import DomainStore, ResultCache, cached_result
+from .section_integrators import PreparedSection, integrator_factory
 
 
 class GenericSection(Section):
@@ -88,6 +93,9 @@ class GenericSectionCalculator(SectionCalculator):
         self,
         sec: GenericSection,
         integrator: t.Literal['marin', 'fiber'] = 'marin',
+        solver: t.Literal['bisection', 'newton'] = 'bisection',
+        cache: t.Optional[t.Union[int, ResultCache]] = None,
+        store: t.Optional[t.Union[str, os.PathLike, DomainStore]] = None,
         **kwargs,
     ) -> None:
         """Initialize the GenericSectionCalculator.
@@ -96,22 +104,72 @@ class GenericSectionCalculator(SectionCalculator):
             section (GenericSection): The section object.
             integrator (str): The SectionIntegrator to be used for computations
                 (default = 'marin').
+            solver (str): The algorithm used for finding the equilibrium of
+                axial forces. 'bisection' for the bisection algorithm or
+                'newton' for a Newton algorithm safeguarded with bisection
+                (default = 'bisection').
+            cache (Union(int, ResultCache)): The cache for the results of
+                bending strength, limit axial loads, balanced failure strains
+                and interaction domains. An integer gives the maximum size of
+                a new cache, a ResultCache can be shared by several
+                calculators (default = None, i.e. results are not cached).
+            store (Union(str, PathLike, DomainStore)): The directory of the
+                store of the interaction domains on disk, or a DomainStore.
+                The store is consulted before computing a domain, and the
+                computed domains are saved in it (default = None, i.e.
+                domains are not stored).
 
         Note:
             When using 'fiber' integrator the kwarg 'mesh_size' can be used to
             specify a dimensionless number (between 0 and 1) specifying the
-            size of the resulting mesh.
+            size of the resulting mesh, and the kwarg 'quadrature' can be used
+            to specify the number of integration points for each triangle (1,
+            3 or 7, default = 1). The kwarg 'refinement' can be used to
+            specify the number of subdivisions of the triangles where the
+            strain crosses a breakpoint of the constitutive law (e.g. the
+            yielding strain), refining the mesh only where needed for the
+            current strain profile (default = 0).
+
+            With the 'newton' solver the tangent stiffness of the section is
+            used when the integrator can compute it (e.g. 'fiber' integrator),
+            otherwise it is approximated with a secant.
         """
         super().__init__(section=sec)
         # Select the integrator if specified
         self.integrator = integrator_factory(integrator)()
+        # Select the solver used for finding equilibrium
+        if solver.lower() not in ('bisection', 'newton'):
+            raise ValueError(f'Unknown solver: {solver}')
+        self.solver = solver.lower()
+        # Cache for the results, opt-in
+        if isinstance(cache, int) and not isinstance(cache, bool):
+            cache = ResultCache(maxsize=cache)
+        self.cache = cache
+        # Store of the interaction domains on disk, opt-in
+        if store is not None and not isinstance(store, DomainStore):
+            store = DomainStore(store)
+        self.store = store
         # Mesh size used for Fibre integrator
         self.mesh_size = kwargs.get('mesh_size', 0.01)
-        # triangulated_data used for Fibre integrator
+        # Number of integration points per triangle used for Fibre integrator
+        self.quadrature = kwargs.get('quadrature', 1)
+        # Number of subdivisions of the fibers near the breakpoints of the
+        # constitutive laws used for Fibre integrator
+        self.refinement = kwargs.get('refinement', 0)
+        # triangulated_data used for Fibre integrator, or coordinates of the
+        # geometry used for Marin integrator: it is always stored in the
+        # section CRS and never rotated, the strain profiles are rotated
+        # instead
         self.triangulated_data = None
+        # The arrays describing the section geometry, shared by all the
+        # integrations
+        self.prepared_section = PreparedSection(self.section.geometry)
         # Maximum and minimum axial load
         self._n_max = None
         self._n_min = None
+        # Fingerprints of the materials and of the section, see
+        # _section_fingerprint
+        self._fingerprint = None
 
     def _calculate_gross_section_properties(self) -> s_res.GrossProperties:
         """Calculates the gross section properties of the GenericSection.
@@ -154,6 +212,17 @@ class GenericSectionCalculator(SectionCalculator):
                 # this assumes area in mm2 and density in kg/m3
                 gp.mass += geo.area * geo.density * 1e-9
 
+        for geo in self.section.geometry.point_geometry_arrays:
+            for i, (mat, density) in enumerate(
+                zip(geo.materials, geo.densities)
+            ):
+                area = np.sum(geo.areas[geo.material_index == i])
+                gp.ea += area * mat.get_tangent(eps=0)[0]
+                gp.area_reinforcement += area
+                if density is not None:
+                    # this assumes area in mm2 and density in kg/m3
+                    gp.mass += area * density * 1e-9
+
         # Computation of area moments
         #
         # Implementation idea:
@@ -190,6 +259,7 @@ class GenericSectionCalculator(SectionCalculator):
                 geometry,
                 [0, 1, 0],
                 mesh_size=self.mesh_size,
+                quadrature=self.quadrature,
             )
             # Change sign due to moment sign convention
             iyz *= -1
@@ -205,6 +275,7 @@ class GenericSectionCalculator(SectionCalculator):
                 [0, 0, -1],
                 tri=tri,
                 mesh_size=self.mesh_size,
+                quadrature=self.quadrature,
             )
             # Change sign due to moment sign convention
             izz *= -1
@@ -267,6 +338,49 @@ class GenericSectionCalculator(SectionCalculator):
 
         return gp
 
+    def _section_fingerprint(self) -> str:
+        """Returns the fingerprint of the section.
+
+        The fingerprint is memoized, and it is computed again only when the
+        parameters of a material change, since the geometry of the section is
+        not changed after the calculator is created (see prepared_section).
+        Checking the materials costs as much as the number of materials,
+        whatever the size of the section.
+        """
+        materials = tuple(
+            material.fingerprint()
+            for material in self.prepared_section.materials
+        )
+        if self._fingerprint is None or self._fingerprint[0] != materials:
+            self._fingerprint = (
+                materials,
+                self.section.geometry.fingerprint(),
+            )
+        return self._fingerprint[1]
+
+    def _cache_key(self) -> t.Tuple:
+        """Returns the part of the cache keys identifying the section and
+        the settings of the calculator.
+        """
+        return (
+            self._section_fingerprint(),
+            type(self.integrator).__name__,
+            self.solver,
+            self.mesh_size,
+            self.quadrature,
+            self.refinement,
+        )
+
+    def clear_cache(self) -> None:
+        """Removes all the results from the cache and the stored limit axial
+        loads.
+        """
+        if self.cache is not None:
+            self.cache.clear()
+        self._n_min = None
+        self._n_max = None
+
+    @cached_result()
     def get_balanced_failure_strain(
         self, geom: CompoundGeometry, yielding: bool = False
     ) -> t.Tuple[float, float, float]:
@@ -287,38 +401,61 @@ class GenericSectionCalculator(SectionCalculator):
             axial strain, curvature y*, curvature z* (assumed zero since in the
             rotated frame y*z* it is a case of uniaxial bending).
         """
-        chi_min = 1e10
-        for g in geom.geometries + geom.point_geometries:
-            for other_g in geom.geometries + geom.point_geometries:
-                # if g != other_g:
-                eps_p = g.material.get_ultimate_strain(yielding=yielding)[1]
-                if isinstance(g, SurfaceGeometry):
-                    y_p = g.polygon.bounds[1]
-                elif isinstance(g, PointGeometry):
-                    y_p = g._point.coords[0][1]
-                eps_n = other_g.material.get_ultimate_strain(
+        # Collect material, bottom and top ordinates of each geometry
+        materials, y_bottom, y_top = [], [], []
+        for g in geom.geometries:
+            materials.append(g.material)
+            y_bottom.append(g.polygon.bounds[1])
+            y_top.append(g.polygon.bounds[3])
+        for g in geom.point_geometries:
+            materials.append(g.material)
+            y_bottom.append(g._point.coords[0][1])
+            y_top.append(g._point.coords[0][1])
+        for pga in geom.point_geometry_arrays:
+            # For each material only the extreme points can govern
+            for _, y, _, mat in pga.groups():
+                materials.append(mat)
+                y_bottom.append(y.min())
+                y_top.append(y.max())
+        y_bottom, y_top = np.array(y_bottom), np.array(y_top)
+        # The ultimate strains are evaluated only once for each material
+        ultimate_strains = {}
+        for mat in materials:
+            if id(mat) not in ultimate_strains:
+                ultimate_strains[id(mat)] = mat.get_ultimate_strain(
                     yielding=yielding
-                )[0]
-                if isinstance(other_g, SurfaceGeometry):
-                    y_n = other_g.polygon.bounds[3]
-                elif isinstance(other_g, PointGeometry):
-                    y_n = other_g._point.coords[0][1]
-                if y_p >= y_n:
-                    continue
-                chi = -(eps_p - eps_n) / (y_p - y_n)
-                # print(y_p,eps_p,y_n,eps_n,chi)
-                if chi < chi_min:
-                    chi_min = chi
-                    eps_0 = eps_n + chi_min * y_n
-                    y_n_min = y_n
-                    y_p_min = y_p
-        y_p, y_n = y_p_min, y_n_min
+                )
+        eps_n, eps_p = np.array(
+            [ultimate_strains[id(mat)][:2] for mat in materials]
+        ).T
+        # Curvature of the strain profiles with the positive ultimate strain
+        # at the bottom of a part (rows) and the negative one at the top of
+        # another part above it (columns)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            chi = -(eps_p[:, None] - eps_n[None, :]) / (
+                y_bottom[:, None] - y_top[None, :]
+            )
+        chi[y_bottom[:, None] >= y_top[None, :]] = np.inf
+        # The first minimum in the order of the parts governs
+        i, j = np.unravel_index(np.argmin(chi), chi.shape)
+        chi_min = chi[i, j]
+        if not chi_min < 1e10:
+            raise ValueError(
+                'The strain profile corresponding to balanced failure could '
+                'not be found'
+            )
+        y_p, y_n = y_bottom[i], y_top[j]
+        eps_0 = eps_n[j] + chi_min * y_n
         # In standard CRS negative curvature stretches bottom fiber
         strain = [eps_0, -chi_min, 0]
         return (y_n, y_p, strain)
 
     def find_equilibrium_fixed_pivot(
-        self, geom: CompoundGeometry, n: float, yielding: bool = False
+        self,
+        geom: CompoundGeometry,
+        n: float,
+        yielding: bool = False,
+        theta: t.Optional[float] = None,
     ) -> t.Tuple[float, float, float]:
         """Find the equilibrium changing curvature fixed a pivot.
         The algorithm uses bisection algorithm between curvature
@@ -331,6 +468,11 @@ class GenericSectionCalculator(SectionCalculator):
                 system.
             n (float): Value of external axial force needed to be equilibrated.
             yielding (bool): ...
+            theta (Optional(float)): The angle such that geom is the section
+                geometry rotated of -theta. If given, the integration is
+                performed on the section in its own CRS reusing the stored
+                discretization, otherwise geom is integrated directly
+                (default = None).
 
         Returns:
             Tuple(float, float, float): 3 floats: Axial strain at (0,0), and
@@ -345,13 +487,8 @@ class GenericSectionCalculator(SectionCalculator):
         eps_p = strain[0] + strain[1] * y_p
         eps_n = strain[0] + strain[1] * y_n
         # Integrate this strain profile corresponding to balanced failure
-        (
-            n_int,
-            _,
-            _,
-            tri,
-        ) = self.integrator.integrate_strain_response_on_geometry(
-            geom, strain, tri=self.triangulated_data, mesh_size=self.mesh_size
+        n_int, _, _ = self._integrate_strain_profile_in_crs(
+            geom, strain, theta
         )
         # Check if there is equilibrium with this strain distribution
         chi_a = strain[1]
@@ -370,21 +507,32 @@ class GenericSectionCalculator(SectionCalculator):
             pivot = y_n
             strain_pivot = eps_n
         eps_0 = strain_pivot - chi_b * pivot
-        n_int, _, _, _ = self.integrator.integrate_strain_response_on_geometry(
-            geom, [eps_0, chi_b, 0], tri=self.triangulated_data
+        n_int, _, _ = self._integrate_strain_profile_in_crs(
+            geom, [eps_0, chi_b, 0], theta
         )
         dn_b = n_int - n
+        if self.solver == 'newton':
+            chi_c = _find_root_safeguarded_newton(
+                lambda chi: self._axial_unbalance(
+                    geom,
+                    [strain_pivot - chi * pivot, chi, 0],
+                    n,
+                    (-pivot, 1, 0),
+                    theta,
+                ),
+                chi_a,
+                dn_a,
+                chi_b,
+                dn_b,
+                itmax=ITMAX,
+            )
+            return [strain_pivot - chi_c * pivot, chi_c, 0]
         it = 0
         while (abs(dn_a - dn_b) > 1e-2) and (it < ITMAX):
             chi_c = (chi_a + chi_b) / 2.0
             eps_0 = strain_pivot - chi_c * pivot
-            (
-                n_int,
-                _,
-                _,
-                _,
-            ) = self.integrator.integrate_strain_response_on_geometry(
-                geom, [eps_0, chi_c, 0], tri=self.triangulated_data
+            n_int, _, _ = self._integrate_strain_profile_in_crs(
+                geom, [eps_0, chi_c, 0], theta
             )
             dn_c = n_int - n
             if dn_c * dn_a < 0:
@@ -398,9 +546,6 @@ class GenericSectionCalculator(SectionCalculator):
             s = f'Last iteration reached a unbalance of {dn_c}'
             raise ValueError(f'Maximum number of iterations reached.\n{s}')
         # Found equilibrium
-        # save the triangulation data
-        if self.triangulated_data is None:
-            self.triangulated_data = tri
         # Return the strain distribution
         return [eps_0, chi_c, 0]
 
@@ -411,27 +556,24 @@ class GenericSectionCalculator(SectionCalculator):
         curv: float,
         eps_0_a: float,
         dn_a: float,
+        theta: t.Optional[float] = None,
+        delta: float = 1e-3,
     ):
         """Perfind range where the curvature equilibrium is located.
 
         This algorithms quickly finds a position of NA that guaranteed the
         existence of at least one zero in the function dn vs. curv in order to
-        apply the bisection algorithm.
+        apply the bisection algorithm. The axial strain is moved by increasing
+        multiples of delta.
         """
         ITMAX = 20
         sign = -1 if dn_a > 0 else 1
         found = False
         it = 0
-        delta = 1e-3
         while not found and it < ITMAX:
             eps_0_b = eps_0_a + sign * delta * (it + 1)
-            (
-                n_int,
-                _,
-                _,
-                _,
-            ) = self.integrator.integrate_strain_response_on_geometry(
-                geom, [eps_0_b, curv, 0], tri=self.triangulated_data
+            n_int, _, _ = self._integrate_strain_profile_in_crs(
+                geom, [eps_0_b, curv, 0], theta
             )
             dn_b = n_int - n
             if dn_a * dn_b < 0:
@@ -449,7 +591,14 @@ class GenericSectionCalculator(SectionCalculator):
         return (eps_0_b, dn_b)
 
     def find_equilibrium_fixed_curvature(
-        self, geom: CompoundGeometry, n: float, curv: float, eps_0: float
+        self,
+        geom: CompoundGeometry,
+        n: float,
+        curv: float,
+        eps_0: float,
+        theta: t.Optional[float] = None,
+        delta: float = 1e-3,
+        solver: t.Optional[t.Literal['bisection', 'newton']] = None,
     ) -> t.Tuple[float, float, float]:
         """Find strain profile with equilibrium with fixed curvature.
 
@@ -461,6 +610,17 @@ class GenericSectionCalculator(SectionCalculator):
             n (float): The external axial load.
             curv (float): The value of curvature.
             eps_0 (float): A first attempt for neutral axis position.
+            theta (Optional(float)): The angle such that geom is the section
+                geometry rotated of -theta. If given, the integration is
+                performed on the section in its own CRS reusing the stored
+                discretization, otherwise geom is integrated directly
+                (default = None).
+            delta (float): The first increment of axial strain used to
+                bracket the equilibrium. A smaller value gives a narrower
+                bracket when eps_0 is a good first attempt (default = 1e-3).
+            solver (Optional(str)): The solver used once the equilibrium is
+                bracketed, 'bisection' or 'newton'. If None, the solver of
+                the calculator is used (default = None).
 
         Returns:
             Tuple(float, float, float): The axial strain and the two
@@ -472,35 +632,35 @@ class GenericSectionCalculator(SectionCalculator):
         # Start from previous position of N.A.
         eps_0_a = eps_0
         # find internal axial force by integration
-        (
-            n_int,
-            _,
-            _,
-            tri,
-        ) = self.integrator.integrate_strain_response_on_geometry(
-            geom, [eps_0, curv, 0], tri=self.triangulated_data
+        n_int, _, _ = self._integrate_strain_profile_in_crs(
+            geom, [eps_0, curv, 0], theta
         )
-        if self.triangulated_data is None:
-            self.triangulated_data = tri
         dn_a = n_int - n
         # It may occur that dn_a is already almost zero (in eqiulibrium)
         if abs(dn_a) <= 1e-2:
             # return the equilibrium position
             return [eps_0_a, curv, 0]
         eps_0_b, dn_b = self._prefind_range_curvature_equilibrium(
-            geom, n, curv, eps_0_a, dn_a
+            geom, n, curv, eps_0_a, dn_a, theta, delta
         )
+        if (solver or self.solver) == 'newton':
+            eps_0_c = _find_root_safeguarded_newton(
+                lambda eps_0: self._axial_unbalance(
+                    geom, [eps_0, curv, 0], n, (1, 0, 0), theta
+                ),
+                eps_0_a,
+                dn_a,
+                eps_0_b,
+                dn_b,
+                itmax=ITMAX,
+            )
+            return eps_0_c, curv, 0
         # Found a range within there is the solution, apply bisection
         it = 0
         while (abs(dn_a - dn_b) > 1e-2) and (it < ITMAX):
             eps_0_c = (eps_0_a + eps_0_b) / 2
-            (
-                n_int,
-                _,
-                _,
-                _,
-            ) = self.integrator.integrate_strain_response_on_geometry(
-                geom, [eps_0_c, curv, 0], tri=self.triangulated_data
+            n_int, _, _ = self._integrate_strain_profile_in_crs(
+                geom, [eps_0_c, curv, 0], theta
             )
             dn_c = n_int - n
             if dn_a * dn_c < 0:
@@ -516,6 +676,7 @@ class GenericSectionCalculator(SectionCalculator):
             raise ValueError(f'Maximum number of iterations reached.\n{s}')
         return eps_0_c, curv, 0
 
+    @cached_result()
     def calculate_limit_axial_load(self):
         """Compute maximum and minimum axial load.
 
@@ -534,11 +695,17 @@ class GenericSectionCalculator(SectionCalculator):
                 self.section.geometry,
                 [eps_n, 0, 0],
                 tri=self.triangulated_data,
+                prepared=self.prepared_section,
                 mesh_size=self.mesh_size,
+                quadrature=self.quadrature,
+                refinement=self.refinement,
             )
         )
         n_max, _, _, _ = self.integrator.integrate_strain_response_on_geometry(
-            self.section.geometry, [eps_p, 0, 0], tri=tri
+            self.section.geometry,
+            [eps_p, 0, 0],
+            tri=tri,
+            prepared=self.prepared_section,
         )
 
         if self.triangulated_data is None:
@@ -570,17 +737,220 @@ class GenericSectionCalculator(SectionCalculator):
             error_str += f'n_min = {self.n_min} / n_max = {self.n_max}'
             raise ValueError(error_str)
 
-    def _rotate_triangulated_data(self, theta: float):
-        """Rotate triangulated data of angle theta."""
-        rotated_triangulated_data = []
-        for tr in self.triangulated_data:
+    def _integration_data(self, geom: CompoundGeometry) -> t.Dict:
+        """Return the stored integration data valid for a geometry.
+
+        The triangulated data and the prepared section are those of the
+        section geometry, and are not given for any other geometry.
+
+        Arguments:
+            geom (CompoundGeometry): The geometry to integrate over.
+
+        Returns:
+            Dict: The keyword arguments tri and prepared for the integrator.
+        """
+        if geom is not self.section.geometry:
+            return {'tri': None, 'prepared': None}
+        return {
+            'tri': self.triangulated_data,
+            'prepared': self.prepared_section,
+        }
+
+    def _store_integration_data(
+        self,
+        geom: CompoundGeometry,
+        theta: t.Optional[float],
+        tri: t.Any,
+    ) -> None:
+        """Store the integration data returned by the integrator if it is the
+        one of the section geometry (see _integrate_strain_profile_in_crs).
+        """
+        if self.triangulated_data is None and (
+            theta is not None or geom is self.section.geometry
+        ):
+            self.triangulated_data = tri
+
+    def _integrate_strain_profile_in_crs(
+        self,
+        geom: CompoundGeometry,
+        strain: ArrayLike,
+        theta: t.Optional[float] = None,
+    ) -> t.Tuple[float, float, float]:
+        """Integrate a strain profile given in the CRS of a geometry.
+
+        Arguments:
+            geom (CompoundGeometry): The geometry, possibly rotated.
+            strain (ArrayLike): The strain profile (axial strain, curv_y,
+                curv_z) in the CRS of geom.
+            theta (Optional(float)): The angle such that geom is the section
+                geometry rotated of -theta. If given, the strain profile is
+                rotated back and integrated on the section in its own CRS, so
+                that the stored discretization is reused for any angle without
+                rotating it. If None, geom is integrated directly.
+
+        Returns:
+            Tuple(float, float, float): N, My and Mz in the CRS of geom.
+        """
+        if theta is None:
+            N, My, Mz, tri = (
+                self.integrator.integrate_strain_response_on_geometry(
+                    geo=geom,
+                    strain=strain,
+                    **self._integration_data(geom),
+                    mesh_size=self.mesh_size,
+                    quadrature=self.quadrature,
+                    refinement=self.refinement,
+                )
+            )
+        else:
+            T = np.array([[cos(theta), -sin(theta)], [sin(theta), cos(theta)]])
+            chi = T @ np.array([strain[1], strain[2]])
+            N, My, Mz, tri = (
+                self.integrator.integrate_strain_response_on_geometry(
+                    geo=self.section.geometry,
+                    strain=[strain[0], chi[0], chi[1]],
+                    tri=self.triangulated_data,
+                    prepared=self.prepared_section,
+                    mesh_size=self.mesh_size,
+                    quadrature=self.quadrature,
+                    refinement=self.refinement,
+                )
+            )
+            # Rotate the moments to the CRS of geom
+            My, Mz = T.T @ np.array([My, Mz])
+        self._store_integration_data(geom, theta, tri)
+        return N, My, Mz
+
+    def _integrate_strain_profiles_in_crs(
+        self,
+        geom: CompoundGeometry,
+        strains: ArrayLike,
+        theta: t.Optional[float] = None,
+    ) -> np.ndarray:
+        """Integrate a batch of strain profiles given in the CRS of a
+        geometry.
+
+        Arguments:
+            geom (CompoundGeometry): The geometry, possibly rotated.
+            strains (ArrayLike): The strain profiles as an array with shape
+                (k, 3), where each row is given in the format (ea, ky, kz) in
+                the CRS of geom.
+            theta (Optional(float)): The angle such that geom is the section
+                geometry rotated of -theta (see
+                _integrate_strain_profile_in_crs).
+
+        Returns:
+            ndarray: An array with shape (k, 3) collecting N, My and Mz in the
+            CRS of geom for each strain profile.
+        """
+        strains = np.atleast_2d(np.asarray(strains, dtype=float))
+        if theta is None:
+            forces, tri = self.integrator.integrate_strain_responses(
+                geo=geom,
+                strains=strains,
+                **self._integration_data(geom),
+                mesh_size=self.mesh_size,
+                quadrature=self.quadrature,
+                refinement=self.refinement,
+            )
+        else:
             T = np.array([[cos(theta), -sin(theta)], [sin(theta), cos(theta)]])
-            coords = np.vstack((tr[0], tr[1]))
-            coords_r = T @ coords
-            rotated_triangulated_data.append(
-                (coords_r[0, :], coords_r[1, :], tr[2], tr[3])
+            strains = strains.copy()
+            strains[:, 1:] = strains[:, 1:] @ T.T
+            forces, tri = self.integrator.integrate_strain_responses(
+                geo=self.section.geometry,
+                strains=strains,
+                tri=self.triangulated_data,
+                prepared=self.prepared_section,
+                mesh_size=self.mesh_size,
+                quadrature=self.quadrature,
+                refinement=self.refinement,
+            )
+            # Rotate the moments to the CRS of geom
+            forces[:, 1:] = forces[:, 1:] @ T
+        self._store_integration_data(geom, theta, tri)
+        return forces
+
+    def _integrate_tangent_in_crs(
+        self,
+        geom: CompoundGeometry,
+        strain: ArrayLike,
+        theta: t.Optional[float] = None,
+    ) -> t.Optional[np.ndarray]:
+        """Integrate the tangent stiffness for a strain profile given in the
+        CRS of a geometry.
+
+        Arguments:
+            geom (CompoundGeometry): The geometry, possibly rotated.
+            strain (ArrayLike): The strain profile (axial strain, curv_y,
+                curv_z) in the CRS of geom.
+            theta (Optional(float)): The angle such that geom is the section
+                geometry rotated of -theta (see
+                _integrate_strain_profile_in_crs).
+
+        Returns:
+            Optional(ndarray): The 3x3 tangent stiffness in the CRS of geom,
+            or None if the integrator cannot compute it.
+        """
+        if not hasattr(self.integrator, 'integrate_tangent_on_geometry'):
+            return None
+        if theta is None:
+            stiffness, _ = self.integrator.integrate_tangent_on_geometry(
+                geo=geom,
+                strain=strain,
+                **self._integration_data(geom),
+                mesh_size=self.mesh_size,
+                quadrature=self.quadrature,
+                refinement=self.refinement,
             )
-        self.triangulated_data = rotated_triangulated_data
+            return stiffness
+        T = np.array([[cos(theta), -sin(theta)], [sin(theta), cos(theta)]])
+        chi = T @ np.array([strain[1], strain[2]])
+        stiffness, _ = self.integrator.integrate_tangent_on_geometry(
+            geo=self.section.geometry,
+            strain=[strain[0], chi[0], chi[1]],
+            tri=self.triangulated_data,
+            prepared=self.prepared_section,
+            mesh_size=self.mesh_size,
+            quadrature=self.quadrature,
+            refinement=self.refinement,
+        )
+        # Transform the stiffness to the CRS of geom
+        A = np.eye(3)
+        A[1:, 1:] = T
+        return A.T @ stiffness @ A
+
+    def _axial_unbalance(
+        self,
+        geom: CompoundGeometry,
+        strain: ArrayLike,
+        n: float,
+        direction: ArrayLike,
+        theta: t.Optional[float] = None,
+    ) -> t.Tuple[float, t.Optional[float]]:
+        """Return the axial unbalance and its derivative.
+
+        Arguments:
+            geom (CompoundGeometry): The geometry, possibly rotated.
+            strain (ArrayLike): The strain profile in the CRS of geom.
+            n (float): The external axial force.
+            direction (ArrayLike): The derivative of the strain profile respect
+                to the unknown of the equilibrium problem.
+            theta (Optional(float)): The angle such that geom is the section
+                geometry rotated of -theta.
+
+        Returns:
+            Tuple(float, Optional(float)): The axial unbalance and its
+            derivative respect to the unknown, or None if the tangent
+            stiffness is not available.
+        """
+        n_int, _, _ = self._integrate_strain_profile_in_crs(
+            geom, strain, theta
+        )
+        stiffness = self._integrate_tangent_in_crs(geom, strain, theta)
+        if stiffness is None:
+            return n_int - n, None
+        return n_int - n, stiffness[0, :] @ np.asarray(direction)
 
     def integrate_strain_profile(
         self, strain: ArrayLike
@@ -599,16 +969,39 @@ class GenericSectionCalculator(SectionCalculator):
             geo=self.section.geometry,
             strain=strain,
             tri=self.triangulated_data,
+            prepared=self.prepared_section,
             mesh_size=self.mesh_size,
+            quadrature=self.quadrature,
+            refinement=self.refinement,
         )
         return N, My, Mz
 
+    @cached_result()
     def calculate_bending_strength(
         self, theta=0, n=0
     ) -> s_res.UltimateBendingMomentResults:
         """Calculates the bending strength for given inclination of n.a. and
         axial load.
 
+        Arguments:
+            theta (float): Inclination of n.a. respect to section y axis in
+                radians, default = 0.
+            n (float): Axial load applied to the section (+: tension, -:
+                compression), default = 0.
+
+        Returns:
+            UltimateBendingMomentResults: The results from the calculation.
+        """
+        return self._calculate_bending_strength(theta=theta, n=n)
+
+    def _calculate_bending_strength(
+        self, theta: float = 0, n: float = 0
+    ) -> s_res.UltimateBendingMomentResults:
+        """Calculates the bending strength without using the cache.
+
+        The other calculations use it for their trials, so that only the
+        results requested by the user are stored in the cache.
+
         Arguments:
             theta (float): Inclination of n.a. respect to section y axis in
                 radians, default = 0.
@@ -621,26 +1014,22 @@ class GenericSectionCalculator(SectionCalculator):
         # Compute the bending strength with the bisection algorithm
         # Rotate the section of angle theta
         rotated_geom = self.section.geometry.rotate(-theta)
-        if self.triangulated_data is not None:
-            # Rotate also triangulated data!
-            self._rotate_triangulated_data(-theta)
 
         # Check if the section can carry the axial load
         self.check_axial_load(n=n)
         # Find the strain distribution corresponding to failure and equilibrium
         # with external axial force
-        strain = self.find_equilibrium_fixed_pivot(rotated_geom, n)
+        strain = self.find_equilibrium_fixed_pivot(
+            rotated_geom, n, theta=theta
+        )
         # Compute the internal forces with this strain distribution
-        N, My, Mz, _ = self.integrator.integrate_strain_response_on_geometry(
-            geo=rotated_geom, strain=strain, tri=self.triangulated_data
+        N, My, Mz = self._integrate_strain_profile_in_crs(
+            rotated_geom, strain, theta
         )
 
         # Rotate back to section CRS TODO Check
         T = np.array([[cos(theta), -sin(theta)], [sin(theta), cos(theta)]])
         M = T @ np.array([[My], [Mz]])
-        if self.triangulated_data is not None:
-            # Rotate back also triangulated data!
-            self._rotate_triangulated_data(theta)
 
         # Create result object
         res = s_res.UltimateBendingMomentResults()
@@ -654,6 +1043,221 @@ class GenericSectionCalculator(SectionCalculator):
 
         return res
 
+    @cached_result()
+    def calculate_utilization(
+        self, n: float = 0, m_y: float = 0, m_z: float = 0
+    ) -> s_res.UtilizationResults:
+        """Calculates the utilization of the section for a load case.
+
+        The ultimate forces are searched directly along the ray from the
+        origin through the load point, without computing an interaction
+        domain. For an axial load lambda * n, the ultimate moment is found in
+        the direction of lambda * (m_y, m_z) as seen from a point of the
+        segment between the origin and the failure point with uniform strain,
+        which is inside the domain. The inclination of the n.a. is found with
+        the secant method, and the load factor lambda such that the load
+        point is on the boundary with a safeguarded secant method.
+
+        Arguments:
+            n (float): Axial load applied to the section (+: tension, -:
+                compression), default = 0.
+            m_y (float): Bending moment applied around y axis, default = 0.
+            m_z (float): Bending moment applied around z axis, default = 0.
+
+        Returns:
+            UtilizationResults: The results from the calculation, where the
+            utilization is the ratio between the load and the ultimate forces
+            along the ray.
+
+        Raises:
+            ValueError: If the maximum number of iterations is reached.
+        """
+        # Number of maximum iterations and relative tolerance
+        ITMAX = 100
+        TOL = 1e-6
+
+        if n == 0 and m_y == 0 and m_z == 0:
+            return s_res.UtilizationResults()
+
+        # Failure with uniform strain on the side of the axial load
+        pole = s_res.UltimateBendingMomentResults()
+        c = np.zeros(2)
+        if n != 0:
+            y_n, y_p, strain = self.get_balanced_failure_strain(
+                geom=self.section.geometry, yielding=False
+            )
+            pole.eps_a = strain[0] + strain[1] * (y_p if n > 0 else y_n)
+            pole.n, pole.m_y, pole.m_z = self.integrate_strain_profile(
+                [pole.eps_a, 0, 0]
+            )
+            # For an axial load lambda * n the point lambda * c lies on the
+            # segment between the origin and the pole
+            c = n / pole.n * np.array([pole.m_y, pole.m_z])
+        # Direction of the moment of the ray seen from lambda * c
+        d = np.array([m_y, m_z]) - c
+        beta = np.arctan2(d[1], d[0])
+
+        # The load factors and the inclinations of the n.a. already found,
+        # and the slope of the angle of the ultimate moment respect to the
+        # inclination of the n.a.
+        solved = []
+        slope = 1.0
+
+        def find_strength(lam):
+            # The first attempt of inclination of the n.a. is extrapolated
+            # from the last solutions found, or assumes the ultimate moment
+            # opposite to the inclination of the n.a. as in a symmetric
+            # section
+            nonlocal slope
+            theta = solved[-1][1] if solved else beta - np.pi
+            if len(solved) > 1:
+                (lam_0, theta_0), (lam_1, theta_1) = solved[-2:]
+                theta += (theta_1 - theta_0) / (lam_1 - lam_0) * (lam - lam_1)
+            strength, slope = self._find_bending_strength_direction(
+                n=lam * n,
+                center=lam * c,
+                beta=beta,
+                theta=theta,
+                slope=slope,
+                tol=TOL,
+                itmax=ITMAX,
+            )
+            solved.append((lam, strength.theta))
+            return strength
+
+        # The ultimate forces found for each load factor
+        ultimate = {}
+
+        def ray_unbalance(lam):
+            ultimate[lam] = find_strength(lam)
+            moment = np.array([ultimate[lam].m_y, ultimate[lam].m_z]) - lam * c
+            return np.hypot(*moment) - lam * np.hypot(*d), None
+
+        # The unbalance is positive at the origin
+        r_0, _ = ray_unbalance(0)
+        # First attempt of load factor assuming constant ultimate moments
+        lam = r_0 / np.hypot(*d) if d.any() else np.inf
+        if n != 0:
+            # At the pole the unbalance is negative
+            lam_a, r_a = 0, r_0
+            lam_b = pole.n / n
+            r_b = -lam_b * np.hypot(*d)
+            # Narrow the bracket with the first attempt and a secant step
+            lam_old, r_old = lam_a, r_a
+            for _ in range(2):
+                if not lam_a < lam < lam_b:
+                    break
+                r, _ = ray_unbalance(lam)
+                if r > 0:
+                    lam_a, r_a = lam, r
+                else:
+                    lam_b, r_b = lam, r
+                lam, lam_old, r_old = (
+                    lam - r * (lam - lam_old) / (r - r_old),
+                    lam,
+                    r,
+                )
+            lam = _find_root_safeguarded_newton(
+                ray_unbalance,
+                lam_a,
+                r_a,
+                lam_b,
+                r_b,
+                tol=TOL * r_0,
+                itmax=ITMAX,
+            )
+        if n == 0:
+            # The ultimate moments do not depend on the load factor
+            strength = ultimate[0]
+        elif lam == pole.n / n:
+            # The ray passes through the pole
+            strength = pole
+        else:
+            strength = ultimate[lam]
+
+        return s_res.UtilizationResults(
+            theta=strength.theta % (2 * np.pi),
+            n=strength.n,
+            m_y=strength.m_y,
+            m_z=strength.m_z,
+            chi_y=strength.chi_y,
+            chi_z=strength.chi_z,
+            eps_a=strength.eps_a,
+            utilization=1 / lam,
+        )
+
+    def _find_bending_strength_direction(
+        self,
+        n: float,
+        center: ArrayLike,
+        beta: float,
+        theta: float,
+        slope: float = 1.0,
+        tol: float = 1e-6,
+        itmax: int = 100,
+    ) -> t.Tuple[s_res.UltimateBendingMomentResults, float]:
+        """Find the ultimate moment in a direction seen from a center.
+
+        The inclination of the n.a. is stepped with the secant method until
+        it is found or bracketed, and then refined with a safeguarded secant
+        method.
+
+        Arguments:
+            n (float): Axial load applied to the section.
+            center (ArrayLike): The moments (m_y, m_z) of the center.
+            beta (float): The angle of the direction respect to the y axis.
+            theta (float): The first attempt of inclination of the n.a.
+            slope (float): The first attempt of slope of the angle of the
+                ultimate moment respect to the inclination of the n.a.
+                (default = 1.0).
+            tol (float): Tolerance on the angle (default = 1e-6).
+            itmax (int): Maximum number of iterations (default = 100).
+
+        Returns:
+            Tuple(UltimateBendingMomentResults, float): The ultimate moment
+            and the last slope found.
+
+        Raises:
+            ValueError: If the maximum number of iterations is reached.
+        """
+        strengths = {}
+
+        def angle_unbalance(theta):
+            strengths[theta] = self._calculate_bending_strength(
+                theta=theta, n=n
+            )
+            moment = (
+                np.array([strengths[theta].m_y, strengths[theta].m_z]) - center
+            )
+            angle = np.arctan2(moment[1], moment[0]) - beta
+            return (angle + np.pi) % (2 * np.pi) - np.pi, None
+
+        theta_a = theta_b = theta
+        f_a, _ = angle_unbalance(theta_a)
+        f_b = f_a
+        it = 0
+        while abs(f_b) > tol and (f_a * f_b > 0 or theta_a == theta_b):
+            if it >= itmax:
+                s = f'Last iteration reached an unbalance of {f_b}'
+                raise ValueError(f'Maximum number of iterations reached.\n{s}')
+            if theta_a != theta_b and f_a != f_b:
+                slope = max((f_b - f_a) / (theta_b - theta_a), 0.1)
+            theta_a, f_a = theta_b, f_b
+            theta_b += np.clip(-f_b / slope, -np.pi / 4, np.pi / 4)
+            f_b, _ = angle_unbalance(theta_b)
+            it += 1
+        if abs(f_b) > tol:
+            theta_b = _find_root_safeguarded_newton(
+                angle_unbalance,
+                theta_a,
+                f_a,
+                theta_b,
+                f_b,
+                tol=tol,
+                itmax=itmax,
+            )
+        return strengths[theta_b], slope
+
     def calculate_moment_curvature(
         self,
         theta: float = 0.0,
@@ -662,10 +1266,15 @@ class GenericSectionCalculator(SectionCalculator):
         num_pre_yield: int = 10,
         num_post_yield: int = 10,
         chi: t.Optional[ArrayLike] = None,
+        adaptive: bool = False,
     ) -> s_res.MomentCurvatureResults:
         """Calculates the moment-curvature relation for given inclination of
         n.a. and axial load.
 
+        The axial strain of each point is predicted extrapolating the last
+        two points found, or with the tangent stiffness if available, and it
+        is corrected searching the equilibrium close to the prediction.
+
         Arguments:
             theta (float): Inclination of n.a. respect to y axis in radians,
                 default = 0.
@@ -684,6 +1293,13 @@ class GenericSectionCalculator(SectionCalculator):
                 If chi is not None, chi_first, num_pre_yield and num_post_yield
                 are disregarded, and the provided chi is used directly in the
                 calculations.
+            adaptive (bool): If True and chi is None, the steps of curvature
+                before and after yielding start from the ones given by
+                num_pre_yield and num_post_yield, and they are reduced where
+                the moment-curvature relation bends (e.g. at cracking,
+                yielding or softening) and enlarged where it is straight.
+                The yield curvature is still part of the result array, but
+                not at a given position, default = False.
 
         Returns:
             MomentCurvatureResults: The calculation results.
@@ -693,30 +1309,35 @@ class GenericSectionCalculator(SectionCalculator):
         res.n = n
         # Rotate the section of angle theta
         rotated_geom = self.section.geometry.rotate(-theta)
-        if self.triangulated_data is not None:
-            # Rotate also triangulated data!
-            self._rotate_triangulated_data(-theta)
 
         # Check if the section can carry the axial load
         self.check_axial_load(n=n)
 
+        # The curvatures that must be part of the results, and the steps of
+        # curvature between them if adaptive
+        steps = None
         if chi is None:
             # Find ultimate curvature from the strain distribution
             # corresponding to failure and equilibrium with external axial
             # force
-            strain = self.find_equilibrium_fixed_pivot(rotated_geom, n)
-            chi_ultimate = strain[1]
+            strain_ultimate = self.find_equilibrium_fixed_pivot(
+                rotated_geom, n, theta=theta
+            )
+            chi_ultimate = strain_ultimate[1]
             # Find the yielding curvature
-            strain = self.find_equilibrium_fixed_pivot(
-                rotated_geom, n, yielding=True
+            strain_yield = self.find_equilibrium_fixed_pivot(
+                rotated_geom, n, yielding=True, theta=theta
             )
-            chi_yield = strain[1]
+            chi_yield = strain_yield[1]
             if chi_ultimate * chi_yield < 0:
                 # They cannot have opposite signs!
                 raise ValueError(
                     'curvature at yield and ultimate cannot have opposite '
                     'signs!'
                 )
+            # The equilibrium at yielding and at failure is known, it helps
+            # predicting the points before them if adaptive
+            known = {chi_yield: strain_yield, chi_ultimate: strain_ultimate}
 
             # Make sure the sign of the first curvature matches the sign of the
             # yield curvature
@@ -731,6 +1352,8 @@ class GenericSectionCalculator(SectionCalculator):
                 # We don't want a plastic branch in the analysis
                 # this is done to speed up analysis
                 chi = np.linspace(chi_first, chi_yield, num_pre_yield)
+                steps = [(chi_yield - chi_first) / (num_pre_yield - 1)]
+                targets = [chi_first, chi_yield]
             else:
                 chi = np.concatenate(
                     (
@@ -745,51 +1368,494 @@ class GenericSectionCalculator(SectionCalculator):
                         ),
                     )
                 )
+                steps = [
+                    (chi_yield - chi_first) / (num_pre_yield - 1),
+                    (chi_ultimate - chi_yield) / num_post_yield,
+                ]
+                targets = [chi_first, chi_yield, chi_ultimate]
+        if not adaptive or steps is None:
+            adaptive = False
+            targets = chi
+            steps = np.diff(chi)
+            known = None
+
+        # Find the strain profiles and the moments in the rotated CRS
+        chi, strains, moments = self._march_moment_curvature(
+            rotated_geom, n, targets, steps, adaptive, theta, known
+        )
+
+        # Rotate back to section CRS
+        T = np.array([[cos(theta), -sin(theta)], [sin(theta), cos(theta)]])
+        M = T @ moments.T
+        chi_mat = T @ np.vstack((chi, np.zeros_like(chi)))
+        res.chi_y = chi_mat[0]
+        res.chi_z = chi_mat[1]
+        res.eps_axial = strains[:, 0]
+        res.m_y = M[0]
+        res.m_z = M[1]
+
+        return res
 
-        # prepare results
-        eps_a = np.zeros_like(chi)
-        my = np.zeros_like(chi)
-        mz = np.zeros_like(chi)
-        chi_y = np.zeros_like(chi)
-        chi_z = np.zeros_like(chi)
-        # Previous position of strain at (0,0)
-        strain = [0, 0, 0]
-        # For each value of curvature
-        for i, curv in enumerate(chi):
-            # find the new position of neutral axis for mantaining equilibrium
-            # store the information in the results object for the current
-            # value of curvature
-            strain = self.find_equilibrium_fixed_curvature(
-                rotated_geom, n, curv, strain[0]
+    def _march_moment_curvature(
+        self,
+        geom: CompoundGeometry,
+        n: float,
+        targets: ArrayLike,
+        steps: ArrayLike,
+        adaptive: bool,
+        theta: float,
+        known: t.Optional[t.Dict[float, ArrayLike]] = None,
+    ) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find the points of a moment-curvature relation in sequence.
+
+        The axial strain of each point is predicted from the last points
+        found, or from the next target if its equilibrium is known, and
+        corrected with find_equilibrium_fixed_curvature, starting
+        from a bracket as wide as twice the last correction. Since the
+        prediction is close to the equilibrium, the correction uses the
+        Newton method safeguarded by bisection whatever the solver of the
+        calculator.
+
+        Arguments:
+            geom (CompoundGeometry): The section geometry rotated of -theta.
+            n (float): The external axial load.
+            targets (ArrayLike): The curvatures that are part of the results.
+            steps (ArrayLike): The first step of curvature between each pair
+                of consecutive targets.
+            adaptive (bool): If True, each step is scaled so that the next
+                point is at a given distance from the chord between the
+                adjacent ones, and the steps after the first target start
+                smaller. Otherwise the targets are the only points.
+            theta (float): The inclination of the n.a.
+            known (Optional(Dict(float, ArrayLike))): The strain profiles in
+                equilibrium already known for some of the targets, used for
+                predicting the axial strain of the points before them
+                (default = None).
+
+        Returns:
+            Tuple(ndarray, ndarray, ndarray): The curvatures, the strain
+            profiles and the moments (m_y, m_z) in the rotated CRS.
+        """
+        # The target distance of each point from the chord between the
+        # adjacent ones, respect to the maximum moment
+        TOL = 1e-2
+        # The limits of the steps respect to the first steps
+        STEP_MIN = 1 / 16
+        STEP_MAX = 8
+        # The limits of the scaling of a step, the steps grow fast where the
+        # relation is straight, e.g. in the elastic branch
+        SCALE_MIN = 0.25
+        SCALE_MAX = 4
+        # The scaling of the first step after yielding, where the relation
+        # bends the most
+        SCALE_YIELD = 0.25
+
+        def solve(curv, target):
+            eps_0 = self._predict_axial_strain(
+                geom, curv, chi, strains, known.get(target), target, theta
             )
-            (
-                _,
-                My,
-                Mz,
-                _,
-            ) = self.integrator.integrate_strain_response_on_geometry(
-                geo=rotated_geom, strain=strain, tri=self.triangulated_data
+            # Correct the prediction searching the equilibrium in a bracket
+            # as wide as twice the last correction, or as the increment
+            # predicted if not available
+            if corrections:
+                delta = 2 * corrections[-1]
+            else:
+                delta = abs(eps_0 - strains[-1][0]) if strains else 0
+            delta = min(max(delta, 1e-8), 1e-3) if delta else 1e-3
+            try:
+                strain = self.find_equilibrium_fixed_curvature(
+                    geom,
+                    n,
+                    curv,
+                    eps_0,
+                    theta=theta,
+                    delta=delta,
+                    solver='newton',
+                )
+            except ValueError:
+                # The prediction is far from the equilibrium, restart
+                # from the last point found
+                strain = self.find_equilibrium_fixed_curvature(
+                    geom,
+                    n,
+                    curv,
+                    strains[-1][0] if strains else 0,
+                    theta=theta,
+                    solver='newton',
+                )
+            if len(strains) > 1:
+                corrections.append(abs(strain[0] - eps_0))
+            _, m_y, m_z = self._integrate_strain_profile_in_crs(
+                geom, strain, theta
             )
-            # Rotate back to section CRS
-            T = np.array([[cos(theta), -sin(theta)], [sin(theta), cos(theta)]])
-            M = T @ np.array([[My], [Mz]])
-            eps_a[i] = strain[0]
-            my[i] = M[0, 0]
-            mz[i] = M[1, 0]
-            chi_mat = T @ np.array([[curv], [0]])
-            chi_y[i] = chi_mat[0, 0]
-            chi_z[i] = chi_mat[1, 0]
-
-        if self.triangulated_data is not None:
-            # Rotate back also triangulated data!
-            self._rotate_triangulated_data(theta)
-        res.chi_y = chi_y
-        res.chi_z = chi_z
-        res.eps_axial = eps_a
-        res.m_y = my
-        res.m_z = mz
+            return list(strain), (m_y, m_z)
+
+        known = known or {}
+        chi, strains, moments = [], [], []
+        # The corrections of the axial strain predicted
+        corrections = []
+        strain, moment = solve(targets[0], targets[0])
+        chi.append(targets[0])
+        strains.append(strain)
+        moments.append(moment)
+        for i, (target, step_first) in enumerate(zip(targets[1:], steps)):
+            # The points are closer after the first target, i.e. yielding
+            step = step_first * SCALE_YIELD if adaptive and i else step_first
+            while chi[-1] != target:
+                # Stop at the target without leaving a much smaller step
+                if not adaptive or abs(target - chi[-1]) < 1.25 * abs(step):
+                    step, curv = target - chi[-1], target
+                else:
+                    curv = chi[-1] + step
+                strain, moment = solve(curv, target)
+                if adaptive and len(chi) > 1:
+                    # Distance of the last point from the chord between the
+                    # previous one and the new one, respect to the maximum
+                    # moment. The point is kept anyway and only the next step
+                    # is scaled, so that no equilibrium is searched twice.
+                    (chi_0, chi_1), (m_0, m_1) = chi[-2:], moments[-2:]
+                    dist = abs(
+                        m_1[0]
+                        - m_0[0]
+                        - (moment[0] - m_0[0])
+                        * (chi_1 - chi_0)
+                        / (curv - chi_0)
+                    ) / max(np.abs(moments).max(), abs(moment[0]))
+                    scale = (
+                        min(max((TOL / dist) ** 0.5, SCALE_MIN), SCALE_MAX)
+                        if dist
+                        else SCALE_MAX
+                    )
+                    step = np.clip(
+                        abs(scale * step),
+                        STEP_MIN * abs(step_first),
+                        STEP_MAX * abs(step_first),
+                    ) * np.sign(step)
+                chi.append(curv)
+                strains.append(strain)
+                moments.append(moment)
+
+        return np.array(chi), np.array(strains), np.array(moments)
+
+    def _predict_axial_strain(
+        self,
+        geom: CompoundGeometry,
+        curv: float,
+        chi: t.List[float],
+        strains: t.List[ArrayLike],
+        strain_target: t.Optional[ArrayLike],
+        target: float,
+        theta: float,
+    ) -> float:
+        """Predict the axial strain of the next point of a moment-curvature
+        relation.
+
+        The axial strain is interpolated towards the target if its
+        equilibrium is known, otherwise it is extrapolated with the last two
+        points, or with the tangent stiffness after the first point.
 
-        return res
+        Arguments:
+            geom (CompoundGeometry): The section geometry rotated of -theta.
+            curv (float): The curvature of the next point.
+            chi (List(float)): The curvatures of the points found.
+            strains (List(ArrayLike)): The strain profiles of the points
+                found.
+            strain_target (Optional(ArrayLike)): The strain profile in
+                equilibrium at the target, if known.
+            target (float): The next target curvature.
+            theta (float): The inclination of the n.a.
+
+        Returns:
+            float: The axial strain predicted.
+        """
+        if not strains:
+            return 0
+        eps_0 = strains[-1][0]
+        if strain_target is not None and target != chi[-1]:
+            return eps_0 + (strain_target[0] - eps_0) / (target - chi[-1]) * (
+                curv - chi[-1]
+            )
+        if len(strains) > 1 and chi[-1] != chi[-2]:
+            return eps_0 + (strains[-1][0] - strains[-2][0]) / (
+                chi[-1] - chi[-2]
+            ) * (curv - chi[-1])
+        stiffness = self._integrate_tangent_in_crs(geom, strains[-1], theta)
+        if stiffness is not None and stiffness[0, 0] != 0:
+            eps_0 -= stiffness[0, 1] / stiffness[0, 0] * (curv - chi[-1])
+        return eps_0
+
+    def calculate_moment_curvature_family(
+        self,
+        n: ArrayLike,
+        theta: float = 0.0,
+        chi_first: float = 1e-8,
+        num_pre_yield: int = 10,
+        num_post_yield: int = 10,
+    ) -> s_res.MomentCurvatureFamilyResults:
+        """Calculates the moment-curvature relations for several axial loads
+        and given inclination of n.a.
+
+        The curvatures of each relation are defined as in
+        calculate_moment_curvature. The rotated geometry and the balanced
+        failure are shared by all the axial loads, and the equilibrium of all
+        the axial loads is found at once, integrating each batch of strain
+        profiles with a single call to the integrator.
+
+        Arguments:
+            n (ArrayLike): Axial loads applied to the section (+: tension, -:
+                compression).
+            theta (float): Inclination of n.a. respect to y axis in radians,
+                default = 0.
+            chi_first (float): The first value of the curvature, default =
+                1e-8.
+            num_pre_yield (int): Number of points before yielding, default =
+                10.
+            num_post_yield (int): Number of points after yielding, default =
+                10.
+
+        Returns:
+            MomentCurvatureFamilyResults: The calculation results, with a row
+            for each axial load.
+
+        Raises:
+            ValueError: If an axial load cannot be carried by the section.
+        """
+        n = np.atleast_1d(np.asarray(n, dtype=float))
+        # Rotate the section of angle theta
+        rotated_geom = self.section.geometry.rotate(-theta)
+
+        # Check if the section can carry the axial loads
+        for n_i in n:
+            self.check_axial_load(n=n_i)
+
+        # Find ultimate and yielding curvatures
+        chi_ultimate = self._find_equilibria_fixed_pivot(
+            rotated_geom, n, theta=theta
+        )[:, 1]
+        chi_yield = self._find_equilibria_fixed_pivot(
+            rotated_geom, n, yielding=True, theta=theta
+        )[:, 1]
+        if np.any(chi_ultimate * chi_yield < 0):
+            # They cannot have opposite signs!
+            raise ValueError(
+                'curvature at yield and ultimate cannot have opposite signs!'
+            )
+
+        # Make sure the sign of the first curvature matches the sign of the
+        # yield curvature, and that it is less than the yield curvature
+        chi_0 = np.where(chi_yield < 0, -abs(chi_first), abs(chi_first))
+        chi_0 = np.where(
+            abs(chi_0) >= abs(chi_yield), chi_yield / num_pre_yield, chi_0
+        )
+
+        # Define the arrays of curvatures, without a plastic branch where
+        # the ultimate curvature is not larger than the yield one
+        chi = np.full((len(n), num_pre_yield + num_post_yield), np.nan)
+        chi[:, : num_pre_yield - 1] = np.linspace(
+            chi_0, chi_yield, num_pre_yield - 1, endpoint=False, axis=1
+        )
+        chi[:, num_pre_yield - 1 :] = np.linspace(
+            chi_yield, chi_ultimate, num_post_yield + 1, axis=1
+        )
+        elastic = abs(chi_ultimate) <= abs(chi_yield) + 1e-8
+        chi[elastic, :num_pre_yield] = np.linspace(
+            chi_0[elastic], chi_yield[elastic], num_pre_yield, axis=1
+        )
+        chi[elastic, num_pre_yield:] = np.nan
+
+        # Find the axial strains column by column, predicting them from the
+        # last two columns
+        eps_a = np.full_like(chi, np.nan)
+        corrections = None
+        for j in range(chi.shape[1]):
+            rows = ~np.isnan(chi[:, j])
+            eps_0 = np.zeros(rows.sum())
+            delta = np.full_like(eps_0, 1e-3)
+            if j > 0:
+                eps_0 = eps_a[rows, j - 1].copy()
+            if j > 1:
+                eps_0 += (
+                    (eps_a[rows, j - 1] - eps_a[rows, j - 2])
+                    / (chi[rows, j - 1] - chi[rows, j - 2])
+                    * (chi[rows, j] - chi[rows, j - 1])
+                )
+                if corrections is not None:
+                    delta = np.clip(2 * corrections[rows], 1e-8, 1e-3)
+            try:
+                eps_a[rows, j] = self._find_equilibria_fixed_curvature(
+                    rotated_geom, n[rows], chi[rows, j], eps_0, delta, theta
+                )
+            except ValueError:
+                # A prediction is far from the equilibrium, restart from the
+                # last column
+                eps_a[rows, j] = self._find_equilibria_fixed_curvature(
+                    rotated_geom,
+                    n[rows],
+                    chi[rows, j],
+                    eps_a[rows, j - 1] if j > 0 else np.zeros_like(eps_0),
+                    np.full_like(eps_0, 1e-3),
+                    theta,
+                )
+            if j > 1:
+                corrections = np.zeros(len(n))
+                corrections[rows] = abs(eps_a[rows, j] - eps_0)
+
+        # Integrate the strain profiles and rotate back to section CRS
+        valid = ~np.isnan(chi)
+        moments = np.full(chi.shape + (2,), np.nan)
+        moments[valid] = self._integrate_strain_profiles_in_crs(
+            rotated_geom,
+            np.column_stack((eps_a[valid], chi[valid], np.zeros(valid.sum()))),
+            theta,
+        )[:, 1:]
+        T = np.array([[cos(theta), -sin(theta)], [sin(theta), cos(theta)]])
+        moments = moments @ T.T
+
+        return s_res.MomentCurvatureFamilyResults(
+            theta=theta,
+            n=n,
+            chi_y=chi * T[0, 0],
+            chi_z=chi * T[1, 0],
+            eps_axial=eps_a,
+            m_y=moments[..., 0],
+            m_z=moments[..., 1],
+        )
+
+    def _find_equilibria_fixed_pivot(
+        self,
+        geom: CompoundGeometry,
+        n: np.ndarray,
+        yielding: bool = False,
+        theta: t.Optional[float] = None,
+    ) -> np.ndarray:
+        """Find the equilibrium changing curvature fixed a pivot for several
+        axial loads at once.
+
+        This is the batched counterpart of find_equilibrium_fixed_pivot,
+        where the curvatures of all the axial loads are found with the
+        safeguarded secant method.
+
+        Arguments:
+            geom (CompoundGeometry): A geometry in the rotated reference
+                system.
+            n (ndarray): The external axial loads.
+            yielding (bool): consider yielding instead of ultimate strain,
+                default = False.
+            theta (Optional(float)): The angle such that geom is the section
+                geometry rotated of -theta (default = None).
+
+        Returns:
+            ndarray: The strain profiles with shape (k, 3), each with the
+            axial strain at (0, 0) and the curvatures of y* and z* axes.
+        """
+        # Start with a balanced failure
+        y_n, y_p, strain = self.get_balanced_failure_strain(geom, yielding)
+        eps_p = strain[0] + strain[1] * y_p
+        eps_n = strain[0] + strain[1] * y_n
+        n_int = self._integrate_strain_profiles_in_crs(geom, strain, theta)
+        chi_a = np.full_like(n, strain[1])
+        dn_a = n_int[0, 0] - n
+        # Raise the NA if too much compression, lower it otherwise
+        pivot = np.where(dn_a < 0, y_p, y_n)
+        strain_pivot = np.where(dn_a < 0, eps_p, eps_n)
+
+        def profiles(chi, rows):
+            return np.column_stack(
+                (
+                    strain_pivot[rows] - chi * pivot[rows],
+                    chi,
+                    np.zeros_like(chi),
+                )
+            )
+
+        def unbalance(chi, rows):
+            forces = self._integrate_strain_profiles_in_crs(
+                geom, profiles(chi, rows), theta
+            )
+            return forces[:, 0] - n[rows]
+
+        all_rows = np.ones_like(n, dtype=bool)
+        chi_b = np.full_like(n, -1e-13)
+        dn_b = unbalance(chi_b, all_rows)
+        chi = _find_roots_safeguarded_secant(
+            unbalance, chi_a, dn_a, chi_b, dn_b
+        )
+        return profiles(chi, all_rows)
+
+    def _find_equilibria_fixed_curvature(
+        self,
+        geom: CompoundGeometry,
+        n: np.ndarray,
+        curv: np.ndarray,
+        eps_0: np.ndarray,
+        delta: np.ndarray,
+        theta: t.Optional[float] = None,
+    ) -> np.ndarray:
+        """Find the axial strains in equilibrium with fixed curvatures for
+        several axial loads at once.
+
+        This is the batched counterpart of find_equilibrium_fixed_curvature,
+        where the axial strains are bracketed moving them by increasing
+        multiples of delta, and found with the safeguarded secant method.
+
+        Arguments:
+            geom (CompoundGeometry): A geometry in the rotated reference
+                system.
+            n (ndarray): The external axial loads.
+            curv (ndarray): The curvatures.
+            eps_0 (ndarray): The first attempts of axial strains.
+            delta (ndarray): The first increments of axial strains used to
+                bracket the equilibrium.
+            theta (Optional(float)): The angle such that geom is the section
+                geometry rotated of -theta (default = None).
+
+        Returns:
+            ndarray: The axial strains at (0, 0).
+
+        Raises:
+            ValueError: If the equilibrium cannot be bracketed.
+        """
+        ITMAX = 20
+
+        def unbalance(eps, rows):
+            forces = self._integrate_strain_profiles_in_crs(
+                geom,
+                np.column_stack((eps, curv[rows], np.zeros_like(eps))),
+                theta,
+            )
+            return forces[:, 0] - n[rows]
+
+        all_rows = np.ones_like(n, dtype=bool)
+        eps_a = np.asarray(eps_0, dtype=float)
+        dn_a = unbalance(eps_a, all_rows)
+        delta = np.array(delta, dtype=float)
+        sign = np.where(dn_a > 0, -1, 1)
+        eps_b, dn_b = eps_a.copy(), dn_a.copy()
+        # The equilibrium is already found or bracketed
+        found = abs(dn_a) <= 1e-2
+        it = np.zeros(len(n), dtype=int)
+        for _ in range(5 * ITMAX):
+            rows = ~found & (it < ITMAX)
+            if not rows.any():
+                break
+            eps_b[rows] = eps_a[rows] + sign[rows] * delta[rows] * (
+                it[rows] + 1
+            )
+            dn_b[rows] = unbalance(eps_b[rows], rows)
+            found |= rows & ((dn_a * dn_b < 0) | (abs(dn_b) <= 1e-2))
+            # We are driving away from the solution, probably due to
+            # failure of a material
+            away = rows & ~found & (abs(dn_b) > abs(dn_a))
+            delta[away] /= 2
+            it[rows & ~away] += 1
+        if not found.all():
+            i = np.argmin(found)
+            s = f'Last iteration reached a unbalance of: \
+                dn_a = {dn_a[i]} dn_b = {dn_b[i]})'
+            raise ValueError(f'Maximum number of iterations reached.\n{s}')
+        return _find_roots_safeguarded_secant(
+            unbalance, eps_a, dn_a, eps_b, dn_b
+        )
 
     def _process_num_strain_profiles(
         self,
@@ -847,6 +1913,7 @@ class GenericSectionCalculator(SectionCalculator):
         num_6 = max(n6_attempt, min_6)
         return (num_1, num_2, num_3, num_4, num_5, num_6)
 
+    @cached_result(persistent=True)
     def calculate_nm_interaction_domain(
         self,
         theta: float = 0,
@@ -931,21 +1998,17 @@ class GenericSectionCalculator(SectionCalculator):
         )
 
         # integrate all strain profiles
-        forces = np.zeros_like(strains)
-        for i, strain in enumerate(strains):
-            N, My, Mz, tri = (
-                self.integrator.integrate_strain_response_on_geometry(
-                    geo=self.section.geometry,
-                    strain=strain,
-                    tri=self.triangulated_data,
-                    mesh_size=self.mesh_size,
-                )
-            )
-            if self.triangulated_data is None:
-                self.triangulated_data = tri
-            forces[i, 0] = N
-            forces[i, 1] = My
-            forces[i, 2] = Mz
+        forces, tri = self.integrator.integrate_strain_responses(
+            geo=self.section.geometry,
+            strains=strains,
+            tri=self.triangulated_data,
+            prepared=self.prepared_section,
+            mesh_size=self.mesh_size,
+            quadrature=self.quadrature,
+            refinement=self.refinement,
+        )
+        if self.triangulated_data is None:
+            self.triangulated_data = tri
 
         # Save to results
         res.strains = strains
@@ -1111,6 +2174,7 @@ class GenericSectionCalculator(SectionCalculator):
         rotated_components = T @ components
         return np.column_stack((eps_a, rotated_components.T)), field_num
 
+    @cached_result('executor', 'n_jobs', persistent=True)
     def calculate_nmm_interaction_domain(
         self,
         num_theta: int = 32,
@@ -1127,6 +2191,8 @@ class GenericSectionCalculator(SectionCalculator):
         type_4: t.Literal['linear', 'geometric', 'quadratic'] = 'linear',
         type_5: t.Literal['linear', 'geometric', 'quadratic'] = 'linear',
         type_6: t.Literal['linear', 'geometric', 'quadratic'] = 'linear',
+        executor: t.Optional[Executor] = None,
+        n_jobs: t.Optional[int] = None,
     ) -> s_res.NMMInteractionDomain:
         """Calculates the NMM interaction domain.
 
@@ -1161,9 +2227,22 @@ class GenericSectionCalculator(SectionCalculator):
                 See type_1 for options.
             type_6 (literal): Type of spacing for field 6 (default = 'linear').
                 See type_1 for options.
+            executor (Optional(Executor)): An executor (e.g. a
+                ThreadPoolExecutor or a ProcessPoolExecutor) used for
+                distributing the angles of the neutral axis (Optional, default
+                = None).
+            n_jobs (Optional(int)): Number of processes used for distributing
+                the angles of the neutral axis when no executor is given. -1
+                means using all the processors (Optional, default = None, i.e.
+                serial computation).
 
         Returns:
             NMInteractionDomain: The calculation results.
+
+        Note:
+            The results do not depend on the executor nor on the number of
+            jobs: the slices computed for each angle are merged in the order
+            of the angles.
         """
         res = s_res.NMMInteractionDomain()
         res.num_theta = num_theta
@@ -1176,14 +2255,17 @@ class GenericSectionCalculator(SectionCalculator):
                 )
             )
 
-        # cycle for all n_thetas
-        thetas = np.linspace(0, np.pi * 2, num_theta)
-        # Initialize an empty array with the correct shape
-        strains = np.empty((0, 3))
-        for theta in thetas:
-            # Get ultimate strain profiles for theta angle
-            strain, field_num = self._compute_ultimate_strain_profiles(
-                theta=theta,
+        # Preallocate the results, each slice has the same number of strain
+        # profiles
+        num_slice = num_1 + num_2 + num_3 + num_4 + num_5 + num_6
+        res.strains = np.empty((num_theta * num_slice, 3))
+        res.forces = np.empty((num_theta * num_slice, 3))
+        res.field_num = np.empty(num_theta * num_slice, dtype=int)
+
+        # Fill the results with the slices in the order of the angles
+        for i, nmm_slice in enumerate(
+            self.iter_nmm_interaction_domain(
+                num_theta=num_theta,
                 num_1=num_1,
                 num_2=num_2,
                 num_3=num_3,
@@ -1196,32 +2278,153 @@ class GenericSectionCalculator(SectionCalculator):
                 type_4=type_4,
                 type_5=type_5,
                 type_6=type_6,
+                executor=executor,
+                n_jobs=n_jobs,
             )
-            strains = np.vstack((strains, strain))
+        ):
+            rows = slice(i * num_slice, (i + 1) * num_slice)
+            res.strains[rows] = nmm_slice.strains
+            res.forces[rows] = nmm_slice.forces
+            res.field_num[rows] = nmm_slice.field_num
 
-        # integrate all strain profiles
-        forces = np.zeros_like(strains)
-        for i, strain in enumerate(strains):
-            N, My, Mz, tri = (
-                self.integrator.integrate_strain_response_on_geometry(
-                    geo=self.section.geometry,
-                    strain=strain,
-                    tri=self.triangulated_data,
+        return res
+
+    def iter_nmm_interaction_domain(
+        self,
+        num_theta: int = 32,
+        num_1: int = 1,
+        num_2: int = 2,
+        num_3: int = 15,
+        num_4: int = 10,
+        num_5: int = 3,
+        num_6: int = 4,
+        num: t.Optional[int] = None,
+        type_1: t.Literal['linear', 'geometric', 'quadratic'] = 'linear',
+        type_2: t.Literal['linear', 'geometric', 'quadratic'] = 'linear',
+        type_3: t.Literal['linear', 'geometric', 'quadratic'] = 'geometric',
+        type_4: t.Literal['linear', 'geometric', 'quadratic'] = 'linear',
+        type_5: t.Literal['linear', 'geometric', 'quadratic'] = 'linear',
+        type_6: t.Literal['linear', 'geometric', 'quadratic'] = 'linear',
+        executor: t.Optional[Executor] = None,
+        n_jobs: t.Optional[int] = None,
+        sink: t.Optional[
+            t.Callable[[s_res.NMMInteractionDomainSlice], t.Any]
+        ] = None,
+    ) -> t.Iterator[s_res.NMMInteractionDomainSlice]:
+        """Iterates over the slices of the NMM interaction domain.
+
+        The slices for each angle of the neutral axis are yielded as soon as
+        they are computed, in the order of the angles, so that they can be
+        processed before the whole domain is computed. With an executor or
+        several jobs, only about as many angles as the workers are submitted
+        at once, so that at most that many slices are held in memory
+        besides the ones kept by the caller, and the angles not started yet
+        are cancelled if the iteration is stopped early.
+
+        Arguments:
+            num_theta (int): Number of discretization of angle of neutral axis
+                (Optional, Default = 32).
+            num_1, ..., num_6, num, type_1, ..., type_6: The discretization
+                of the strain profiles for each angle (see
+                calculate_nmm_interaction_domain).
+            executor (Optional(Executor)): An executor used for distributing
+                the angles of the neutral axis (Optional, default = None).
+            n_jobs (Optional(int)): Number of processes used for distributing
+                the angles of the neutral axis when no executor is given. -1
+                means using all the processors (Optional, default = None, i.e.
+                serial computation).
+            sink (Optional(Callable)): A callable called with each slice
+                before it is yielded, e.g. for writing it to a file
+                (Optional, default = None).
+
+        Yields:
+            NMMInteractionDomainSlice: The slice of the domain for each angle
+            of the neutral axis.
+
+        Note:
+            The results are not cached, use calculate_nmm_interaction_domain
+            for the whole domain.
+        """
+        # Process num if given.
+        if num is not None:
+            num_1, num_2, num_3, num_4, num_5, num_6 = (
+                self._process_num_strain_profiles(
+                    num, num_1, num_2, num_3, num_4, num_5, num_6
                 )
             )
-            if self.triangulated_data is None:
-                self.triangulated_data = tri
-            forces[i, 0] = N
-            forces[i, 1] = My
-            forces[i, 2] = Mz
 
-        # Save to results
-        res.strains = strains
-        res.forces = forces
-        res.field_num = field_num
+        # The slice computed for each angle of the neutral axis
+        compute_slice = functools.partial(
+            _compute_nmm_slice,
+            self,
+            num_1=num_1,
+            num_2=num_2,
+            num_3=num_3,
+            num_4=num_4,
+            num_5=num_5,
+            num_6=num_6,
+            type_1=type_1,
+            type_2=type_2,
+            type_3=type_3,
+            type_4=type_4,
+            type_5=type_5,
+            type_6=type_6,
+        )
 
-        return res
+        # cycle for all n_thetas
+        thetas = np.linspace(0, np.pi * 2, num_theta)
+        # Prepare the mesh once, so that it is shared by all the slices
+        if self.triangulated_data is None and hasattr(
+            self.integrator, 'prepare_triangulated_data'
+        ):
+            self.triangulated_data = self.integrator.prepare_triangulated_data(
+                geo=self.section.geometry,
+                prepared=self.prepared_section,
+                mesh_size=self.mesh_size,
+                quadrature=self.quadrature,
+            )
+        if executor is not None:
+            slices = _map_in_windows(
+                executor,
+                compute_slice,
+                thetas,
+                getattr(executor, '_max_workers', None) or os.cpu_count(),
+            )
+            yield from self._stream_nmm_slices(thetas, slices, sink)
+        elif n_jobs in (None, 1):
+            slices = map(compute_slice, thetas)
+            yield from self._stream_nmm_slices(thetas, slices, sink)
+        else:
+            max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                slices = _map_in_windows(
+                    pool, compute_slice, thetas, max_workers
+                )
+                yield from self._stream_nmm_slices(thetas, slices, sink)
 
+    def _stream_nmm_slices(
+        self,
+        thetas: np.ndarray,
+        slices: t.Iterable[t.Tuple[np.ndarray, np.ndarray, np.ndarray, t.Any]],
+        sink: t.Optional[t.Callable],
+    ) -> t.Iterator[s_res.NMMInteractionDomainSlice]:
+        """Wrap the slices computed by _compute_nmm_slice in results, in the
+        order of the angles, passing them to the sink if given.
+        """
+        for theta, (strains, forces, field_num, tri) in zip(thetas, slices):
+            if self.triangulated_data is None:
+                self.triangulated_data = tri
+            nmm_slice = s_res.NMMInteractionDomainSlice(
+                theta=theta,
+                strains=strains,
+                forces=forces,
+                field_num=field_num,
+            )
+            if sink is not None:
+                sink(nmm_slice)
+            yield nmm_slice
+
+    @cached_result(persistent=True)
     def calculate_mm_interaction_domain(
         self, n: float = 0, num_theta: int = 32
     ) -> s_res.MMInteractionDomain:
@@ -1244,7 +2447,7 @@ class GenericSectionCalculator(SectionCalculator):
         res.strains = np.zeros((num_theta, 3))
         # Compute strength for given angle of NA
         for i, th in enumerate(res.theta):
-            res_bend_strength = self.calculate_bending_strength(theta=th, n=n)
+            res_bend_strength = self._calculate_bending_strength(theta=th, n=n)
             # Save forces
             res.forces[i, 0] = n
             res.forces[i, 1] = res_bend_strength.m_y
@@ -1255,3 +2458,210 @@ class GenericSectionCalculator(SectionCalculator):
             res.strains[i, 2] = res_bend_strength.chi_z
 
         return res
+
+
+def _find_root_safeguarded_newton(
+    fun: t.Callable[[float], t.Tuple[float, t.Optional[float]]],
+    x_a: float,
+    f_a: float,
+    x_b: float,
+    f_b: float,
+    tol: float = 1e-2,
+    itmax: int = 100,
+) -> float:
+    """Find a zero of a function with a Newton algorithm safeguarded by
+    bisection.
+
+    The Newton step is taken only when it falls inside the current bracket
+    and it reduces the residual fast enough, otherwise a bisection step is
+    taken. When the derivative is not available, it is approximated with the
+    secant of the last two points.
+
+    Arguments:
+        fun (Callable): A function returning the value of the function and its
+            derivative (or None if not available).
+        x_a (float): First end of the bracket.
+        f_a (float): Value of the function at x_a.
+        x_b (float): Second end of the bracket.
+        f_b (float): Value of the function at x_b, with sign opposite to f_a.
+        tol (float): Tolerance on the value of the function (default = 1e-2).
+        itmax (int): Maximum number of iterations (default = 100).
+
+    Returns:
+        float: The zero of the function.
+
+    Raises:
+        ValueError: If the maximum number of iterations is reached.
+    """
+    # Start from the end of the bracket with the smallest residual
+    if abs(f_a) <= abs(f_b):
+        x, f, x_old, f_old = x_a, f_a, x_b, f_b
+    else:
+        x, f, x_old, f_old = x_b, f_b, x_a, f_a
+    df = None
+    bisect = False
+    for _ in range(itmax):
+        if abs(f) <= tol or abs(f_a - f_b) <= tol:
+            return x
+        # Newton step with the tangent, or with the secant if not available
+        slope = df if df else (f - f_old) / (x - x_old)
+        x_new = x - f / slope if slope else None
+        if (
+            bisect
+            or x_new is None
+            or not min(x_a, x_b) < x_new < max(x_a, x_b)
+        ):
+            x_new = (x_a + x_b) / 2.0
+        f_new, df = fun(x_new)
+        # Bisect in the next iteration if the residual is not halved
+        bisect = abs(f_new) > 0.5 * abs(f)
+        # Update the bracket
+        if f_new * f_a < 0:
+            x_b, f_b = x_new, f_new
+        else:
+            x_a, f_a = x_new, f_new
+        x_old, f_old, x, f = x, f, x_new, f_new
+    s = f'Last iteration reached a unbalance of {f}'
+    raise ValueError(f'Maximum number of iterations reached.\n{s}')
+
+
+def _find_roots_safeguarded_secant(
+    fun: t.Callable[[np.ndarray, np.ndarray], np.ndarray],
+    x_a: np.ndarray,
+    f_a: np.ndarray,
+    x_b: np.ndarray,
+    f_b: np.ndarray,
+    tol: float = 1e-2,
+    itmax: int = 100,
+) -> np.ndarray:
+    """Find the zeros of several functions at once with a secant algorithm
+    safeguarded by bisection.
+
+    This is the batched counterpart of _find_root_safeguarded_newton without
+    derivatives: each function is evaluated only until its zero is found.
+
+    Arguments:
+        fun (Callable): A function taking the points and a boolean mask of
+            the functions to evaluate, and returning their values.
+        x_a (ndarray): First ends of the brackets.
+        f_a (ndarray): Values of the functions at x_a.
+        x_b (ndarray): Second ends of the brackets.
+        f_b (ndarray): Values of the functions at x_b, with signs opposite to
+            f_a.
+        tol (float): Tolerance on the values of the functions (default =
+            1e-2).
+        itmax (int): Maximum number of iterations (default = 100).
+
+    Returns:
+        ndarray: The zeros of the functions.
+
+    Raises:
+        ValueError: If the maximum number of iterations is reached.
+    """
+    x_a, f_a, x_b, f_b = (
+        np.array(v, dtype=float) for v in (x_a, f_a, x_b, f_b)
+    )
+    # Start from the end of the brackets with the smallest residual
+    swap = abs(f_a) > abs(f_b)
+    x, f = np.where(swap, x_b, x_a), np.where(swap, f_b, f_a)
+    x_old, f_old = np.where(swap, x_a, x_b), np.where(swap, f_a, f_b)
+    bisect = np.zeros_like(x, dtype=bool)
+    for _ in range(itmax):
+        active = (abs(f) > tol) & (abs(f_a - f_b) > tol)
+        if not active.any():
+            return x
+        # Secant step, or bisection if it falls outside the bracket or the
+        # residual was not halved in the last iteration
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_new = x - f * (x - x_old) / (f - f_old)
+        outside = ~(
+            (np.minimum(x_a, x_b) < x_new) & (x_new < np.maximum(x_a, x_b))
+        )
+        x_new = np.where(bisect | outside, (x_a + x_b) / 2.0, x_new)
+        f_new = f.copy()
+        f_new[active] = fun(x_new[active], active)
+        bisect = abs(f_new) > 0.5 * abs(f)
+        # Update the brackets
+        to_b = active & (f_new * f_a < 0)
+        to_a = active & ~to_b
+        x_b[to_b], f_b[to_b] = x_new[to_b], f_new[to_b]
+        x_a[to_a], f_a[to_a] = x_new[to_a], f_new[to_a]
+        x_old = np.where(active, x, x_old)
+        f_old = np.where(active, f, f_old)
+        x = np.where(active, x_new, x)
+        f = f_new
+    i = np.argmax(abs(f))
+    s = f'Last iteration reached a unbalance of {f[i]}'
+    raise ValueError(f'Maximum number of iterations reached.\n{s}')
+
+
+def _compute_nmm_slice(
+    calculator: GenericSectionCalculator, theta: float, **kwargs
+) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray, t.Any]:
+    """Compute the slice of the NMM interaction domain for a given angle of
+    the neutral axis.
+
+    This is a module level function so that it can be pickled and sent to
+    other processes.
+
+    Arguments:
+        calculator (GenericSectionCalculator): The section calculator.
+        theta (float): The angle of the neutral axis.
+        kwargs: The discretization of the strain profiles (see
+            _compute_ultimate_strain_profiles).
+
+    Returns:
+        Tuple(ndarray, ndarray, ndarray, Any): The strain profiles, the
+        forces, the field numbers and the triangulated data.
+    """
+    strains, field_num = calculator._compute_ultimate_strain_profiles(
+        theta=theta, **kwargs
+    )
+    forces, tri = calculator.integrator.integrate_strain_responses(
+        geo=calculator.section.geometry,
+        strains=strains,
+        tri=calculator.triangulated_data,
+        prepared=calculator.prepared_section,
+        mesh_size=calculator.mesh_size,
+        quadrature=calculator.quadrature,
+        refinement=calculator.refinement,
+    )
+    return strains, forces, field_num, tri
+
+
+def _map_in_windows(
+    executor: Executor,
+    fn: t.Callable,
+    items: t.Iterable,
+    window: int,
+) -> t.Iterator:
+    """Map a function over items with an executor, keeping at most window
+    calls submitted at once.
+
+    The calls not started yet are cancelled when the iteration is stopped,
+    e.g. when the generator is closed.
+
+    Arguments:
+        executor (Executor): The executor.
+        fn (Callable): The function.
+        items (Iterable): The arguments of the calls.
+        window (int): The maximum number of calls submitted at once.
+
+    Yields:
+        Any: The results of the calls, in the order of the items.
+    """
+    items = iter(items)
+    futures = collections.deque(
+        executor.submit(fn, item)
+        for item in itertools.islice(items, max(window, 1))
+    )
+    try:
+        while futures:
+            result = futures.popleft().result()
+            # Keep the workers busy while the result is processed
+            for item in itertools.islice(items, 1):
+                futures.append(executor.submit(fn, item))
+            yield result
+    finally:
+        for future in futures:
+            future.cancel()
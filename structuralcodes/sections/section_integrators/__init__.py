@@ -1,14 +1,22 @@
 """Classes for integrating the response of sections."""
 
 from ._factory import integrator_factory
-from ._fiber_integrator import FiberIntegrator
-from ._marin_integrator import MarinIntegrator, marin_integration
+from ._fiber_integrator import FiberData, FiberIntegrator
+from ._marin_integration import (
+    marin_integration,
+    marin_integration_moments,
+)
+from ._marin_integrator import MarinIntegrator
+from ._prepared_section import PreparedSection
 from ._section_integrator import SectionIntegrator
 
 __all__ = [
     'integrator_factory',
+    'FiberData',
     'FiberIntegrator',
     'MarinIntegrator',
+    'PreparedSection',
     'SectionIntegrator',
     'marin_integration',
+    'marin_integration_moments',
 ]
@@ -3,17 +3,242 @@
 from __future__ import annotations  # To have clean hints of ArrayLike in docs
 
 import typing as t
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 
 import numpy as np
 import triangle
 from numpy.typing import ArrayLike
-from shapely import Polygon
 
+from structuralcodes.core.base import ConstitutiveLaw
 from structuralcodes.geometry import CompoundGeometry, SurfaceGeometry
 
+from ._prepared_section import PreparedSection
 from ._section_integrator import SectionIntegrator
 
 
+def _gauss_triangle_rules() -> t.Dict[int, t.Tuple[np.ndarray, np.ndarray]]:
+    """Return the Gauss quadrature rules on triangles.
+
+    Returns:
+        Dict(int, Tuple(ndarray, ndarray)): For each number of points, the
+        barycentric coordinates of the points with shape (n, 3) and the
+        weights with shape (n,) summing to one.
+    """
+    # 1 point rule, exact for polynomials of degree 1
+    rule_1 = (np.array([[1 / 3, 1 / 3, 1 / 3]]), np.array([1.0]))
+    # 3 points rule, exact for polynomials of degree 2
+    a, b = 2 / 3, 1 / 6
+    rule_3 = (
+        np.array([[a, b, b], [b, a, b], [b, b, a]]),
+        np.full(3, 1 / 3),
+    )
+    # 7 points rule, exact for polynomials of degree 5
+    sq15 = np.sqrt(15)
+    a1, b1 = (9 - 2 * sq15) / 21, (6 + sq15) / 21
+    a2, b2 = (9 + 2 * sq15) / 21, (6 - sq15) / 21
+    w1, w2 = (155 + sq15) / 1200, (155 - sq15) / 1200
+    rule_7 = (
+        np.array(
+            [
+                [1 / 3, 1 / 3, 1 / 3],
+                [a1, b1, b1],
+                [b1, a1, b1],
+                [b1, b1, a1],
+                [a2, b2, b2],
+                [b2, a2, b2],
+                [b2, b2, a2],
+            ]
+        ),
+        np.array([9 / 40, w1, w1, w1, w2, w2, w2]),
+    )
+    return {1: rule_1, 3: rule_3, 7: rule_7}
+
+
+GAUSS_TRIANGLE_RULES = _gauss_triangle_rules()
+
+
+def _get_triangle_fibers(
+    triangles: np.ndarray, quadrature: int
+) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the fibers of a set of triangles.
+
+    Arguments:
+        triangles (ndarray): The vertices of the triangles with shape
+            (n_triangles, 3, 2).
+        quadrature (int): The number of integration points for each
+            triangle.
+
+    Returns:
+        Tuple(ndarray, ndarray, ndarray): The x-coordinates, y-coordinates
+        and area of the fibers, with the fibers of each triangle stored
+        contiguously.
+    """
+    points, weights = GAUSS_TRIANGLE_RULES[quadrature]
+    tr = triangles
+    area = 0.5 * np.abs(
+        (tr[:, 1, 0] - tr[:, 0, 0]) * (tr[:, 2, 1] - tr[:, 0, 1])
+        - (tr[:, 2, 0] - tr[:, 0, 0]) * (tr[:, 1, 1] - tr[:, 0, 1])
+    )
+    # integration points with shape (n_triangles, n_points, 2)
+    xy = np.einsum('pk,tkd->tpd', points, tr)
+    return (
+        xy[..., 0].ravel(),
+        xy[..., 1].ravel(),
+        np.outer(area, weights).ravel(),
+    )
+
+
+def _subdivide_triangles(triangles: np.ndarray) -> np.ndarray:
+    """Subdivide each triangle in four triangles joining the midpoints of
+    the edges.
+
+    Arguments:
+        triangles (ndarray): The vertices of the triangles with shape
+            (n_triangles, 3, 2).
+
+    Returns:
+        ndarray: The vertices of the new triangles with shape
+        (4 * n_triangles, 3, 2).
+    """
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    ab, bc, ca = (a + b) / 2, (b + c) / 2, (c + a) / 2
+    return np.concatenate(
+        (
+            np.stack((a, ab, ca), axis=1),
+            np.stack((ab, b, bc), axis=1),
+            np.stack((ca, bc, c), axis=1),
+            np.stack((ab, bc, ca), axis=1),
+        )
+    )
+
+
+def _find_crossing_triangles(
+    triangles: np.ndarray, strain: ArrayLike, breakpoints: np.ndarray
+) -> np.ndarray:
+    """Find the triangles where the strain crosses a breakpoint.
+
+    Arguments:
+        triangles (ndarray): The vertices of the triangles with shape
+            (n_triangles, 3, 2).
+        strain (ArrayLike): The strain profile given as (ea, ky, kz).
+        breakpoints (ndarray): The strains where the constitutive law is not
+            smooth.
+
+    Returns:
+        ndarray: A boolean mask of the triangles crossing a breakpoint.
+    """
+    # The strain is linear, the extremes are found at the vertices
+    eps = (
+        strain[0]
+        - strain[2] * triangles[..., 0]
+        + strain[1] * triangles[..., 1]
+    )
+    eps_min = eps.min(axis=1)[:, None]
+    eps_max = eps.max(axis=1)[:, None]
+    return np.any((eps_min < breakpoints) & (breakpoints < eps_max), axis=1)
+
+
+def _ring_area(x: np.ndarray, y: np.ndarray) -> float:
+    """Return the signed area of a closed ring with the shoelace formula."""
+    return 0.5 * (np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))
+
+
+def _get_triangulation_input(rings: t.List[np.ndarray]) -> t.Dict:
+    """Prepare the input of the triangle module for a polygon.
+
+    Arguments:
+        rings (List(ndarray)): The vertices of the closed rings of the
+            polygon with shape (n, 2), starting with the exterior and
+            followed by the holes.
+
+    Returns:
+        Dict: The triangulation data.
+    """
+    # Create the tri dictionary
+    tri: dict[str:ArrayLike] = {}
+    vertices = []
+    segments = []
+    holes = []
+    n_vertices = 0
+    for i, ring in enumerate(rings):
+        # Get vertices, skipping the last one
+        vertices.append(ring[:-1, :])
+        # Create segments
+        node_i = np.arange(len(ring) - 1) + n_vertices
+        node_j = np.roll(node_i, -1)
+        segments.append(np.column_stack((node_i, node_j)))
+        n_vertices += len(ring) - 1
+        if i > 0:
+            # The centroid of the hole
+            x, y = ring[:, 0], ring[:, 1]
+            cross = x[:-1] * y[1:] - x[1:] * y[:-1]
+            factor = 1 / (6 * _ring_area(x, y))
+            holes.append(
+                [
+                    factor * np.dot(x[:-1] + x[1:], cross),
+                    factor * np.dot(y[:-1] + y[1:], cross),
+                ]
+            )
+    # Return the dictionary with data for triangulate
+    tri['vertices'] = np.vstack(vertices)
+    tri['segments'] = np.vstack(segments)
+    if len(holes) > 0:
+        tri['holes'] = holes
+    return tri
+
+
+class FiberData(t.NamedTuple):
+    """The fibers of a section with the same material.
+
+    Attributes:
+        x (numpy.Array): The x-coordinates of the fibers.
+        y (numpy.Array): The y-coordinates of the fibers.
+        area (numpy.Array): The area of the fibers.
+        material (ConstitutiveLaw): The material of the fibers.
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    area: np.ndarray
+    material: ConstitutiveLaw
+
+
+@dataclass(frozen=True, eq=False)
+class _FiberTable(Sequence):
+    """The sequence of the fibers of a section grouped by material, with the
+    triangles of the mesh they come from.
+
+    Indexing and iterating give the fibers, as in a list of FiberData.
+    Slicing returns a plain list of FiberData without the triangles.
+
+    Attributes:
+        fibers (List(FiberData)): The fibers grouped by material.
+        triangles (List(Optional(numpy.Array))): For each item of fibers,
+            the vertices of the triangles the fibers are integration points
+            of, with shape (n_triangles, 3, 2), or None for the
+            reinforcement.
+    """
+
+    fibers: t.List[FiberData] = field(default_factory=list)
+    triangles: t.List[t.Optional[np.ndarray]] = field(default_factory=list)
+
+    def __getitem__(self, index):
+        """Return the fibers at index."""
+        return self.fibers[index]
+
+    def __len__(self) -> int:
+        """Return the number of groups of fibers."""
+        return len(self.fibers)
+
+    def append(
+        self, fibers: FiberData, triangles: t.Optional[np.ndarray] = None
+    ) -> None:
+        """Append the fibers with the same material and their triangles."""
+        self.fibers.append(fibers)
+        self.triangles.append(triangles)
+
+
 class FiberIntegrator(SectionIntegrator):
     """Section integrator based on the Marin algorithm."""
 
@@ -26,39 +251,180 @@ class FiberIntegrator(SectionIntegrator):
         Returns:
             Dict: The triangulation data.
         """
-        # Create the tri dictionary
-        tri: dict[str:ArrayLike] = {}
-        # 1. External boundary process
-        # 1a. Get vertices, skipping the last one
-        vertices = np.column_stack(geo.polygon.exterior.xy)[:-1, :]
-        n_vertices = vertices.shape[0]
-        # 1b. Create segments
-        node_i = np.arange(n_vertices)
-        node_j = np.roll(node_i, -1)
-        segments = np.column_stack((node_i, node_j))
-
-        # 2. Process holes
-        holes = []
-        for interior in geo.polygon.interiors:
-            # 2a. Get vertices, skipping the last one
-            vertices_int = np.column_stack(interior.xy)[:-1, :]
-            n_vertices_int = vertices_int.shape[0]
-            # 2b. Create segments
-            node_i = np.arange(n_vertices_int) + n_vertices
-            node_j = np.roll(node_i, -1)
-            segments_int = np.column_stack((node_i, node_j))
-            c = Polygon(interior)
-            holes.append([c.centroid.x, c.centroid.y])
-            # Append to the global arrays
-            vertices = np.vstack((vertices, vertices_int))
-            segments = np.vstack((segments, segments_int))
-            n_vertices += n_vertices_int
-        # Return the dictionary with data for triangulate
-        tri['vertices'] = vertices
-        tri['segments'] = segments
-        if len(holes) > 0:
-            tri['holes'] = holes
-        return tri
+        # The exterior followed by the holes, skipping the last vertex
+        rings = [np.column_stack(geo.polygon.exterior.xy)] + [
+            np.column_stack(interior.xy) for interior in geo.polygon.interiors
+        ]
+        return _get_triangulation_input(rings)
+
+    def prepare_triangulated_data(
+        self, geo: CompoundGeometry, **kwargs
+    ) -> t.Sequence[FiberData]:
+        """Discretize the geometry in fibers.
+
+        Arguments:
+            geo (CompoundGeometry): The geometry of the section.
+
+        Keyword Arguments:
+            tri (List): The triangulation data from a previous call. If given,
+                it is returned as it is.
+            prepared (PreparedSection): The prepared section of geo. If
+                given, the geometry is triangulated from its arrays.
+            mesh_size: Percentage of area (number from 0 to 1) max for triangle
+                elements.
+            quadrature (int): The number of integration points for each
+                triangle: 1 (centroid), 3 or 7 for Gauss rules exact for
+                polynomials of degree 1, 2 and 5 respectively (default = 1).
+
+        Returns:
+            Sequence(FiberData): The triangulation data as a sequence with
+            x-coordinates, y-coordinates, area and material of the fibers,
+            grouped by material. The arrays are read-only. The vertices of
+            the triangles of the mesh, used for refining the fibers, are
+            kept in the attribute triangles of the sequence, indexed like
+            the fibers.
+
+        Note:
+            With more integration points each triangle is represented by
+            several fibers, with area equal to the weight of the point
+            times the area of the triangle.
+        """
+        triangulated_data = kwargs.get('tri')
+        if triangulated_data is not None:
+            return triangulated_data
+        # No triangulation is provided, triangulate the section
+        # Fiber integrator for generic section uses delaunay triangulation
+        # for discretizing in fibers
+        triangulated_data = _FiberTable()
+        mesh_size = kwargs.get('mesh_size', 0.01)
+        if mesh_size <= 0 or mesh_size > 1:
+            raise ValueError('mesh_size is a number from 0 to 1')
+        quadrature = kwargs.get('quadrature', 1)
+        if quadrature not in GAUSS_TRIANGLE_RULES:
+            raise ValueError(
+                f'quadrature should be one of {list(GAUSS_TRIANGLE_RULES)}'
+            )
+        prepared = kwargs.get('prepared')
+        if prepared is None:
+            prepared = PreparedSection(geo)
+        # For the surface geometries
+        for rings, material in prepared.surfaces():
+            if len(rings) == 0:
+                continue
+            # prepare data structure for triangle module
+            tri = _get_triangulation_input(
+                [np.column_stack(ring) for ring in rings]
+            )
+            # define the maximum area of the triangles, the holes being
+            # ordered cw their area is negative
+            max_area = sum(_ring_area(*ring) for ring in rings) * mesh_size
+            # triangulate the geometry getting back the mesh
+            mesh = triangle.triangulate(tri, f'pq{30:.1f}Aa{max_area:.1f}o1')
+            # Get x and y coordinates and area for each fiber
+            # vertices of each triangle with shape (n_triangles, 3, 2)
+            tr = mesh['vertices'][mesh['triangles']]
+            # return back the triangulation data
+            triangulated_data.append(
+                FiberData(*_get_triangle_fibers(tr, quadrature), material), tr
+            )
+        # For the reinforcement, the points are grouped by material
+        for x, y, area, mat in prepared.point_groups():
+            triangulated_data.append(FiberData(x, y, area, mat))
+        # The fiber table is meant to be stored and reused, make it immutable
+        for fibers, triangles in zip(
+            triangulated_data, triangulated_data.triangles
+        ):
+            for arr in fibers[:3]:
+                arr.setflags(write=False)
+            if triangles is not None:
+                triangles.setflags(write=False)
+        return triangulated_data
+
+    @staticmethod
+    def refine_triangulated_data(
+        triangulated_data: t.Sequence[FiberData],
+        strain: ArrayLike,
+        refinement: int,
+    ) -> t.Sequence[FiberData]:
+        """Refine the fibers where the strain crosses a breakpoint of the
+        constitutive law.
+
+        The triangles where the strain crosses a breakpoint (see
+        ConstitutiveLaw.get_breakpoints) are subdivided in four triangles
+        joining the midpoints of the edges, and the subdivision is repeated
+        on the new triangles still crossing a breakpoint. The fibers of the
+        other triangles are reused as they are.
+
+        Arguments:
+            triangulated_data (Sequence(FiberData)): The fibers of the
+                section, as returned by prepare_triangulated_data.
+            strain (ArrayLike): The strain profile given as (ea, ky, kz).
+            refinement (int): The number of subdivisions.
+
+        Returns:
+            Sequence(FiberData): The refined fibers. The original fibers are
+            returned if refinement is zero.
+
+        Raises:
+            ValueError: If refinement is requested for fibers without the
+                triangles of the mesh.
+        """
+        if refinement <= 0:
+            return triangulated_data
+        # Without the triangles of the mesh the fibers cannot be refined
+        if not isinstance(triangulated_data, _FiberTable):
+            raise ValueError(
+                'The fibers can be refined only with the triangles of the '
+                'mesh, use the data returned by prepare_triangulated_data'
+            )
+        refined_data = []
+        for fibers, mesh in zip(
+            triangulated_data, triangulated_data.triangles
+        ):
+            if mesh is None:
+                # Reinforcement
+                refined_data.append(fibers)
+                continue
+            breakpoints = fibers.material.get_breakpoints()
+            triangles = mesh
+            quadrature = len(fibers.x) // len(triangles)
+            crossing = _find_crossing_triangles(triangles, strain, breakpoints)
+            if not np.any(crossing):
+                refined_data.append(fibers)
+                continue
+            # Keep the fibers of the triangles not crossing a breakpoint
+            keep = np.repeat(~crossing, quadrature)
+            x, y, area = (
+                [fibers.x[keep]],
+                [fibers.y[keep]],
+                [fibers.area[keep]],
+            )
+            triangles = triangles[crossing]
+            for level in range(refinement):
+                triangles = _subdivide_triangles(triangles)
+                if level < refinement - 1:
+                    crossing = _find_crossing_triangles(
+                        triangles, strain, breakpoints
+                    )
+                else:
+                    # Last subdivision, keep all triangles
+                    crossing = np.zeros(len(triangles), dtype=bool)
+                x_i, y_i, area_i = _get_triangle_fibers(
+                    triangles[~crossing], quadrature
+                )
+                x.append(x_i)
+                y.append(y_i)
+                area.append(area_i)
+                triangles = triangles[crossing]
+            refined_data.append(
+                FiberData(
+                    np.concatenate(x),
+                    np.concatenate(y),
+                    np.concatenate(area),
+                    fibers.material,
+                )
+            )
+        return refined_data
 
     def prepare_input(
         self, geo: CompoundGeometry, strain: ArrayLike, **kwargs
@@ -87,97 +453,15 @@ class FiberIntegrator(SectionIntegrator):
 
         prepared_input = []
 
-        triangulated_data = kwargs.get('tri', None)
-        if triangulated_data is None:
-            # No triangulation is provided, triangulate the section
-            # Fiber integrator for generic section uses delaunay triangulation
-            # for discretizing in fibers
-            triangulated_data = []
-            mesh_size = kwargs.get('mesh_size', 0.01)
-            if mesh_size <= 0 or mesh_size > 1:
-                raise ValueError('mesh_size is a number from 0 to 1')
-            # For the surface geometries
-            for g in geo.geometries:
-                # prepare data structure for triangle module
-                tri = self.prepare_triangulation(g)
-                # define the maximum area of the triangles
-                max_area = g.area * mesh_size
-                # triangulate the geometry getting back the mesh
-                mesh = triangle.triangulate(
-                    tri, f'pq{30:.1f}Aa{max_area:.1f}o1'
-                )
-                mat = g.material
-                # Get x and y coordinates (centroid) and area for each fiber
-                x = []
-                y = []
-                area = []
-                for tr in mesh['triangles']:
-                    # get centroid of triangle
-                    xc = (
-                        mesh['vertices'][tr[0]][0]
-                        + mesh['vertices'][tr[1]][0]
-                        + mesh['vertices'][tr[2]][0]
-                    )
-                    xc /= 3.0
-                    x.append(xc)
-                    yc = (
-                        mesh['vertices'][tr[0]][1]
-                        + mesh['vertices'][tr[1]][1]
-                        + mesh['vertices'][tr[2]][1]
-                    )
-                    yc /= 3.0
-                    y.append(yc)
-                    # compute area
-                    a = (
-                        mesh['vertices'][tr[0]][0] * mesh['vertices'][tr[1]][1]
-                        - mesh['vertices'][tr[0]][1]
-                        * mesh['vertices'][tr[1]][0]
-                    )
-                    a += (
-                        mesh['vertices'][tr[1]][0] * mesh['vertices'][tr[2]][1]
-                        - mesh['vertices'][tr[1]][1]
-                        * mesh['vertices'][tr[2]][0]
-                    )
-                    a += (
-                        mesh['vertices'][tr[2]][0] * mesh['vertices'][tr[0]][1]
-                        - mesh['vertices'][tr[2]][1]
-                        * mesh['vertices'][tr[0]][0]
-                    )
-                    a = abs(a) * 0.5
-                    area.append(a)
-                    # pointer to the material
-
-                # return back the triangulation data
-                triangulated_data.append(
-                    (np.array(x), np.array(y), np.array(area), mat)
-                )
-            # For the reinforcement
-            # Tentative proposal for managing reinforcement (PointGeometry)
-            reinf_data = {}
-            # Preprocess geometries having the same material
-            for pg in geo.point_geometries:
-                x, y = pg._point.coords.xy
-                x = x[0]
-                y = y[0]
-                area = pg.area
-                mat = pg.material
-                if reinf_data.get(mat) is None:
-                    reinf_data[mat] = [
-                        np.array(x),
-                        np.array(y),
-                        np.array(area),
-                    ]
-                else:
-                    reinf_data[mat][0] = np.hstack((reinf_data[mat][0], x))
-                    reinf_data[mat][1] = np.hstack((reinf_data[mat][1], y))
-                    reinf_data[mat][2] = np.hstack((reinf_data[mat][2], area))
-            for mat, value in reinf_data.items():
-                triangulated_data.append((value[0], value[1], value[2], mat))
+        triangulated_data = self.prepare_triangulated_data(geo, **kwargs)
+        fibers = self.refine_triangulated_data(
+            triangulated_data, strain, kwargs.get('refinement', 0)
+        )
 
         x = []
         y = []
         F = []
-        for tr in triangulated_data:
+        for tr in fibers:
             # All have the same material
             strains = strain[0] - strain[2] * tr[0] + strain[1] * tr[1]
             # compute stresses in all materials
@@ -224,6 +508,9 @@ class FiberIntegrator(SectionIntegrator):
                 ii) curvature y axis, iii) curvature z axis.
             mesh_size: Percentage of area (number from 0 to 1) max for triangle
                 elements.
+            refinement (int): The number of subdivisions of the triangles
+                where the strain crosses a breakpoint of the constitutive
+                law (default = 0).
 
         Returns:
             Tuple(Tuple(float, float, float), Dict): The stress resultants N,
@@ -236,3 +523,99 @@ class FiberIntegrator(SectionIntegrator):
 
         # Return the calculated response
         return *self.integrate(prepared_input), triangulated_data
+
+    def integrate_strain_responses(
+        self, geo: CompoundGeometry, strains: ArrayLike, **kwargs
+    ) -> t.Tuple[np.ndarray, t.List]:
+        """Integrate the response of a batch of strain profiles.
+
+        The strains of all fibers for all strain profiles are evaluated as a
+        single (k x n_fibers) matrix, so that each material is evaluated only
+        once for the whole batch.
+
+        Arguments:
+            geo (CompoundGeometry): The geometry of the section.
+            strains (ArrayLike): The strain profiles as an array with shape
+                (k, 3), where each row is given in the format (ea, ky, kz).
+
+        Keyword Arguments:
+            tri (List): The triangulation data from a previous call.
+            mesh_size: Percentage of area (number from 0 to 1) max for triangle
+                elements.
+            refinement (int): The number of subdivisions of the triangles
+                where the strain crosses a breakpoint of the constitutive
+                law (default = 0).
+
+        Returns:
+            Tuple(ndarray, List): An array with shape (k, 3) collecting the
+            stress resultants N, Mx and My for each strain profile, and the
+            triangulation data.
+        """
+        strains = np.atleast_2d(np.asarray(strains, dtype=float))
+        triangulated_data = self.prepare_triangulated_data(geo, **kwargs)
+
+        forces = np.zeros_like(strains)
+        if kwargs.get('refinement', 0) > 0:
+            # The refined fibers depend on the strain profile
+            kwargs['tri'] = triangulated_data
+            for k, strain in enumerate(strains):
+                forces[k] = self.integrate_strain_response_on_geometry(
+                    geo, strain, **kwargs
+                )[:3]
+            return forces, triangulated_data
+
+        for x, y, area, mat in triangulated_data:
+            # Strains with shape (k, n_fibers)
+            eps = (
+                strains[:, 0, None]
+                - strains[:, 2, None] * x[None, :]
+                + strains[:, 1, None] * y[None, :]
+            )
+            # compute the force in all fibers with the same material
+            F = mat.get_stress(eps.ravel()).reshape(eps.shape) * area
+            forces[:, 0] += F.sum(axis=1)
+            forces[:, 1] += F @ y
+            forces[:, 2] -= F @ x
+
+        return forces, triangulated_data
+
+    def integrate_tangent_on_geometry(
+        self, geo: CompoundGeometry, strain: ArrayLike, **kwargs
+    ) -> t.Tuple[np.ndarray, t.List]:
+        """Integrate the tangent stiffness of the section for a strain profile.
+
+        The tangent stiffness relates increments of the strain profile (ea,
+        ky, kz) to increments of the stress resultants (N, Mx, My), and is
+        assembled summing the contributions of the fibers.
+
+        Arguments:
+            geo (CompoundGeometry): The geometry of the section.
+            strain (ArrayLike): The strains and curvatures of the section,
+                given in the format (ea, ky, kz) which are i) strain at 0,0,
+                ii) curvature y axis, iii) curvature z axis.
+
+        Keyword Arguments:
+            tri (List): The triangulation data from a previous call.
+            mesh_size: Percentage of area (number from 0 to 1) max for triangle
+                elements.
+            refinement (int): The number of subdivisions of the triangles
+                where the strain crosses a breakpoint of the constitutive
+                law (default = 0).
+
+        Returns:
+            Tuple(ndarray, List): The 3x3 tangent stiffness matrix and the
+            triangulation data.
+        """
+        triangulated_data = self.prepare_triangulated_data(geo, **kwargs)
+        fibers = self.refine_triangulated_data(
+            triangulated_data, strain, kwargs.get('refinement', 0)
+        )
+
+        stiffness = np.zeros((3, 3))
+        for x, y, area, mat in fibers:
+            eps = strain[0] - strain[2] * x + strain[1] * y
+            # Derivatives of the fiber strain respect to ea, ky and kz
+            b = np.vstack((np.ones_like(x), y, -x))
+            stiffness += (b * (mat.get_tangent(eps) * area)) @ b.T
+
+        return stiffness, triangulated_data
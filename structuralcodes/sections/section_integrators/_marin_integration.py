@@ -4,10 +4,15 @@ Marin, J.: Computing columns, footings and gates through moments of area.
 Computers and Structures, 18(2), pp. 343-349, 1984.
 """
 
+from __future__ import annotations  # To have clean hints of ArrayLike in docs
+
 import functools
 import math
 import typing as t
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 
 @functools.lru_cache
 def _coeff(m, n, j, k):
@@ -15,6 +20,82 @@ def _coeff(m, n, j, k):
     return math.comb(j + k, j) * math.comb(m + n - j - k, n - k)
 
 
+@functools.lru_cache
+def _coeff_tensor(
+    orders: t.Tuple[t.Tuple[int, int], ...],
+) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Assemble the coefficients and exponents for a set of (m, n) orders.
+
+    The coefficients are padded with zeros up to the maximum degree in y and
+    z, so that all the orders can be evaluated with the same array operation.
+
+    Arguments:
+        orders (Tuple(Tuple(int, int), ...)): The (m, n) degrees of the
+            polynomials to integrate.
+
+    Returns:
+        Tuple(ndarray, ndarray, ndarray, ndarray, ndarray): The coefficient
+        tensor with shape (p, j, k) already divided by the denominator, the
+        exponents of y_i and y_i+1 with shape (p, j) and the exponents of z_i
+        and z_i+1 with shape (p, k).
+    """
+    max_m = max(m for m, _ in orders)
+    max_n = max(n for _, n in orders)
+    coeffs = np.zeros((len(orders), max_m + 1, max_n + 1))
+    exp_y0 = np.zeros((len(orders), max_m + 1), dtype=int)
+    exp_z0 = np.zeros((len(orders), max_n + 1), dtype=int)
+    for p, (m, n) in enumerate(orders):
+        den = math.comb(m + n, n) * (m + n + 1) * (m + n + 2)
+        for j in range(m + 1):
+            for k in range(n + 1):
+                coeffs[p, j, k] = _coeff(m, n, j, k) / den
+        exp_y0[p, : m + 1] = m - np.arange(m + 1)
+        exp_z0[p, : n + 1] = n - np.arange(n + 1)
+    exp_y1 = np.tile(np.arange(max_m + 1), (len(orders), 1))
+    exp_z1 = np.tile(np.arange(max_n + 1), (len(orders), 1))
+    return coeffs, exp_y0, exp_y1, exp_z0, exp_z1
+
+
+def _marin_moments(
+    y: ArrayLike, z: ArrayLike, orders: t.Tuple[t.Tuple[int, int], ...]
+) -> np.ndarray:
+    """Integrate a set of monomials y^m * z^n over one or more polygons.
+
+    Arguments:
+        y (ArrayLike): Y coordinates of the closed polygon vertices, with
+            shape (v,) or (k, v) for a batch of k polygons.
+        z (ArrayLike): Z coordinates of the closed polygon vertices, with
+            the same shape as y.
+        orders (Tuple(Tuple(int, int), ...)): The (m, n) degrees of the
+            polynomials to integrate.
+
+    Returns:
+        ndarray: The integrals with shape (p,) or (k, p) where p is the number
+        of orders.
+    """
+    y = np.asarray(y, dtype=float)
+    z = np.asarray(z, dtype=float)
+    coeffs, exp_y0, exp_y1, exp_z0, exp_z1 = _coeff_tensor(orders)
+
+    y0, y1 = y[..., :-1], y[..., 1:]
+    z0, z1 = z[..., :-1], z[..., 1:]
+    cross = y0 * z1 - y1 * z0
+
+    # Powers of the edge end points with shape (..., edges, degree + 1)
+    pow_y0 = y0[..., None] ** np.arange(coeffs.shape[1])
+    pow_y1 = y1[..., None] ** np.arange(coeffs.shape[1])
+    pow_z0 = z0[..., None] ** np.arange(coeffs.shape[2])
+    pow_z1 = z1[..., None] ** np.arange(coeffs.shape[2])
+
+    # Terms of the sums over j and k with shape (..., edges, orders, j or k)
+    terms_y = pow_y0[..., exp_y0] * pow_y1[..., exp_y1]
+    terms_z = pow_z0[..., exp_z0] * pow_z1[..., exp_z1]
+
+    return np.einsum(
+        '...epj,pjk,...epk,...e->...p', terms_y, coeffs, terms_z, cross
+    )
+
+
 def marin_integration(
     y: t.List[float], z: t.List[float], m: int, n: int
 ) -> float:
@@ -33,15 +114,36 @@ def marin_integration(
     Returns:
         float: The result of the integrated polynomial.
     """
-    mom = 0
-    for i in range(len(y) - 1):
-        # Sum over j
-        ssj = 0
-        for j in range(m + 1):
-            # Sum over k
-            ssk = 0
-            for k in range(n + 1):
-                ssk += _coeff(m, n, j, k) * z[i] ** (n - k) * z[i + 1] ** k
-            ssj += ssk * y[i] ** (m - j) * y[i + 1] ** j
-        mom += ssj * (y[i] * z[i + 1] - y[i + 1] * z[i])
-    return mom / (math.comb(m + n, n) * (m + n + 1) * (m + n + 2))
+    return float(_marin_moments(y, z, ((m, n),))[0])
+
+
+def marin_integration_moments(
+    y: ArrayLike, z: ArrayLike, n: int
+) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute all area moments needed for the stress resultants at once.
+
+    For a stress field expressed as a polynomial of degree n - 1 in z, the
+    axial force and the bending moments are obtained from the area moments of
+    order (0, k), (0, k + 1) and (1, k) for k = 0, ..., n - 1. All of them are
+    evaluated with a single array operation.
+
+    Arguments:
+        y (ArrayLike): Y coordinates of the closed polygon vertices. Either a
+            one-dimensional array for a single polygon, or an array with
+            shape (k, v) for a batch of k polygons. Polygons with fewer
+            vertices can be stacked by repeating their last vertex.
+        z (ArrayLike): Z coordinates of the closed polygon vertices, with
+            the same shape as y.
+        n (int): The number of stress coefficients.
+
+    Returns:
+        Tuple(ndarray, ndarray, ndarray): The area moments for N, Mx and My,
+        each with shape (n,) or (k, n) for a batch of polygons.
+    """
+    orders = (
+        tuple((0, k) for k in range(n))
+        + tuple((0, k + 1) for k in range(n))
+        + tuple((1, k) for k in range(n))
+    )
+    moments = _marin_moments(y, z, orders)
+    return moments[..., :n], moments[..., n : 2 * n], moments[..., 2 * n :]
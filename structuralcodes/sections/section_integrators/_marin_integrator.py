@@ -7,20 +7,46 @@ from math import atan2, cos, sin
 
 import numpy as np
 from numpy.typing import ArrayLike
-from shapely import MultiLineString, MultiPolygon, Polygon
-from shapely.geometry.polygon import orient
 
-from structuralcodes.geometry import CompoundGeometry, create_line_point_angle
+from structuralcodes.core.base import ConstitutiveLaw
+from structuralcodes.geometry import CompoundGeometry
 
-from ._marin_integration import marin_integration
+from ._marin_integration import marin_integration_moments
+from ._prepared_section import PreparedSection
 from ._section_integrator import SectionIntegrator
 
 
 class MarinIntegrator(SectionIntegrator):
     """Section integrator based on the Marin algorithm."""
 
+    def prepare_triangulated_data(
+        self, geo: CompoundGeometry, **kwargs
+    ) -> PreparedSection:
+        """Prepare the arrays describing the geometry once for all.
+
+        The Marin algorithm does not need a triangulation, but integrates
+        over the rings of the prepared section, so that the geometry is never
+        rotated during the integration.
+
+        Arguments:
+            geo (CompoundGeometry): The geometry of the section.
+
+        Keyword Arguments:
+            tri (PreparedSection): The data from a previous call. If given,
+                it is returned as it is.
+            prepared (PreparedSection): The prepared section of geo. If
+                given, it is returned as it is.
+
+        Returns:
+            PreparedSection: The prepared section.
+        """
+        for key in ('tri', 'prepared'):
+            if kwargs.get(key) is not None:
+                return kwargs[key]
+        return PreparedSection(geo)
+
     def prepare_input(
-        self, geo: CompoundGeometry, strain: ArrayLike
+        self, geo: CompoundGeometry, strain: ArrayLike, **kwargs
     ) -> t.Tuple[float, t.Tuple[np.ndarray, np.ndarray, np.ndarray]]:
         """Prepare general input to the integration.
 
@@ -31,8 +57,9 @@ class MarinIntegrator(SectionIntegrator):
             strain (ArrayLike): The strains and curvatures of the section,
                 given in the format (ea, ky, kz) which are i) strain at 0,0,
                 ii) curvature y axis, iii) curvature z axis.
-            mesh_size: Percentage of area (number from 0 to 1) max for triangle
-                elements.
+            tri (PreparedSection): The data from a previous call of
+                prepare_triangulated_data.
+            prepared (PreparedSection): The prepared section of geo.
 
         Returns:
             Tuple(float, Tuple(ndarray, ndarray, ndarray)): The prepared input
@@ -51,21 +78,24 @@ class MarinIntegrator(SectionIntegrator):
         # The method should therefore return a tuple that collects the y, z,
         # and stress coefficients for each part.
         prepared_input = []
-        # 1. Rotate section in order to have neutral axis horizontal
+        prepared = self.prepare_triangulated_data(geo, **kwargs)
+        # 1. Rotate section in order to have neutral axis horizontal: the
+        # rotation is applied to the coordinates with a rotation matrix
         angle = -atan2(strain[2], strain[1])
+        T = np.array([[cos(angle), -sin(angle)], [sin(angle), cos(angle)]])
 
-        rotated_geom = geo.rotate(angle)
         # 2. Get y coordinate of neutral axis in this new CRS
         strain_rotated = [strain[0], (strain[2] ** 2 + strain[1] ** 2) ** 0.5]
 
-        # 3. For each SurfaceGeometry on the CompoundGeometry:
-        for g in rotated_geom.geometries:
+        # 3. For each ring of the SurfaceGeometries:
+        for x_ring, y_ring, material in prepared.rings():
+            x, y = T @ np.vstack((x_ring, y_ring))
             # 3a. get coefficients and strain limits from constitutive law
-            if hasattr(g.material, '__marin__'):
-                strains, coeffs = g.material.__marin__(strain=strain_rotated)
+            if hasattr(material, '__marin__'):
+                strains, coeffs = material.__marin__(strain=strain_rotated)
             else:
                 raise AttributeError(
-                    f'The material object {g.material} of geometry {g} does \
+                    f'The material object {material} of geometry {geo} does \
                     not have implement the __marin__ function. \
                     Please implement the function or use another integrator, \
                     like '
@@ -73,81 +103,73 @@ class MarinIntegrator(SectionIntegrator):
                     ''
                 )
 
-            # 3b. Subdivide the polygon at the different strain limits
-            def get_input_polygon(polygon, coeffs):
-                # Let's be sure to orient in the right way
-                if polygon.is_empty:
-                    return
-                polygon = orient(polygon, 1)
-                if not polygon.exterior.is_ccw:
-                    raise ValueError(
-                        'The exterior of a polygon should have vertices \
-                                    ordered ccw'
-                    )
-                # Manage exterior part
-                x, y = polygon.exterior.coords.xy
-                x = np.array(x)
-                y = np.array(y)
-                prepared_input.append(
-                    (0, np.array(x), np.array(y), np.array(coeffs))
-                )
-                # Manage holes
-                for i in polygon.interiors:
-                    if i.is_ccw:
-                        raise ValueError(
-                            'A inner hole should have cw coordinates'
-                        )
-                    x, y = i.coords.xy
-                    prepared_input.append(
-                        (0, np.array(x), np.array(y), np.array(coeffs))
-                    )
-
+            # 3b. Clip the ring to the strain bands
             if strains is None:
-                get_input_polygon(g.polygon, coeffs[0])
-            else:
-                for p in range(len(strains)):
-                    # Create the two lines for selecting the needed part
-                    y0 = (
-                        -(strain_rotated[0] - strains[p][0])
-                        / strain_rotated[1]
-                    )
-                    y1 = (
-                        -(strain_rotated[0] - strains[p][1])
-                        / strain_rotated[1]
-                    )
-                    if y0 > y1:
-                        y0, y1 = y1, y0
-                    bbox = g.polygon.bounds
-                    line0 = create_line_point_angle((0, y0), 0, bbox)
-                    line1 = create_line_point_angle((0, y1), 0, bbox)
-                    lines = MultiLineString((line0, line1))
-                    # intersection
-                    result = g.split_two_lines(lines=lines)
-
-                    if isinstance(result, Polygon):
-                        # If the result is a single polygon
-                        get_input_polygon(result, coeffs[p])
-                    elif isinstance(result, MultiPolygon):
-                        # If the result is a MultiPolygon
-                        for polygon in result.geoms:
-                            get_input_polygon(polygon, coeffs[p])
-        # Tentative proposal for managing reinforcement (PointGeometry)
-        x = []
-        y = []
-        F = []
-        for pg in rotated_geom.point_geometries:
-            xp, yp = pg._point.coords.xy
-            xp = xp[0]
-            yp = yp[0]
-            A = pg.area
-            strain = strain_rotated[0] + strain_rotated[1] * yp
-            x.append(xp)
-            y.append(yp)
-            F.append(pg.material.get_stress(strain)[0] * A)
-        prepared_input.append((1, np.array(x), np.array(y), np.array(F)))
+                prepared_input.append((0, x, y, np.array(coeffs[0])))
+                continue
+            # The ordinates of the strain limits of each band
+            limits = (
+                -(strain_rotated[0] - np.array(strains, dtype=float))
+                / strain_rotated[1]
+            )
+            lower, upper = limits.min(axis=1), limits.max(axis=1)
+            # Only bands overlapping the ring contribute
+            bands = (lower < y.max()) & (upper > y.min())
+            if not bands.any():
+                continue
+            x_bands, y_bands = _clip_ring_to_bands(
+                x, y, lower[bands], upper[bands]
+            )
+            # Pad the stress coefficients to the same degree
+            coeffs_bands = [c for c, b in zip(coeffs, bands) if b]
+            stress_coeff = np.zeros(
+                (len(coeffs_bands), max(len(c) for c in coeffs_bands))
+            )
+            for i, c in enumerate(coeffs_bands):
+                stress_coeff[i, : len(c)] = c
+            prepared_input.append((0, x_bands, y_bands, stress_coeff))
+        # 4. Reinforcement
+        prepared_input.append(
+            self._prepare_reinforcement_input(
+                prepared.point_groups(), T, strain_rotated
+            )
+        )
 
         return angle, prepared_input
 
+    @staticmethod
+    def _prepare_reinforcement_input(
+        points: t.Iterable[
+            t.Tuple[np.ndarray, np.ndarray, np.ndarray, ConstitutiveLaw]
+        ],
+        T: np.ndarray,
+        strain: ArrayLike,
+    ) -> t.Tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+        """Prepare the input for the reinforcement in the rotated CRS.
+
+        Arguments:
+            points (List): The coordinates, area and material of the points
+                grouped by material.
+            T (ndarray): The rotation matrix to the rotated CRS.
+            strain (ArrayLike): The strain profile in the rotated CRS, given
+                as (ea, k).
+
+        Returns:
+            Tuple(int, ndarray, ndarray, ndarray): The flag for reinforcement
+            and y, z and force for each point.
+        """
+        x = [np.zeros(0)]
+        y = [np.zeros(0)]
+        F = [np.zeros(0)]
+        # Arrays of points are evaluated at once for each material
+        for x_points, y_points, A, mat in points:
+            xp, yp = T @ np.vstack((x_points, y_points))
+            eps = strain[0] + strain[1] * yp
+            x.append(xp)
+            y.append(yp)
+            F.append(mat.get_stress(eps) * A)
+        return 1, np.hstack(x), np.hstack(y), np.hstack(F)
+
     def integrate(
         self,
         angle: float,
@@ -169,24 +191,22 @@ class MarinIntegrator(SectionIntegrator):
         # Loop through all parts of the section and add contributions
         for i, y, z, stress_coeff in prepared_input:
             if i == 0:
-                # Find integration order from shape of stress coeff array
-                n = stress_coeff.shape[0]
+                # Find integration order from shape of stress coeff array,
+                # that has a row for each band if the part is clipped to
+                # several strain bands
+                n = stress_coeff.shape[-1]
 
                 # Calculate area moments
-                area_moments_N = np.array(
-                    [marin_integration(y, z, 0, k) for k in range(n)]
-                )
-                area_moments_Mx = np.array(
-                    [marin_integration(y, z, 0, k + 1) for k in range(n)]
-                )
-                area_moments_My = np.array(
-                    [marin_integration(y, z, 1, k) for k in range(n)]
-                )
+                (
+                    area_moments_N,
+                    area_moments_Mx,
+                    area_moments_My,
+                ) = marin_integration_moments(y, z, n)
 
                 # Calculate contributions to stress resultants
-                N += sum(stress_coeff * area_moments_N)
-                Mx += sum(stress_coeff * area_moments_Mx)
-                My += sum(stress_coeff * area_moments_My)
+                N += np.sum(stress_coeff * area_moments_N)
+                Mx += np.sum(stress_coeff * area_moments_Mx)
+                My += np.sum(stress_coeff * area_moments_My)
             elif i == 1:
                 # Reinforcement
                 N += sum(stress_coeff)
@@ -210,13 +230,65 @@ class MarinIntegrator(SectionIntegrator):
                 given in the format (ea, ky, kz) which are i) strain at 0,0,
                 ii) curvature y axis, iii) curvature z axis.
 
+        Keyword Arguments:
+            tri (PreparedSection): The data from a previous call.
+            prepared (PreparedSection): The prepared section of geo.
+
         Returns:
-            Tuple(Tuple(float, float, float), Dict): The stress resultants N,
-            Mx and My and the triangulation data.
+            Tuple(Tuple(float, float, float), PreparedSection): The stress
+            resultants N, Mx and My and the prepared section.
         """
-        del kwargs
         # Prepare the general input based on the geometry and the input strains
-        angle, prepared_input = self.prepare_input(geo, strain)
+        kwargs['tri'] = self.prepare_triangulated_data(geo, **kwargs)
+        angle, prepared_input = self.prepare_input(geo, strain, **kwargs)
 
         # Return the calculated response
-        return *self.integrate(angle, prepared_input), None
+        return *self.integrate(angle, prepared_input), kwargs['tri']
+
+
+def _clip_ring_to_bands(
+    x: np.ndarray, y: np.ndarray, lower: np.ndarray, upper: np.ndarray
+) -> t.Tuple[np.ndarray, np.ndarray]:
+    """Clip a closed ring to several horizontal bands at once.
+
+    The points where the edges cross the limits of the bands are inserted in
+    the ring once for all the bands. Then, for each band, the ordinates are
+    clamped to the limits of the band: the parts of the ring outside the band
+    are replaced by segments lying on its limits, as with the
+    Sutherland-Hodgman algorithm. These segments can overlap each other, but
+    their contributions to integrals along the boundary cancel out, so the
+    clipped rings can be integrated with the Marin algorithm even when the
+    part of the polygon inside a band is not connected.
+
+    Arguments:
+        x (ndarray): The x coordinates of the closed ring.
+        y (ndarray): The y coordinates of the closed ring.
+        lower (ndarray): The lower limits of the bands.
+        upper (ndarray): The upper limits of the bands.
+
+    Returns:
+        Tuple(ndarray, ndarray): The x and y coordinates of the clipped rings
+        with shape (bands, vertices).
+    """
+    # The limits crossed by the ring
+    levels = np.unique(np.concatenate((lower, upper)))
+    levels = levels[(levels > y.min()) & (levels < y.max())]
+
+    # The crossings of each edge with each limit, with shape (edges, levels)
+    y_0, y_1 = y[:-1, None], y[1:, None]
+    edges, crossed = np.nonzero((y_0 - levels) * (y_1 - levels) < 0)
+    t_cross = (levels[crossed] - y[edges]) / (y[edges + 1] - y[edges])
+
+    # Insert the crossings sorting them along the ring
+    order = np.argsort(
+        np.concatenate((np.arange(len(x)), edges + t_cross)), kind='stable'
+    )
+    x_ring = np.concatenate(
+        (x, x[edges] + t_cross * (x[edges + 1] - x[edges]))
+    )[order]
+    y_ring = np.concatenate((y, levels[crossed]))[order]
+
+    return (
+        np.broadcast_to(x_ring, (len(lower), len(x_ring))),
+        np.clip(y_ring, lower[:, None], upper[:, None]),
+    )
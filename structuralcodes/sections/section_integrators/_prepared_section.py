@@ -0,0 +1,235 @@
+"""The arrays describing a section, shared by the section integrators."""
+
+from __future__ import annotations  # To have clean hints of ArrayLike in docs
+
+import typing as t
+
+import numpy as np
+from shapely import Polygon
+
+from structuralcodes.core.base import ConstitutiveLaw
+from structuralcodes.geometry import CompoundGeometry
+
+
+class PreparedSection:
+    """The arrays describing a section, extracted once from its geometry.
+
+    The coordinates of the rings of all the surface geometries are stored in
+    contiguous arrays, the points of all the point geometries as well, and
+    the materials in a table indexed by integers. The integrators never
+    access the shapely objects of the geometry, and the prepared section is
+    cheap to pickle, e.g. for sending it to other processes.
+
+    Attributes:
+        materials (List(ConstitutiveLaw)): The table of the materials.
+        x (numpy.Array): The x-coordinates of the vertices of all the rings.
+        y (numpy.Array): The y-coordinates of the vertices of all the rings.
+        ring_offsets (numpy.Array): The index of the first vertex of each
+            ring in x and y, followed by the total number of vertices. The
+            rings are closed, i.e. the last vertex of a ring is equal to the
+            first one.
+        ring_holes (numpy.Array): True for the rings that are holes. The
+            exteriors are ordered ccw and the holes cw.
+        ring_surfaces (numpy.Array): The index of the surface geometry of
+            each ring. The exterior of a surface is followed by its holes.
+        surface_materials (numpy.Array): The index in the material table of
+            each surface geometry.
+        point_x (numpy.Array): The x-coordinates of the points.
+        point_y (numpy.Array): The y-coordinates of the points.
+        point_area (numpy.Array): The area of the points.
+        point_materials (numpy.Array): The index in the material table of
+            each point.
+    """
+
+    materials: t.List[ConstitutiveLaw]
+    x: np.ndarray
+    y: np.ndarray
+    ring_offsets: np.ndarray
+    ring_holes: np.ndarray
+    ring_surfaces: np.ndarray
+    surface_materials: np.ndarray
+    point_x: np.ndarray
+    point_y: np.ndarray
+    point_area: np.ndarray
+    point_materials: np.ndarray
+
+    def __init__(self, geo: CompoundGeometry) -> None:
+        """Initialize a PreparedSection extracting the arrays from geo.
+
+        Arguments:
+            geo (CompoundGeometry): The geometry of the section.
+        """
+        self.materials = []
+        # The surface geometries
+        x, y, offsets = [], [], [0]
+        holes, surfaces, surface_materials = [], [], []
+        for i, g in enumerate(geo.geometries):
+            surface_materials.append(self._material_index(g.material))
+            for j, (x_ring, y_ring) in enumerate(_polygon_rings(g.polygon)):
+                x.append(x_ring)
+                y.append(y_ring)
+                offsets.append(offsets[-1] + len(x_ring))
+                holes.append(j > 0)
+                surfaces.append(i)
+        self.x = np.concatenate(x) if x else np.zeros(0)
+        self.y = np.concatenate(y) if y else np.zeros(0)
+        self.ring_offsets = np.array(offsets, dtype=int)
+        self.ring_holes = np.array(holes, dtype=bool)
+        self.ring_surfaces = np.array(surfaces, dtype=int)
+        self.surface_materials = np.array(surface_materials, dtype=int)
+
+        # The point geometries
+        x, y, area, materials = [np.zeros(0)], [np.zeros(0)], [np.zeros(0)], []
+        for pg in geo.point_geometries:
+            xp, yp = pg._point.coords.xy
+            x.append(np.array([xp[0]]))
+            y.append(np.array([yp[0]]))
+            area.append(np.array([pg.area]))
+            materials.append([self._material_index(pg.material)])
+        for pga in geo.point_geometry_arrays:
+            for xp, yp, areas, mat in pga.groups():
+                x.append(xp)
+                y.append(yp)
+                area.append(areas)
+                materials.append(
+                    np.full(len(xp), self._material_index(mat), dtype=int)
+                )
+        self.point_x = np.concatenate(x).astype(float)
+        self.point_y = np.concatenate(y).astype(float)
+        self.point_area = np.concatenate(area).astype(float)
+        self.point_materials = np.concatenate(
+            [np.zeros(0, dtype=int)] + [np.asarray(m) for m in materials]
+        ).astype(int)
+
+        # The prepared section is meant to be shared, make it immutable
+        for arr in (
+            self.x,
+            self.y,
+            self.ring_offsets,
+            self.ring_holes,
+            self.ring_surfaces,
+            self.surface_materials,
+            self.point_x,
+            self.point_y,
+            self.point_area,
+            self.point_materials,
+        ):
+            arr.setflags(write=False)
+
+    def _material_index(self, material: ConstitutiveLaw) -> int:
+        """Return the index of a material, adding it to the table if new."""
+        for i, mat in enumerate(self.materials):
+            if mat is material:
+                return i
+        self.materials.append(material)
+        return len(self.materials) - 1
+
+    @property
+    def n_rings(self) -> int:
+        """Returns the number of rings."""
+        return len(self.ring_holes)
+
+    @property
+    def n_surfaces(self) -> int:
+        """Returns the number of surface geometries."""
+        return len(self.surface_materials)
+
+    def ring(self, i: int) -> t.Tuple[np.ndarray, np.ndarray]:
+        """Return the coordinates of a ring.
+
+        Arguments:
+            i (int): The index of the ring.
+
+        Returns:
+            Tuple(ndarray, ndarray): The x- and y-coordinates of the closed
+            ring.
+        """
+        start, stop = self.ring_offsets[i], self.ring_offsets[i + 1]
+        return self.x[start:stop], self.y[start:stop]
+
+    def rings(
+        self,
+    ) -> t.Iterator[t.Tuple[np.ndarray, np.ndarray, ConstitutiveLaw]]:
+        """Iterates over the rings of the surface geometries.
+
+        Yields:
+            Tuple(ndarray, ndarray, ConstitutiveLaw): x-coordinates,
+            y-coordinates and material of each closed ring.
+        """
+        for i in range(self.n_rings):
+            material = self.materials[
+                self.surface_materials[self.ring_surfaces[i]]
+            ]
+            yield *self.ring(i), material
+
+    def surfaces(
+        self,
+    ) -> t.Iterator[
+        t.Tuple[t.List[t.Tuple[np.ndarray, np.ndarray]], ConstitutiveLaw]
+    ]:
+        """Iterates over the surface geometries.
+
+        Yields:
+            Tuple(List(Tuple(ndarray, ndarray)), ConstitutiveLaw): The
+            coordinates of the closed rings, starting with the exterior, and
+            the material of each surface geometry.
+        """
+        for i in range(self.n_surfaces):
+            rings = np.flatnonzero(self.ring_surfaces == i)
+            yield (
+                [self.ring(j) for j in rings],
+                self.materials[self.surface_materials[i]],
+            )
+
+    def point_groups(
+        self,
+    ) -> t.Iterator[
+        t.Tuple[np.ndarray, np.ndarray, np.ndarray, ConstitutiveLaw]
+    ]:
+        """Iterates over the points grouped by material.
+
+        Yields:
+            Tuple(ndarray, ndarray, ndarray, ConstitutiveLaw):
+            x-coordinates, y-coordinates, areas and material of the points
+            with the same material.
+        """
+        for i, material in enumerate(self.materials):
+            idx = self.point_materials == i
+            if not np.any(idx):
+                continue
+            yield (
+                self.point_x[idx],
+                self.point_y[idx],
+                self.point_area[idx],
+                material,
+            )
+
+
+def _polygon_rings(
+    polygon: Polygon,
+) -> t.List[t.Tuple[np.ndarray, np.ndarray]]:
+    """Return the coordinates of the rings of a polygon.
+
+    The exterior is ordered ccw and the holes cw, so that the integrals over
+    the holes are subtracted.
+
+    Arguments:
+        polygon (Polygon): The polygon.
+
+    Returns:
+        List(Tuple(ndarray, ndarray)): The x and y coordinates of the closed
+        rings, starting with the exterior.
+    """
+    if polygon.is_empty:
+        return []
+    rings = []
+    for ring, ccw in [(polygon.exterior, True)] + [
+        (interior, False) for interior in polygon.interiors
+    ]:
+        x, y = np.array(ring.coords).T
+        # Twice the signed area with the shoelace formula
+        area = np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1])
+        if (area > 0) != ccw:
+            x, y = x[::-1], y[::-1]
+        rings.append((x, y))
+    return rings
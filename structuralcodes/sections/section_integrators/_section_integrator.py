@@ -3,7 +3,9 @@
 from __future__ import annotations  # To have clean hints of ArrayLike in docs
 
 import abc
+import typing as t
 
+import numpy as np
 from numpy.typing import ArrayLike
 
 from structuralcodes.geometry import CompoundGeometry
@@ -47,3 +49,37 @@ class SectionIntegrator(abc.ABC):
         strains.
         """
         raise NotImplementedError
+
+    def integrate_strain_responses(
+        self, geo: CompoundGeometry, strains: ArrayLike, **kwargs
+    ) -> t.Tuple[np.ndarray, t.Any]:
+        """Integrate the response of a batch of strain profiles.
+
+        The default implementation calls integrate_strain_response_on_geometry
+        for each strain profile. Concrete integrators may override this method
+        with a vectorized implementation.
+
+        Arguments:
+            geo (CompoundGeometry): The geometry of the section.
+            strains (ArrayLike): The strain profiles as an array with shape
+                (k, 3), where each row is given in the format (ea, ky, kz).
+
+        Keyword Arguments:
+            **kwargs: Keyword arguments passed to
+                integrate_strain_response_on_geometry.
+
+        Returns:
+            Tuple(ndarray, Any): An array with shape (k, 3) collecting the
+            stress resultants N, Mx and My for each strain profile, and the
+            integration data returned by the integrator that can be stored and
+            used later (e.g. the triangulation data).
+        """
+        strains = np.atleast_2d(np.asarray(strains, dtype=float))
+        forces = np.zeros_like(strains)
+        tri = kwargs.pop('tri', None)
+        for i, strain in enumerate(strains):
+            N, Mx, My, tri = self.integrate_strain_response_on_geometry(
+                geo, strain, tri=tri, **kwargs
+            )
+            forces[i, :] = N, Mx, My
+        return forces, tri
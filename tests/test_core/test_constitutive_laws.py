@@ -515,3 +515,161 @@ def test_bilinearcompression(fc, eps_c, eps_cu):
     eps_min, eps_max = law.get_ultimate_strain(yielding=True)
     assert math.isclose(eps_min, -eps_c)
     assert math.isclose(eps_max, 100)
+
+
+def test_marin_discretization_cached():
+    """Test the discretization for Marin integration is cached per law."""
+    law = Sargin(fc=30, eps_c1=-0.0023, eps_cu1=-0.0035, k=2.04)
+
+    strains, coeffs = law.__marin__(strain=[-0.001, 1e-5])
+    discretized = law._discretized_law
+    strains_new, coeffs_new = law.__marin__(strain=[-0.001, 1e-5])
+
+    # The discretization is reused
+    assert law._discretized_law is discretized
+    assert strains_new == strains
+    assert_allclose(coeffs_new, coeffs)
+
+    # A different strain profile only shifts the coefficients
+    _, coeffs_shifted = law.__marin__(strain=[-0.002, 2e-5])
+    assert law._discretized_law is discretized
+    assert not np.allclose(coeffs_shifted, coeffs)
+
+    # Changing a parameter invalidates the discretization
+    law._fc = -40
+    _, coeffs_changed = law.__marin__(strain=[-0.001, 1e-5])
+    assert law._discretized_law is not discretized
+    assert_allclose(np.array(coeffs_changed), np.array(coeffs) * 40 / 30)
+
+
+@pytest.mark.parametrize(
+    'strain',
+    [[-0.001, 1e-5], [-0.001, 0], [0.0005, 0], [-0.005, 0], [0.1, 0]],
+)
+def test_user_defined_marin(strain):
+    """Test the Marin coefficients of the user defined law."""
+    x = [-0.0035, -0.002, 0, 0.001, 0.01]
+    y = [-30, -30, 0, 20, 25]
+    law = UserDefined(x, y)
+
+    strains, coeffs = law.__marin__(strain=list(strain))
+
+    if strain[1] == 0:
+        # Uniform strain: a single polynomial evaluated at the strain
+        assert strains is None
+        assert_allclose(coeffs[0][0], law.get_stress(strain[0])[0])
+    else:
+        assert strains == list(zip(x[:-1], x[1:]))
+        for (eps_a, eps_b), (a0, a1) in zip(strains, coeffs):
+            # The polynomial is the law as function of z
+            eps = np.linspace(eps_a, eps_b, 5)
+            z = (eps - strain[0]) / strain[1]
+            assert_allclose(a0 + a1 * z, law.get_stress(eps), atol=1e-8)
+
+
+@pytest.mark.parametrize(
+    'law, expected',
+    [
+        (ParabolaRectangle(fc=30), [-0.0035, -0.002, 0]),
+        (
+            BilinearCompression(fc=30, eps_c=0.00175, eps_cu=0.0035),
+            [
+                -0.0035,
+                -0.00175,
+                0,
+            ],
+        ),
+        (
+            ElasticPlastic(E=200000, fy=450, eps_su=0.0675),
+            [
+                -0.0675,
+                -0.00225,
+                0,
+                0.00225,
+                0.0675,
+            ],
+        ),
+        (Elastic(E=30000), [0]),
+        (
+            UserDefined([-0.0035, -0.002, 0, 0.001], [-30, -30, 0, 20]),
+            [-0.0035, -0.002, 0, 0.001],
+        ),
+    ],
+)
+def test_get_breakpoints(law, expected):
+    """Test the strains where the constitutive laws are not smooth."""
+    assert_allclose(law.get_breakpoints(), expected)
+
+
+@pytest.mark.parametrize(
+    'law_class, parameters, other_parameters',
+    [
+        (Elastic, {'E': 30000}, {'E': 35000}),
+        (
+            ElasticPlastic,
+            {'E': 200000, 'fy': 450, 'eps_su': 0.0675},
+            {'E': 200000, 'fy': 500, 'eps_su': 0.0675},
+        ),
+        (ParabolaRectangle, {'fc': 30}, {'fc': 30, 'eps_u': -0.003}),
+        (
+            BilinearCompression,
+            {'fc': 30, 'eps_c': 0.00175, 'eps_cu': 0.0035},
+            {'fc': 35, 'eps_c': 0.00175, 'eps_cu': 0.0035},
+        ),
+        (Sargin, {'fc': 30}, {'fc': 30, 'k': 2.1}),
+        (Popovics, {'fc': 30}, {'fc': 30, 'Ec': 30000}),
+        (
+            UserDefined,
+            {'x': [-0.0035, 0, 0.001], 'y': [-30, 0, 20]},
+            {'x': [-0.0035, 0, 0.001], 'y': [-30, 0, 25]},
+        ),
+    ],
+)
+def test_fingerprint(law_class, parameters, other_parameters):
+    """Test the fingerprint of the constitutive laws."""
+    law = law_class(**parameters)
+    fingerprint = law.fingerprint()
+
+    # Equal parameters give equal fingerprints, regardless the name
+    assert law_class(**parameters, name='other').fingerprint() == fingerprint
+    # Different parameters give different fingerprints
+    assert law_class(**other_parameters).fingerprint() != fingerprint
+
+    # The fingerprint is updated when an attribute is changed
+    assert law.fingerprint() is fingerprint
+    law.test_attribute = 1.0
+    assert law.fingerprint() != fingerprint
+
+
+def test_fingerprint_class():
+    """Test the fingerprint depends on the class of the law."""
+    assert Sargin(fc=30).fingerprint() != Popovics(fc=30).fingerprint()
+
+
+@pytest.mark.parametrize(
+    'law_class, parameters',
+    [
+        (Elastic, {'E': 30000}),
+        (ElasticPlastic, {'E': 200000, 'fy': 450, 'eps_su': 0.0675}),
+        (ParabolaRectangle, {'fc': 30}),
+        (Sargin, {'fc': 30}),
+    ],
+)
+@pytest.mark.parametrize('number', [float, np.float64])
+def test_fingerprint_numeric_types(law_class, parameters, number):
+    """Test equal laws share the fingerprint whatever the type of the
+    numbers.
+    """
+    other = {key: number(value) for key, value in parameters.items()}
+    assert (
+        law_class(**other).fingerprint()
+        == law_class(**parameters).fingerprint()
+    )
+
+
+def test_fingerprint_integer_types():
+    """Test numpy integers give the same fingerprint as int and float."""
+    fingerprint = Sargin(fc=30).fingerprint()
+    assert Sargin(fc=np.int64(30)).fingerprint() == fingerprint
+    assert Sargin(fc=30.0).fingerprint() == fingerprint
+    assert Sargin(fc=31).fingerprint() != fingerprint
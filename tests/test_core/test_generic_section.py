@@ -1,6 +1,7 @@
 """Tests for the Generic Section."""
 
 import math
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
@@ -8,6 +9,7 @@ from shapely import Polygon
 
 from structuralcodes.codes.ec2_2004 import reinforcement_duct_props
 from structuralcodes.geometry import (
+    PointGeometryArray,
     SurfaceGeometry,
     add_reinforcement,
     add_reinforcement_line,
@@ -281,6 +283,186 @@ def test_rectangular_section_nmm_domain():
     )
 
 
+@pytest.mark.parametrize('integrator', ['marin', 'fiber'])
+@pytest.mark.parametrize('pool', ['thread', 'process'])
+def test_nmm_domain_parallel(integrator, pool):
+    """Test that the parallel NMM interaction domain matches the serial."""
+    # Create materials to use
+    concrete = ConcreteMC2010(25)
+    steel = ReinforcementMC2010(fyk=450, Es=210000, ftk=450, epsuk=0.075)
+
+    # The section
+    poly = Polygon(((0, 0), (200, 0), (200, 400), (0, 400)))
+    geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement_line(geo, (40, 40), (160, 40), 16, steel, n=4)
+    geo = add_reinforcement_line(geo, (40, 360), (160, 360), 16, steel, n=4)
+    geo = geo.translate(-100, -200)
+
+    sec = GenericSection(geo, integrator=integrator, mesh_size=0.001)
+    calc = sec.section_calculator
+
+    # Compute the domain serially and in parallel
+    res_serial = calc.calculate_nmm_interaction_domain(num_theta=8)
+    if pool == 'thread':
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            res_parallel = calc.calculate_nmm_interaction_domain(
+                num_theta=8, executor=executor
+            )
+    else:
+        res_parallel = calc.calculate_nmm_interaction_domain(
+            num_theta=8, n_jobs=2
+        )
+
+    assert np.array_equal(res_serial.strains, res_parallel.strains)
+    assert np.array_equal(res_serial.forces, res_parallel.forces)
+    assert np.array_equal(res_serial.field_num, res_parallel.field_num)
+    assert res_parallel.field_num.shape == (res_parallel.forces.shape[0],)
+
+
+def test_fiber_mesh_not_rotated():
+    """Test that the fiber mesh is reused unchanged for any angle."""
+    # Create materials to use
+    concrete = ConcreteMC2010(25)
+    steel = ReinforcementMC2010(fyk=450, Es=210000, ftk=450, epsuk=0.075)
+
+    # The section
+    poly = Polygon(((0, 0), (200, 0), (200, 400), (0, 400)))
+    geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement_line(geo, (40, 40), (160, 40), 16, steel, n=4)
+    geo = add_reinforcement_line(geo, (40, 360), (160, 360), 16, steel, n=4)
+    geo = geo.translate(-100, -200)
+
+    sec_marin = GenericSection(geo)
+    sec_fiber = GenericSection(geo, integrator='Fiber', mesh_size=0.0001)
+    calc = sec_fiber.section_calculator
+
+    res_fiber = calc.calculate_bending_strength(theta=0.3, n=-1e5)
+    tri = calc.triangulated_data
+    x_before = [tr[0].copy() for tr in tri]
+
+    # Sweep the neutral axis and check the mesh is untouched
+    for theta in np.linspace(0, 2 * np.pi, 5):
+        calc.calculate_bending_strength(theta=theta, n=-1e5)
+    calc.calculate_moment_curvature(theta=1.2, n=-1e5)
+
+    assert calc.triangulated_data is tri
+    for tr, x in zip(calc.triangulated_data, x_before):
+        assert np.array_equal(tr[0], x)
+        assert not tr[0].flags.writeable
+
+    res_marin = sec_marin.section_calculator.calculate_bending_strength(
+        theta=0.3, n=-1e5
+    )
+    assert math.isclose(res_marin.m_y, res_fiber.m_y, rel_tol=2e-3)
+    assert math.isclose(res_marin.m_z, res_fiber.m_z, rel_tol=2e-3)
+
+
+@pytest.mark.parametrize('integrator', ['marin', 'fiber'])
+@pytest.mark.parametrize('n', [-1e6, -1e5, 0, 2e5])
+def test_newton_solver(integrator, n):
+    """Test that the Newton solver finds the same equilibrium of bisection."""
+    # Create materials to use
+    concrete = ConcreteMC2010(25)
+    steel = ReinforcementMC2010(fyk=450, Es=210000, ftk=450, epsuk=0.075)
+
+    # The section
+    poly = Polygon(((0, 0), (200, 0), (200, 400), (0, 400)))
+    geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement_line(geo, (40, 40), (160, 40), 16, steel, n=4)
+    geo = add_reinforcement_line(geo, (40, 360), (160, 360), 16, steel, n=4)
+    geo = geo.translate(-100, -200)
+
+    sec_bisection = GenericSection(geo, integrator=integrator, mesh_size=0.001)
+    sec_newton = GenericSection(
+        geo, integrator=integrator, solver='newton', mesh_size=0.001
+    )
+
+    # Compute bending strength
+    res_bisection = (
+        sec_bisection.section_calculator.calculate_bending_strength(
+            theta=0.3, n=n
+        )
+    )
+    res_newton = sec_newton.section_calculator.calculate_bending_strength(
+        theta=0.3, n=n
+    )
+    assert math.isclose(res_newton.m_y, res_bisection.m_y, rel_tol=1e-3)
+    assert math.isclose(res_newton.m_z, res_bisection.m_z, rel_tol=1e-3)
+
+    # Compute moment curvature
+    mc_bisection = sec_bisection.section_calculator.calculate_moment_curvature(
+        theta=0.3, n=n
+    )
+    mc_newton = sec_newton.section_calculator.calculate_moment_curvature(
+        theta=0.3, n=n
+    )
+    assert np.allclose(mc_newton.m_y, mc_bisection.m_y, rtol=1e-3, atol=1e3)
+    assert np.allclose(mc_newton.m_z, mc_bisection.m_z, rtol=1e-3, atol=1e3)
+
+
+def test_unknown_solver():
+    """Test that an unknown solver raises a ValueError."""
+    poly = Polygon(((0, 0), (200, 0), (200, 400), (0, 400)))
+    geo = SurfaceGeometry(poly, ConcreteMC2010(25))
+    with pytest.raises(ValueError):
+        GenericSection(geo, solver='secant')
+
+
+@pytest.mark.parametrize('integrator', ['marin', 'fiber'])
+def test_point_geometry_array_section(integrator):
+    """Test that an array of bars gives the same results of single bars."""
+    # Create materials to use
+    concrete = ConcreteMC2010(25)
+    steel = ReinforcementMC2010(fyk=450, Es=210000, ftk=450, epsuk=0.075)
+    other_steel = ReinforcementMC2010(fyk=500, Es=200000, ftk=550, epsuk=0.05)
+
+    # The section with single bars
+    poly = Polygon(((0, 0), (200, 0), (200, 400), (0, 400)))
+    concrete_geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement_line(
+        concrete_geo, (40, 40), (160, 40), 16, steel, n=4
+    )
+    geo = add_reinforcement_line(
+        geo, (40, 360), (160, 360), 12, other_steel, n=3
+    )
+    geo = geo.translate(-100, -200)
+
+    # The same section with an array of bars
+    coords = [[x, 40] for x in (40, 80, 120, 160)]
+    coords += [[x, 360] for x in (40, 100, 160)]
+    bars = PointGeometryArray(
+        coords,
+        [16] * 4 + [12] * 3,
+        [steel, other_steel],
+        [0] * 4 + [1] * 3,
+    )
+    geo_array = (concrete_geo + bars).translate(-100, -200)
+
+    sec = GenericSection(geo, integrator=integrator, mesh_size=0.001)
+    sec_array = GenericSection(
+        geo_array, integrator=integrator, mesh_size=0.001
+    )
+
+    # Gross properties
+    gp = sec.gross_properties
+    gp_array = sec_array.gross_properties
+    assert math.isclose(gp.area_reinforcement, gp_array.area_reinforcement)
+    assert math.isclose(gp.ea, gp_array.ea)
+    assert math.isclose(gp.mass, gp_array.mass)
+    assert math.isclose(gp.e_iyy, gp_array.e_iyy)
+
+    # Bending strength and balanced failure
+    for theta in (0, 0.7, np.pi):
+        res = sec.section_calculator.calculate_bending_strength(
+            theta=theta, n=-2e5
+        )
+        res_array = sec_array.section_calculator.calculate_bending_strength(
+            theta=theta, n=-2e5
+        )
+        assert math.isclose(res.m_y, res_array.m_y, rel_tol=1e-6, abs_tol=1)
+        assert math.isclose(res.m_z, res_array.m_z, rel_tol=1e-6, abs_tol=1)
+
+
 # Test rectangular section with Sargin Model
 def test_rectangular_section_Sargin():
     """Test rectangular section."""
@@ -447,6 +629,191 @@ def test_refined_moment_curvature():
     assert math.isclose(res_large_chi_first.chi_y[0], chi_yield / 10)
 
 
+@pytest.mark.parametrize('integrator', ['marin', 'fiber'])
+@pytest.mark.parametrize('theta, n', [(0, 0), (0.3, -5e5), (2, 2e5)])
+def test_moment_curvature_equilibrium(integrator, theta, n):
+    """Test each point of the moment-curvature relation is in equilibrium."""
+    geo = create_asymmetric_section().geometry
+    calc = GenericSection(geo, integrator=integrator).section_calculator
+
+    res = calc.calculate_moment_curvature(theta=theta, n=n)
+
+    for eps_a, chi_y, chi_z, m_y, m_z in zip(
+        res.eps_axial, res.chi_y, res.chi_z, res.m_y, res.m_z
+    ):
+        forces = calc.integrate_strain_profile([eps_a, chi_y, chi_z])
+        assert math.isclose(forces[0], n, abs_tol=1e-1)
+        assert math.isclose(forces[1], m_y, rel_tol=1e-6, abs_tol=1e-3)
+        assert math.isclose(forces[2], m_z, rel_tol=1e-6, abs_tol=1e-3)
+    # The curvature is perpendicular to the n.a.
+    assert np.allclose(
+        res.chi_z, res.chi_y * math.tan(theta), rtol=1e-8, atol=1e-20
+    )
+
+
+@pytest.mark.parametrize('theta, n', [(0, 0), (0.3, -5e5), (2, 2e5)])
+def test_adaptive_moment_curvature(theta, n):
+    """Test the adaptive steps of the moment-curvature relation."""
+    calc = create_asymmetric_section().section_calculator
+
+    res_default = calc.calculate_moment_curvature(theta=theta, n=n)
+    res = calc.calculate_moment_curvature(theta=theta, n=n, adaptive=True)
+    res_fine = calc.calculate_moment_curvature(
+        theta=theta, n=n, num_pre_yield=50, num_post_yield=100
+    )
+
+    # The first, yield and ultimate curvatures are kept
+    chi = np.hypot(res.chi_y, res.chi_z)
+    chi_default = np.hypot(res_default.chi_y, res_default.chi_z)
+    assert chi[0] == pytest.approx(chi_default[0])
+    assert np.isclose(chi, chi_default[9]).any()
+    assert chi[-1] == pytest.approx(chi_default[-1])
+    assert np.all(np.diff(chi) > 0)
+
+    # The relation is close to the fine one
+    chi_fine = np.hypot(res_fine.chi_y, res_fine.chi_z)
+    m_fine = np.hypot(res_fine.m_y, res_fine.m_z)
+    error = np.abs(
+        np.interp(chi_fine, chi, np.hypot(res.m_y, res.m_z)) - m_fine
+    ).max()
+    error_default = np.abs(
+        np.interp(
+            chi_fine, chi_default, np.hypot(res_default.m_y, res_default.m_z)
+        )
+        - m_fine
+    ).max()
+    assert error <= max(2 * error_default, 5e-3 * m_fine.max())
+
+    # Explicit curvatures are not changed
+    res_chi = calc.calculate_moment_curvature(
+        theta=theta, n=n, chi=chi_default[:5], adaptive=True
+    )
+    assert np.allclose(np.hypot(res_chi.chi_y, res_chi.chi_z), chi_default[:5])
+
+
+@pytest.mark.parametrize('integrator', ['marin', 'fiber'])
+@pytest.mark.parametrize('theta, n', [(0, 0), (0.3, -5e5), (0, -1e6)])
+def test_adaptive_moment_curvature_cost(monkeypatch, integrator, theta, n):
+    """Test the adaptive steps need fewer points and integrations."""
+    # Arrange
+    concrete = ConcreteMC2010(30)
+    steel = ReinforcementMC2010(fyk=500, Es=200000, ftk=540, epsuk=0.075)
+    poly = Polygon(((0, 0), (300, 0), (300, 600), (0, 600)))
+    geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement_line(geo, (40, 40), (260, 40), 20, steel, n=4)
+    geo = add_reinforcement_line(geo, (40, 560), (260, 560), 20, steel, n=4)
+    calc = GenericSection(
+        geo.translate(-150, -300), integrator=integrator, mesh_size=0.001
+    ).section_calculator
+    calc.check_axial_load(n)
+
+    # Count the integrations of the strain profiles and of the tangents
+    counter = {'integrations': 0}
+    for name in (
+        'integrate_strain_response_on_geometry',
+        'integrate_tangent_on_geometry',
+    ):
+        method = getattr(calc.integrator, name, None)
+        if method is None:
+            continue
+
+        def counted(*args, method=method, **kwargs):
+            counter['integrations'] += 1
+            return method(*args, **kwargs)
+
+        monkeypatch.setattr(calc.integrator, name, counted)
+
+    def run(adaptive):
+        counter['integrations'] = 0
+        res = calc.calculate_moment_curvature(
+            theta=theta, n=n, adaptive=adaptive
+        )
+        return np.hypot(res.chi_y, res.chi_z), counter['integrations']
+
+    # Act
+    chi_uniform, integrations_uniform = run(False)
+    chi, integrations = run(True)
+
+    # Assert
+    assert len(chi) < len(chi_uniform)
+    assert integrations < integrations_uniform
+    # The points cluster at yielding: the steps of the plastic branch start
+    # smaller than the uniform ones and grow away from yielding
+    chi_yield, chi_ultimate = chi_uniform[9], chi_uniform[-1]
+    i_yield = np.flatnonzero(chi == chi_yield)[0]
+    steps = np.diff(chi[i_yield:])
+    assert steps[0] < (chi_ultimate - chi_yield) / 10
+    assert steps[0] < steps.mean()
+    assert np.argmin(steps) <= 1
+
+
+@pytest.mark.parametrize('kink', np.linspace(0.5, 1, 11)[:-1])
+@pytest.mark.parametrize('step', [0.1, 0.25, 0.3])
+def test_adaptive_moment_curvature_targets(monkeypatch, kink, step):
+    """Test the target curvatures are kept whatever the steps."""
+    calc = create_asymmetric_section().section_calculator
+
+    # The curvature is imposed, and the moment drops after a kink shrinking
+    # the steps
+    def equilibrium(geom, n, curv, eps_0, **kwargs):
+        del geom, n, eps_0, kwargs
+        return [0.0, curv, 0.0]
+
+    def strain_profile(geom, strain, theta=None):
+        del geom, theta
+        return (
+            0.0,
+            1e6 * min(strain[1], kink) - 5e6 * max(strain[1] - kink, 0),
+            0.0,
+        )
+
+    monkeypatch.setattr(calc, 'find_equilibrium_fixed_curvature', equilibrium)
+    monkeypatch.setattr(
+        calc, '_integrate_strain_profile_in_crs', strain_profile
+    )
+
+    targets = [0.0, 1.0, 2.0]
+    chi, _, _ = calc._march_moment_curvature(
+        calc.section.geometry, 0.0, targets, [step, step], True, 0.0
+    )
+    for target in targets:
+        assert np.count_nonzero(chi == target) == 1
+    assert np.all(np.diff(chi) > 0)
+
+
+@pytest.mark.parametrize('integrator', ['marin', 'fiber'])
+@pytest.mark.parametrize('theta', [0, 0.3, 2])
+def test_moment_curvature_family(integrator, theta):
+    """Test the moment-curvature relations for several axial loads."""
+    geo = create_asymmetric_section().geometry
+    calc = GenericSection(geo, integrator=integrator).section_calculator
+    n = np.linspace(-1.2e6, 3e5, 6)
+
+    res = calc.calculate_moment_curvature_family(n, theta=theta)
+
+    assert len(res) == len(n)
+    assert res.m_y.shape == (len(n), 20)
+    for i, n_i in enumerate(n):
+        expected = calc.calculate_moment_curvature(theta=theta, n=n_i)
+        res_i = res[i]
+        assert res_i.n == n_i
+        assert res_i.theta == theta
+        for name in ('chi_y', 'chi_z', 'eps_axial', 'm_y', 'm_z'):
+            assert np.allclose(
+                getattr(res_i, name),
+                getattr(expected, name),
+                rtol=1e-5,
+                atol=1e-3 if name.startswith('m_') else 1e-12,
+            )
+
+
+def test_moment_curvature_family_axial_load():
+    """Test an axial load that cannot be carried raises an error."""
+    calc = create_asymmetric_section().section_calculator
+    with pytest.raises(ValueError):
+        calc.calculate_moment_curvature_family([-1e5, 2 * calc.n_max])
+
+
 def test_refined_mn_domain():
     """Test overriding defaults when calculating moment-curvature."""
     # Create materials to use
@@ -486,3 +853,237 @@ def test_refined_mn_domain():
     assert len(res_default.strains) == 35
     assert len(res_refined.strains) >= 0.9 * 100
     assert len(res_detailed.strains) == 107
+
+
+def test_fiber_refinement_moment_curvature():
+    """Test the moment curvature with refinement of the fibers."""
+    # Create materials to use
+    concrete = ConcreteMC2010(25)
+    steel = ReinforcementMC2010(fyk=450, Es=200000, ftk=450, epsuk=0.0675)
+
+    # The section
+    poly = Polygon(((0, 0), (200, 0), (200, 400), (0, 400)))
+    geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement_line(geo, (40, 40), (160, 40), 20, steel, n=3)
+    geo = add_reinforcement_line(geo, (40, 360), (160, 360), 20, steel, n=3)
+    geo = geo.translate(-100, -200)
+
+    sec_marin = GenericSection(geo)
+    sec_fiber = GenericSection(
+        geo, integrator='fiber', mesh_size=0.01, quadrature=3, refinement=3
+    )
+
+    mc_marin = sec_marin.section_calculator.calculate_moment_curvature(
+        theta=0, n=-2e5
+    )
+    mc_fiber = sec_fiber.section_calculator.calculate_moment_curvature(
+        theta=0, n=-2e5
+    )
+
+    # The coarse mesh is stored and reused
+    assert len(sec_fiber.section_calculator.triangulated_data[0].x) < 1000
+    assert np.allclose(mc_fiber.chi_y, mc_marin.chi_y, rtol=1e-4)
+    assert np.allclose(mc_fiber.m_y, mc_marin.m_y, rtol=1e-4)
+
+
+def create_asymmetric_section(**kwargs):
+    """Create a rectangular section with different top and bottom bars."""
+    concrete = ConcreteMC2010(25)
+    steel = ReinforcementMC2010(fyk=450, Es=210000, ftk=450, epsuk=0.0675)
+    poly = Polygon(((0, 0), (200, 0), (200, 400), (0, 400)))
+    geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement_line(geo, (40, 40), (160, 40), 16, steel, n=4)
+    geo = add_reinforcement_line(geo, (40, 360), (160, 360), 12, steel, n=2)
+    geo = geo.translate(-100, -200)
+    return GenericSection(geo, **kwargs)
+
+
+@pytest.mark.parametrize('solver', ['bisection', 'newton'])
+@pytest.mark.parametrize(
+    'theta, n', [(0, 0), (0.3, -5e5), (2, 1e5), (4, -1.2e6)]
+)
+def test_utilization(solver, theta, n):
+    """Test the utilization of a load on the ray of a bending strength."""
+    calc = create_asymmetric_section(solver=solver).section_calculator
+    strength = calc.calculate_bending_strength(theta=theta, n=n)
+    forces = np.array([strength.n, strength.m_y, strength.m_z])
+
+    res = calc.calculate_utilization(*(0.5 * forces))
+
+    assert math.isclose(res.utilization, 0.5, rel_tol=1e-4)
+    assert np.allclose([res.n, res.m_y, res.m_z], forces, rtol=1e-4, atol=1e-2)
+    assert math.isclose(math.cos(res.theta), math.cos(theta), abs_tol=1e-4)
+    assert math.isclose(math.sin(res.theta), math.sin(theta), abs_tol=1e-4)
+
+
+def test_utilization_nmm_domain():
+    """Test the utilization is the one of the NMM interaction domain."""
+    calc = create_asymmetric_section().section_calculator
+    nmm = calc.calculate_nmm_interaction_domain(num_theta=64)
+    loads = [
+        [-2e5, 5e7, 1e7],
+        [3e5, -1e7, 2e7],
+        [-1.5e6, 1e7, -3e7],
+        [0, 0, 4e7],
+        [-4e6, 1e6, 0],
+    ]
+    expected = nmm.get_utilization(loads)
+
+    for load, utilization in zip(loads, expected):
+        res = calc.calculate_utilization(*load)
+        assert math.isclose(res.utilization, utilization, rel_tol=1e-2)
+        # The ultimate forces are on the ray
+        assert np.allclose(
+            res.utilization * np.array([res.n, res.m_y, res.m_z]),
+            load,
+            rtol=1e-5,
+            atol=1,
+        )
+
+
+def test_utilization_axial_load():
+    """Test the utilization of axial loads on a symmetric section."""
+    concrete = ConcreteMC2010(25)
+    steel = ReinforcementMC2010(fyk=450, Es=210000, ftk=450, epsuk=0.0675)
+    poly = Polygon(((0, 0), (200, 0), (200, 400), (0, 400)))
+    geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement_line(geo, (40, 40), (160, 40), 16, steel, n=4)
+    geo = add_reinforcement_line(geo, (40, 360), (160, 360), 16, steel, n=4)
+    calc = GenericSection(geo.translate(-100, -200)).section_calculator
+
+    assert calc.calculate_utilization(0, 0, 0).utilization == 0
+    res = calc.calculate_utilization(n=-5e5)
+    assert math.isclose(res.utilization, -5e5 / calc.n_min)
+    assert res.n == calc.n_min
+    res = calc.calculate_utilization(n=1e4)
+    assert math.isclose(res.utilization, 1e4 / calc.n_max)
+
+
+@pytest.mark.parametrize('integrator', ['marin', 'fiber'])
+def test_integration_data_other_geometry(integrator):
+    """Test that the stored integration data is only used for the section
+    geometry.
+    """
+    # Arrange
+    sec = create_asymmetric_section(integrator=integrator, mesh_size=0.001)
+    calc = sec.section_calculator
+    strain = [-0.001, 2e-5, 0.0]
+    # Store the integration data of the section geometry
+    calc.calculate_limit_axial_load()
+    tri = calc.triangulated_data
+    rotated_geom = sec.geometry.rotate(0.5)
+
+    # Act
+    N, My, Mz = calc._integrate_strain_profile_in_crs(rotated_geom, strain)
+    expected = calc.integrator.integrate_strain_response_on_geometry(
+        rotated_geom, strain, mesh_size=0.001
+    )
+
+    # Assert
+    assert tri is not None
+    assert calc.triangulated_data is tri
+    assert np.allclose([N, My, Mz], expected[:3], rtol=1e-3)
+
+
+@pytest.mark.parametrize('yielding', [False, True])
+def test_balanced_failure_strain(yielding):
+    """Test the balanced failure with many bars."""
+    # Arrange
+    concrete = ConcreteMC2010(25)
+    steel = ReinforcementMC2010(fyk=450, Es=210000, ftk=450, epsuk=0.0675)
+    poly = Polygon(((0, 0), (1000, 0), (1000, 1000), (0, 1000)))
+    geo = SurfaceGeometry(poly, concrete)
+    for i in range(50):
+        geo = add_reinforcement(geo, (40 + 18 * i, 50 + 10 * i), 16, steel)
+    sec = GenericSection(geo)
+    eps_c = sec.geometry.geometries[0].material.get_ultimate_strain(
+        yielding=yielding
+    )[0]
+    eps_s = sec.geometry.point_geometries[0].material.get_ultimate_strain(
+        yielding=yielding
+    )[1]
+
+    # Act
+    y_n, y_p, strain = sec.section_calculator.get_balanced_failure_strain(
+        sec.geometry, yielding
+    )
+
+    # Assert
+    # The lowest bar and the top of the concrete govern
+    assert math.isclose(y_n, 1000)
+    assert math.isclose(y_p, 50)
+    assert math.isclose(strain[0] + strain[1] * y_n, eps_c)
+    assert math.isclose(strain[0] + strain[1] * y_p, eps_s)
+    assert strain[2] == 0
+
+
+@pytest.mark.parametrize('parallel', [False, True])
+def test_iter_nmm_interaction_domain(parallel):
+    """Test streaming the slices of the NMM interaction domain."""
+    # Arrange
+    sec = create_asymmetric_section()
+    calc = sec.section_calculator
+    received = []
+    executor = ThreadPoolExecutor(max_workers=2) if parallel else None
+
+    # Act
+    domain = calc.calculate_nmm_interaction_domain(num_theta=8, num=20)
+    slices = list(
+        calc.iter_nmm_interaction_domain(
+            num_theta=8, num=20, executor=executor, sink=received.append
+        )
+    )
+    if executor is not None:
+        executor.shutdown()
+
+    # Assert
+    assert len(slices) == 8
+    assert all(a is b for a, b in zip(received, slices))
+    assert np.allclose(
+        [nmm_slice.theta for nmm_slice in slices],
+        np.linspace(0, 2 * np.pi, 8),
+    )
+    assert np.allclose(
+        np.vstack([nmm_slice.forces for nmm_slice in slices]), domain.forces
+    )
+    assert np.allclose(
+        np.vstack([nmm_slice.strains for nmm_slice in slices]),
+        domain.strains,
+    )
+    assert np.array_equal(
+        np.concatenate([nmm_slice.field_num for nmm_slice in slices]),
+        domain.field_num,
+    )
+
+
+def test_iter_nmm_interaction_domain_window():
+    """Test the slices are submitted to the executor in windows."""
+
+    class CountingExecutor(ThreadPoolExecutor):
+        """A thread pool counting the submitted calls."""
+
+        submitted = 0
+
+        def submit(self, *args, **kwargs):
+            self.submitted += 1
+            return super().submit(*args, **kwargs)
+
+    # Arrange
+    calc = create_asymmetric_section().section_calculator
+
+    # Act
+    with CountingExecutor(max_workers=2) as executor:
+        slices = calc.iter_nmm_interaction_domain(
+            num_theta=32, num=20, executor=executor
+        )
+        first = next(slices)
+        submitted = executor.submitted
+        slices.close()
+        submitted_closed = executor.submitted
+
+    # Assert
+    assert first.theta == 0
+    # The slice yielded and one window of slices
+    assert submitted == 3
+    # Nothing is submitted after closing
+    assert submitted_closed == submitted
@@ -1,6 +1,9 @@
 """Tests for the Geometry."""
 
 import math
+import subprocess
+import sys
+from pathlib import Path
 
 import numpy as np
 import pytest
@@ -12,9 +15,13 @@ from structuralcodes.geometry import (
     CompoundGeometry,
     Geometry,
     PointGeometry,
+    PointGeometryArray,
     SurfaceGeometry,
     add_reinforcement,
+    add_reinforcement_circle,
+    add_reinforcement_grid,
     add_reinforcement_line,
+    add_reinforcement_lines,
     create_line_point_angle,
 )
 from structuralcodes.materials.concrete import ConcreteMC2010
@@ -124,6 +131,130 @@ def test_point_geometry():
     assert isinstance(p.material, ParabolaRectangle)
 
 
+def test_point_geometry_array():  # noqa: PLR0915
+    """Test creating a PointGeometryArray object."""
+    # Create consitutive laws to use
+    steel = ElasticPlastic(210000, 450)
+    other_steel = ElasticPlastic(200000, 500)
+    coords = np.array([[0, 0], [100, 0], [100, 50], [0, 50]])
+
+    # A single material
+    pga = PointGeometryArray(coords, 12, steel, group_label='Bars')
+    assert len(pga) == 4
+    assert pga.group_label == 'Bars'
+    assert np.allclose(pga.x, coords[:, 0])
+    assert np.allclose(pga.y, coords[:, 1])
+    assert np.allclose(pga.diameters, 12)
+    assert np.allclose(pga.areas, 6**2 * np.pi)
+    assert math.isclose(pga.area, 4 * 6**2 * np.pi)
+    assert pga.materials == [steel]
+    assert not pga.coords.flags.writeable
+
+    # More materials and diameters
+    pga = PointGeometryArray(
+        coords, [12, 16, 16, 12], [steel, other_steel], [0, 1, 1, 0]
+    )
+    groups = list(pga.groups())
+    assert len(groups) == 2
+    assert np.allclose(groups[0][0], [0, 0])
+    assert np.allclose(groups[1][2], 8**2 * np.pi)
+    assert groups[1][3] is other_steel
+    points = pga.to_point_geometries()
+    assert len(points) == 4
+    assert points[1].material is other_steel
+    assert math.isclose(points[1].diameter, 16)
+
+    # Translate and rotate
+    moved = pga.translate(10, -5)
+    assert np.allclose(moved.coords, coords + [10, -5])
+    assert np.allclose(pga.coords, coords)
+    rotated = pga.rotate(90, use_radians=False)
+    assert np.allclose(rotated.x, -coords[:, 1])
+    assert np.allclose(rotated.y, coords[:, 0])
+    rotated = pga.rotate(np.pi, point=(50, 25))
+    assert np.allclose(rotated.coords, [[100, 50], [0, 50], [0, 0], [100, 0]])
+
+    # From geometry
+    elastic = pga.from_geometry(pga)
+    assert isinstance(elastic.materials[1], Elastic)
+    assert math.isclose(elastic.materials[1].get_tangent(0)[0], 200000)
+    elastic = PointGeometryArray.from_geometry(pga, Elastic(100))
+    assert all(isinstance(m, Elastic) for m in elastic.materials)
+    with pytest.raises(TypeError):
+        PointGeometryArray.from_geometry(pga, 'steel')
+    with pytest.raises(TypeError):
+        PointGeometryArray.from_geometry(points[0])
+
+    # Wrong input
+    with pytest.raises(ValueError):
+        PointGeometryArray(coords, 12, [steel, other_steel])
+    with pytest.raises(ValueError):
+        PointGeometryArray(coords, 12, [steel, other_steel], [0, 1, 2, 0])
+    with pytest.raises(ValueError):
+        PointGeometryArray(coords, 12, steel, [0, 0])
+    with pytest.raises(TypeError):
+        PointGeometryArray(coords, 12, 'steel')
+
+    # Material with density
+    C25 = ConcreteMC2010(25)
+    pga = PointGeometryArray(coords, 12, C25)
+    assert isinstance(pga.materials[0], ParabolaRectangle)
+    assert pga.densities == [C25.density]
+
+
+def test_compound_geometry_point_geometry_array():
+    """Test a CompoundGeometry with a PointGeometryArray."""
+    concrete = ConcreteMC2010(25)
+    steel = ElasticPlastic(210000, 450)
+    poly = SurfaceGeometry(
+        Polygon(((0, 0), (200, 0), (200, 400), (0, 400))), concrete
+    )
+    pga = PointGeometryArray([[40, 40], [160, 40]], 16, steel)
+
+    geo = poly + pga
+    assert isinstance(geo, CompoundGeometry)
+    assert geo.point_geometry_arrays == [pga]
+    assert len(geo.geom.geoms) == 3
+
+    # Adding other geometries keeps the array
+    geo = geo + PointGeometry((100, 360), 16, steel)
+    assert len(geo.point_geometries) == 1
+    assert geo.point_geometry_arrays == [pga]
+
+    # Transformations are applied to the array
+    moved = geo.translate(-100, -200)
+    assert np.allclose(moved.point_geometry_arrays[0].y, [-160, -160])
+    rotated = geo.rotate(np.pi)
+    assert np.allclose(rotated.point_geometry_arrays[0].x, [-40, -160])
+    assert geo - pga is geo
+    assert (geo - poly).point_geometry_arrays == [pga]
+    elastic = CompoundGeometry.from_geometry(geo)
+    assert isinstance(elastic.point_geometry_arrays[0].materials[0], Elastic)
+
+
+def test_compound_geometry_lazy_representation():
+    """Test the svg representation is computed only when needed."""
+    concrete = ConcreteMC2010(25)
+    steel = ElasticPlastic(210000, 450)
+    poly = Polygon(((0, 0), (200, 0), (200, 400), (0, 400)))
+    geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement_line(geo, (40, 40), (160, 40), 16, steel, n=4)
+
+    rotated = geo.rotate(np.pi / 3)
+    assert rotated._geom is None
+    assert len(rotated.geom.geoms) == 5
+    assert rotated.geom is rotated.geom
+    assert rotated._repr_svg_() == str(rotated.geom._repr_svg_())
+
+    # Created from a MultiPolygon
+    geo = CompoundGeometry(
+        MultiPolygon([poly, translate(poly, 300)]), concrete
+    )
+    assert geo._geom is None
+    assert geo.reinforced_concrete
+    assert len(geo.geom.geoms) == 2
+
+
 # Test Surface Geometry
 def test_surface_geometry():  # noqa: PLR0915
     """Test creating a SurfaceGeometry object."""
@@ -382,6 +513,75 @@ def test_add_geometries():
         assert_geometries_equal(polys[i], p.polygon)
 
 
+def test_add_reinforcement_bulk():
+    """Test adding reinforcement in bulk as arrays of bars."""
+    concrete = ConcreteMC2010(25)
+    steel = ElasticPlastic(210000, 450)
+    geo = SurfaceGeometry(
+        Polygon(((0, 0), (200, 0), (200, 400), (0, 400))), concrete
+    )
+
+    # Lines give the same bars of add_reinforcement_line
+    geo_lines = add_reinforcement_lines(
+        geo,
+        [(40, 40), (40, 360)],
+        [(160, 40), (160, 360)],
+        20,
+        steel,
+        s=30,
+        first=False,
+    )
+    geo_line = add_reinforcement_line(
+        geo, (40, 40), (160, 40), 20, steel, s=30, first=False
+    )
+    geo_line = add_reinforcement_line(
+        geo_line, (40, 360), (160, 360), 20, steel, s=30, first=False
+    )
+    assert len(geo_lines.geometries) == 1
+    assert len(geo_lines.point_geometries) == 0
+    assert len(geo_lines.point_geometry_arrays) == 1
+    bars = geo_lines.point_geometry_arrays[0]
+    assert len(bars) == len(geo_line.point_geometries) == 8
+    for xy, pg in zip(bars.coords, geo_line.point_geometries):
+        assert np.allclose(xy, (pg.x, pg.y))
+    with pytest.raises(ValueError):
+        add_reinforcement_lines(
+            geo, [(40, 40)], [(160, 40), (1, 1)], 20, steel
+        )
+
+    # Grid
+    geo_grid = add_reinforcement_grid(
+        geo, (40, 40), (160, 360), 20, steel, n_x=3, n_y=4
+    )
+    bars = geo_grid.point_geometry_arrays[0]
+    assert len(bars) == 12
+    assert np.allclose(np.unique(bars.x), [40, 100, 160])
+    geo_grid = add_reinforcement_grid(
+        geo_grid, (40, 40), (160, 360), 20, steel, n_x=3, n_y=4, perimeter=True
+    )
+    assert len(geo_grid.point_geometry_arrays) == 2
+    bars = geo_grid.point_geometry_arrays[1]
+    assert len(bars) == 10
+    assert not np.any(np.isclose(bars.x, 100) & (bars.y > 40) & (bars.y < 360))
+    with pytest.raises(ValueError):
+        add_reinforcement_grid(geo, (40, 40), (160, 360), 20, steel, 0, 4)
+
+    # Circle
+    geo_circle = add_reinforcement_circle(
+        geo, (100, 200), 80, 20, steel, n=8, first_angle=np.pi / 8
+    )
+    bars = geo_circle.point_geometry_arrays[0]
+    assert len(bars) == 8
+    assert np.allclose(np.hypot(bars.x - 100, bars.y - 200), 80)
+    assert math.isclose(
+        math.atan2(bars.y[0] - 200, bars.x[0] - 100), np.pi / 8
+    )
+    geo_circle = add_reinforcement_circle(geo, (100, 200), 80, 20, steel, s=60)
+    assert len(geo_circle.point_geometry_arrays[0]) == 9
+    with pytest.raises(ValueError):
+        add_reinforcement_circle(geo, (100, 200), 80, 20, steel)
+
+
 def test_sub_geometries():
     """Test subtraction between geometries."""
     mat = ElasticPlastic(E=206000, fy=300)
@@ -562,3 +762,74 @@ def test_property_reinforced_concrete(w, h, c):
         n=4,
     )
     assert geo_rc.reinforced_concrete
+
+
+def create_fingerprint_geometry(fc=25, diameter=16):
+    """Create a reinforced geometry for testing fingerprints."""
+    concrete = ConcreteMC2010(fc)
+    steel = ElasticPlastic(E=200000, fy=450, eps_su=0.0675)
+    poly = Polygon(
+        ((0, 0), (200, 0), (200, 400), (0, 400)),
+        [((50, 100), (150, 100), (150, 300), (50, 300))],
+    )
+    geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement(geo, (25, 25), diameter, steel)
+    return add_reinforcement_grid(
+        geo, (40, 40), (160, 360), diameter, steel, n_x=3, n_y=4
+    )
+
+
+def test_fingerprint():
+    """Test the fingerprint of the geometries."""
+    geo = create_fingerprint_geometry()
+    fingerprint = geo.fingerprint()
+
+    # Equal geometries have equal fingerprints
+    assert fingerprint == create_fingerprint_geometry().fingerprint()
+    assert isinstance(fingerprint, str)
+    for g in geo.geometries + geo.point_geometries + geo.point_geometry_arrays:
+        assert g.fingerprint() == g.translate(0, 0).fingerprint()
+
+    # The name is not relevant
+    bar = geo.point_geometries[0]
+    renamed = PointGeometry(
+        bar.point, bar.diameter, bar.material, name='bar', group_label='a'
+    )
+    assert renamed.fingerprint() == bar.fingerprint()
+
+    # Changes of the coordinates, diameters and materials are detected
+    assert geo.translate(1, 0).fingerprint() != fingerprint
+    assert geo.rotate(0.1).fingerprint() != fingerprint
+    assert create_fingerprint_geometry(diameter=20).fingerprint() != (
+        fingerprint
+    )
+    assert create_fingerprint_geometry(fc=30).fingerprint() != fingerprint
+    geo.point_geometry_arrays[0].materials[0]._fy = 500
+    assert geo.fingerprint() != fingerprint
+
+
+def test_fingerprint_holes():
+    """Test the fingerprint depends on the holes."""
+    concrete = ConcreteMC2010(25)
+    exterior = ((0, 0), (200, 0), (200, 400), (0, 400))
+    hole = ((50, 100), (150, 100), (150, 300), (50, 300))
+    geo = SurfaceGeometry(Polygon(exterior), concrete)
+    geo_hole = SurfaceGeometry(Polygon(exterior, [hole]), concrete)
+    assert geo.fingerprint() != geo_hole.fingerprint()
+
+
+def test_fingerprint_stable():
+    """Test the fingerprint is the same in a new process."""
+    code = (
+        'from tests.test_core.test_geometry import '
+        'create_fingerprint_geometry;'
+        'print(create_fingerprint_geometry().fingerprint())'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parents[2],
+    )
+    assert result.stdout.strip() == create_fingerprint_geometry().fingerprint()
@@ -3,9 +3,12 @@
 import math
 
 import numpy as np
+import pytest
 
 from structuralcodes.sections.section_integrators._marin_integration import (
+    _coeff,
     marin_integration,
+    marin_integration_moments,
 )
 
 
@@ -116,3 +119,67 @@ def test_area_moments_triangle():
     assert math.isclose(area_marin, area)
     assert math.isclose(I_y_marin, I_y)
     assert math.isclose(I_z_marin, I_z)
+
+
+def _marin_integration_loop(y, z, m, n):
+    """Reference implementation of Marin integration with plain loops."""
+    mom = 0
+    for i in range(len(y) - 1):
+        ssj = 0
+        for j in range(m + 1):
+            ssk = 0
+            for k in range(n + 1):
+                ssk += _coeff(m, n, j, k) * z[i] ** (n - k) * z[i + 1] ** k
+            ssj += ssk * y[i] ** (m - j) * y[i + 1] ** j
+        mom += ssj * (y[i] * z[i + 1] - y[i + 1] * z[i])
+    return mom / (math.comb(m + n, n) * (m + n + 1) * (m + n + 2))
+
+
+@pytest.mark.parametrize('n', [1, 2, 3])
+def test_area_moments_vectorized(n):
+    """Test that the moments for N, Mx and My match the scalar algorithm."""
+    # Arrange
+    y = np.array([-120.0, 80.0, 150.0, 30.0, -90.0, -120.0])
+    z = np.array([-200.0, -210.0, 40.0, 250.0, 160.0, -200.0])
+
+    # Act
+    mom_N, mom_Mx, mom_My = marin_integration_moments(y, z, n)
+
+    # Assert
+    for k in range(n):
+        assert math.isclose(mom_N[k], _marin_integration_loop(y, z, 0, k))
+        assert math.isclose(mom_Mx[k], _marin_integration_loop(y, z, 0, k + 1))
+        assert math.isclose(mom_My[k], _marin_integration_loop(y, z, 1, k))
+
+
+def test_area_moments_batch_of_polygons():
+    """Test integrating a stacked batch of polygons padded to same length."""
+    # Arrange
+    width = 200
+    height = 500
+    y_rect = np.array(
+        [-width / 2, width / 2, width / 2, -width / 2, -width / 2]
+    )
+    z_rect = np.array(
+        [-height / 2, -height / 2, height / 2, height / 2, -height / 2]
+    )
+    # A triangle padded repeating its closing vertex
+    y_tri = np.array([0.0, 500.0, 200.0, 0.0, 0.0])
+    z_tri = np.array([0.0, 0.0, 600.0, 0.0, 0.0])
+
+    # Act
+    mom_N, mom_Mx, mom_My = marin_integration_moments(
+        np.vstack((y_rect, y_tri)), np.vstack((z_rect, z_tri)), 3
+    )
+
+    # Assert
+    assert mom_N.shape == (2, 3)
+    assert math.isclose(mom_N[0, 0], width * height)
+    assert math.isclose(mom_N[1, 0], 0.5 * 500 * 600)
+    assert math.isclose(mom_Mx[0, 1], 1 / 12 * width * height**3)
+    assert math.isclose(mom_N[1, 2], 1 / 12 * 500 * 600**3)
+    assert math.isclose(mom_My[0, 0], 0.0, abs_tol=1e-6)
+    for k in range(3):
+        assert math.isclose(
+            mom_My[1, k], marin_integration(y_tri, z_tri, 1, k)
+        )
@@ -0,0 +1,325 @@
+"""Tests for the cache of the results of the section calculations."""
+
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from shapely import Polygon
+
+from structuralcodes.core._section_results import NMMInteractionDomain
+from structuralcodes.geometry import (
+    CompoundGeometry,
+    SurfaceGeometry,
+    add_reinforcement_line,
+)
+from structuralcodes.materials.concrete import ConcreteMC2010
+from structuralcodes.materials.reinforcement import ReinforcementMC2010
+from structuralcodes.sections import (
+    DomainStore,
+    GenericSection,
+    GenericSectionCalculator,
+    ResultCache,
+)
+
+
+def create_geometry():
+    """Create a reinforced concrete rectangular geometry."""
+    concrete = ConcreteMC2010(25)
+    steel = ReinforcementMC2010(fyk=450, Es=210000, ftk=450, epsuk=0.0675)
+    poly = Polygon(((0, 0), (200, 0), (200, 400), (0, 400)))
+    geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement_line(geo, (40, 40), (160, 40), 16, steel, n=4)
+    geo = add_reinforcement_line(geo, (40, 360), (160, 360), 16, steel, n=4)
+    return geo.translate(-100, -200)
+
+
+def test_result_cache_lru():
+    """Test the least recently used results are discarded."""
+    cache = ResultCache(maxsize=2)
+    cache.put('a', [1])
+    cache.put('b', [2])
+    # Using a moves b at the beginning
+    assert cache.get('a') == [1]
+    cache.put('c', [3])
+
+    assert len(cache) == 2
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == cache.misses == 0
+
+
+def test_result_cache_copies():
+    """Test the stored results can not be changed from outside."""
+    cache = ResultCache()
+    value = np.zeros(3)
+    cache.put('a', value)
+    value[0] = 1
+    result = cache.get('a')
+    result[1] = 1
+    assert np.array_equal(cache.get('a'), np.zeros(3))
+
+
+def test_result_cache_threads():
+    """Test the cache can be used by several threads at once."""
+    cache = ResultCache(maxsize=8)
+    # Switch threads often, so that they interleave inside the methods
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def use(i):
+        for j in range(2000):
+            key = (i + j) % 16
+            if cache.get(key) is None:
+                cache.put(key, [key])
+        return True
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert all(executor.map(use, range(8)))
+    finally:
+        sys.setswitchinterval(interval)
+    assert len(cache) == 8
+    assert cache.hits + cache.misses == 8 * 2000
+
+
+def test_result_cache_pickle():
+    """Test the cache can be sent to other processes."""
+    cache = ResultCache(maxsize=4)
+    cache.put('a', [1])
+    cache_new = pickle.loads(pickle.dumps(cache))
+    assert cache_new.get('a') == [1]
+    cache_new.put('b', [2])
+    assert len(cache_new) == 2
+
+
+@pytest.mark.parametrize('maxsize', [0, -1])
+def test_result_cache_maxsize(maxsize):
+    """Test an invalid size of the cache raises an error."""
+    with pytest.raises(ValueError):
+        ResultCache(maxsize=maxsize)
+
+
+def test_calculator_cache():
+    """Test the results of the calculator are cached."""
+    sec = GenericSection(create_geometry(), cache=16)
+    calc = sec.section_calculator
+    assert isinstance(calc.cache, ResultCache)
+    assert calc.cache.maxsize == 16
+
+    res = calc.calculate_bending_strength(theta=0.3, n=-1e5)
+    misses = calc.cache.misses
+    res_cached = calc.calculate_bending_strength(theta=0.3, n=-1e5)
+    assert calc.cache.misses == misses
+    assert calc.cache.hits == 1
+    assert res_cached is not res
+    assert res_cached.m_y == res.m_y
+    assert res_cached.m_z == res.m_z
+
+    # Other arguments are computed
+    calc.calculate_bending_strength(theta=0.3, n=-2e5)
+    assert calc.cache.misses > misses
+
+    # Explicit invalidation
+    calc.clear_cache()
+    assert len(calc.cache) == 0
+    calc.calculate_bending_strength(theta=0.3, n=-1e5)
+    assert calc.cache.hits == 0
+
+
+def test_calculator_cache_domain():
+    """Test the interaction domains are cached."""
+    sec = GenericSection(create_geometry(), cache=16)
+    calc = sec.section_calculator
+
+    res = calc.calculate_nmm_interaction_domain(num_theta=8)
+    hits = calc.cache.hits
+    res_cached = calc.calculate_nmm_interaction_domain(num_theta=8)
+    assert np.array_equal(res.forces, res_cached.forces)
+    assert np.array_equal(res.strains, res_cached.strains)
+    assert calc.cache.hits == hits + 1
+
+    res = calc.calculate_mm_interaction_domain(n=-1e5, num_theta=8)
+    hits = calc.cache.hits
+    res_cached = calc.calculate_mm_interaction_domain(n=-1e5, num_theta=8)
+    assert np.array_equal(res.forces, res_cached.forces)
+    assert calc.cache.hits == hits + 1
+
+
+def test_calculator_cache_trials():
+    """Test the trials of a calculation are not stored in the cache."""
+    calc = GenericSection(create_geometry(), cache=64).section_calculator
+    calc.calculate_utilization(n=-1e5, m_y=5e7, m_z=1e7)
+    calc.calculate_mm_interaction_domain(n=-1e5, num_theta=8)
+    methods = [key[0] for key in calc.cache._results]
+    assert 'calculate_bending_strength' not in methods
+    assert methods.count('calculate_utilization') == 1
+    assert methods.count('calculate_mm_interaction_domain') == 1
+
+
+def test_calculator_cache_fingerprint(monkeypatch):
+    """Test the section is fingerprinted again only if a material changes."""
+    calc = GenericSection(create_geometry(), cache=64).section_calculator
+    calls = []
+    fingerprint = CompoundGeometry.fingerprint
+
+    def counted(geo):
+        calls.append(geo)
+        return fingerprint(geo)
+
+    monkeypatch.setattr(CompoundGeometry, 'fingerprint', counted)
+
+    res = calc.calculate_bending_strength(theta=0.3, n=-1e5)
+    calc.calculate_bending_strength(theta=0.3, n=-1e5)
+    calc.calculate_nm_interaction_domain(theta=0.2)
+    calc.calculate_nm_interaction_domain(theta=0.2)
+    # Only the section is fingerprinted, and only once
+    assert calls == [calc.section.geometry]
+
+    # A change of a material changes the keys
+    calc.section.geometry.geometries[0].material._fc = -30
+    res_new = calc.calculate_bending_strength(theta=0.3, n=-1e5)
+    assert len(calls) == 2
+    assert res_new.m_y != res.m_y
+
+
+def test_calculator_cache_threads():
+    """Test the cache shared by the threads computing a domain."""
+    calc = GenericSection(create_geometry(), cache=2).section_calculator
+    res = GenericSection(
+        create_geometry()
+    ).section_calculator.calculate_nmm_interaction_domain(num_theta=16)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        res_threads = calc.calculate_nmm_interaction_domain(
+            num_theta=16, executor=executor
+        )
+    assert np.allclose(res_threads.forces, res.forces)
+
+
+def test_calculator_cache_shared():
+    """Test a cache shared by calculators of equal sections."""
+    cache = ResultCache()
+    sec_1 = GenericSection(create_geometry(), cache=cache)
+    sec_2 = GenericSection(create_geometry(), cache=cache)
+    assert sec_1.section_calculator.cache is sec_2.section_calculator.cache
+
+    res_1 = sec_1.section_calculator.calculate_bending_strength(
+        theta=0.3, n=-1e5
+    )
+    hits = cache.hits
+    res_2 = sec_2.section_calculator.calculate_bending_strength(
+        theta=0.3, n=-1e5
+    )
+    assert cache.hits == hits + 1
+    assert res_1.m_y == res_2.m_y
+
+    # A different material gives a different section
+    geo = create_geometry()
+    geo.geometries[0].material._fc = -30
+    sec_3 = GenericSection(geo, cache=cache)
+    res_3 = sec_3.section_calculator.calculate_bending_strength(
+        theta=0.3, n=-1e5
+    )
+    assert cache.hits == hits + 1
+    assert res_3.m_y != res_1.m_y
+
+    # A different integrator gives a different key
+    sec_4 = GenericSection(
+        create_geometry(), integrator='fiber', mesh_size=0.01, cache=cache
+    )
+    sec_4.section_calculator.calculate_bending_strength(theta=0.3, n=-1e5)
+    assert cache.hits == hits + 1
+
+
+def test_calculator_no_cache():
+    """Test results are not cached by default."""
+    calc = GenericSection(create_geometry()).section_calculator
+    assert calc.cache is None
+    res = calc.calculate_bending_strength(theta=0.3, n=-1e5)
+    res_new = calc.calculate_bending_strength(theta=0.3, n=-1e5)
+    assert res_new is not res
+    calc.clear_cache()
+
+
+def test_domain_store(tmp_path, monkeypatch):
+    """Test the interaction domains are stored on disk."""
+    calc = GenericSection(
+        create_geometry(), store=tmp_path / 'domains'
+    ).section_calculator
+    assert isinstance(calc.store, DomainStore)
+    assert calc.store.path == tmp_path / 'domains'
+
+    res = calc.calculate_nmm_interaction_domain(num_theta=8)
+    res_nm = calc.calculate_nm_interaction_domain(theta=0.2)
+    assert len(calc.store) == 2
+
+    # A new calculator finds the domains without computing them
+    def fail(*args, **kwargs):
+        del args, kwargs
+        raise AssertionError('The domain should not be computed')
+
+    monkeypatch.setattr(
+        GenericSectionCalculator, '_compute_ultimate_strain_profiles', fail
+    )
+    calc_new = GenericSection(
+        create_geometry(), store=DomainStore(tmp_path / 'domains')
+    ).section_calculator
+    res_stored = calc_new.calculate_nmm_interaction_domain(num_theta=8)
+    assert isinstance(res_stored, NMMInteractionDomain)
+    assert res_stored.num_theta == 8
+    assert np.array_equal(res_stored.forces, res.forces)
+    assert np.array_equal(res_stored.strains, res.strains)
+    assert np.array_equal(res_stored.field_num, res.field_num)
+    res_nm_stored = calc_new.calculate_nm_interaction_domain(theta=0.2)
+    assert res_nm_stored.theta == 0.2
+    assert np.array_equal(res_nm_stored.forces, res_nm.forces)
+
+    # Other arguments are computed
+    with pytest.raises(AssertionError):
+        calc_new.calculate_nmm_interaction_domain(num_theta=4)
+
+    calc_new.store.clear()
+    assert len(calc_new.store) == 0
+
+
+def test_domain_store_with_cache(tmp_path):
+    """Test the domains stored on disk are kept also in memory."""
+    calc = GenericSection(
+        create_geometry(), cache=4, store=tmp_path
+    ).section_calculator
+
+    res = calc.calculate_mm_interaction_domain(n=-1e5, num_theta=8)
+    hits = calc.cache.hits
+    res_cached = calc.calculate_mm_interaction_domain(n=-1e5, num_theta=8)
+    assert calc.cache.hits == hits + 1
+    assert len(calc.store) == 1
+    assert np.array_equal(res_cached.theta, res.theta)
+    assert np.array_equal(res_cached.forces, res.forces)
+
+    # The store is not cleared with the cache
+    calc.clear_cache()
+    assert len(calc.store) == 1
+
+
+def test_domain_store_failed_save(tmp_path, monkeypatch):
+    """Test a failed save does not leave files in the store."""
+    store = DomainStore(tmp_path)
+    domain = NMMInteractionDomain(
+        strains=np.zeros((2, 3)), forces=np.ones((2, 3)), num_theta=1
+    )
+
+    def fail(*args, **kwargs):
+        del args, kwargs
+        raise OSError('Disk full')
+
+    monkeypatch.setattr(np, 'savez', fail)
+    with pytest.raises(OSError, match='Disk full'):
+        store.save('key', domain)
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,424 @@
+"""Tests for the section integrators."""
+
+import pickle
+
+import numpy as np
+import pytest
+from shapely import Polygon, box
+
+from structuralcodes.geometry import (
+    CompoundGeometry,
+    SurfaceGeometry,
+    add_reinforcement_line,
+)
+from structuralcodes.materials.concrete import ConcreteMC2010
+from structuralcodes.materials.constitutive_laws import UserDefined
+from structuralcodes.materials.reinforcement import ReinforcementMC2010
+from structuralcodes.sections import GenericSection
+from structuralcodes.sections.section_integrators import (
+    FiberData,
+    FiberIntegrator,
+    PreparedSection,
+    integrator_factory,
+)
+from structuralcodes.sections.section_integrators._marin_integration import (
+    marin_integration_moments,
+)
+from structuralcodes.sections.section_integrators._marin_integrator import (
+    _clip_ring_to_bands,
+)
+from structuralcodes.sections.section_integrators._prepared_section import (
+    _polygon_rings,
+)
+
+
+def create_rectangular_geometry():
+    """Create a reinforced rectangular geometry used in the tests."""
+    concrete = ConcreteMC2010(25)
+    steel = ReinforcementMC2010(fyk=450, Es=210000, ftk=450, epsuk=0.0675)
+    poly = Polygon(((0, 0), (200, 0), (200, 400), (0, 400)))
+    geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement_line(geo, (40, 40), (160, 40), 16, steel, n=4)
+    geo = add_reinforcement_line(geo, (40, 360), (160, 360), 16, steel, n=2)
+    return geo.translate(-100, -200)
+
+
+@pytest.mark.parametrize('integrator', ['marin', 'fiber'])
+def test_integrate_strain_responses(integrator):
+    """Test that batched integration matches the single profile one."""
+    # Arrange
+    geo = create_rectangular_geometry()
+    section_integrator = integrator_factory(integrator)()
+    strains = np.array(
+        [
+            [-0.001, 0.0, 0.0],
+            [0.0, -1e-5, 0.0],
+            [-0.0005, 1e-5, 5e-6],
+            [0.001, -2e-5, -1e-5],
+        ]
+    )
+
+    # Act
+    forces, tri = section_integrator.integrate_strain_responses(
+        geo, strains, mesh_size=0.001
+    )
+
+    # Assert
+    assert forces.shape == (4, 3)
+    for strain, force in zip(strains, forces):
+        N, Mx, My, _ = (
+            section_integrator.integrate_strain_response_on_geometry(
+                geo, strain, tri=tri, mesh_size=0.001
+            )
+        )
+        assert np.allclose(force, [N, Mx, My], rtol=1e-10, atol=1e-6)
+
+
+def test_fiber_data():
+    """Test the fiber table of the fiber integrator."""
+    # Arrange
+    geo = create_rectangular_geometry()
+    concrete = geo.geometries[0]
+
+    # Act
+    tri = FiberIntegrator().prepare_triangulated_data(geo, mesh_size=0.001)
+
+    # Assert
+    assert len(tri) == 2
+    assert all(isinstance(fibers, FiberData) for fibers in tri)
+    assert all(len(fibers) == 4 for fibers in tri)
+    assert len(pickle.loads(pickle.dumps(tri)).triangles) == 2
+    fibers = tri[0]
+    assert fibers.material is concrete.material
+    assert fibers.x.shape == fibers.y.shape == fibers.area.shape
+    assert np.all(fibers.area > 0)
+    assert np.isclose(fibers.area.sum(), concrete.area)
+    assert np.isclose(np.sum(fibers.area * fibers.x), 0, atol=1e-3)
+    assert np.isclose(
+        np.sum(fibers.area * fibers.y**2), 200 * 400**3 / 12, rtol=1e-2
+    )
+    assert tri.triangles[0].shape == (len(fibers.x), 3, 2)
+    assert tri.triangles[1] is None
+    # The fibers unpack as plain tuples
+    x, y, area, _ = tri[1]
+    assert np.allclose(np.sort(y), [-160] * 4 + [160] * 2)
+    assert np.allclose(area, 8**2 * np.pi)
+
+
+def create_concrete_geometry():
+    """Create a plain concrete rectangular geometry used in the tests."""
+    poly = Polygon(((0, 0), (200, 0), (200, 400), (0, 400)))
+    return CompoundGeometry([SurfaceGeometry(poly, ConcreteMC2010(25))])
+
+
+@pytest.mark.parametrize('mesh_size', [0.05, 0.01])
+def test_fiber_quadrature_exact(mesh_size):
+    """Test that the 7 points rule is exact for a polynomial stress."""
+    # Arrange: a compressed section in the parabolic branch
+    geo = create_concrete_geometry().translate(-100, -200)
+    strain = [-0.001, -2e-6, 1e-6]
+    marin = integrator_factory('marin')()
+    fiber = integrator_factory('fiber')()
+
+    # Act
+    N, Mx, My, _ = marin.integrate_strain_response_on_geometry(geo, strain)
+    N_3, _, _, _ = fiber.integrate_strain_response_on_geometry(
+        geo, strain, mesh_size=mesh_size, quadrature=3
+    )
+    N_7, Mx_7, My_7, _ = fiber.integrate_strain_response_on_geometry(
+        geo, strain, mesh_size=mesh_size, quadrature=7
+    )
+
+    # Assert
+    assert np.isclose(N_3, N, rtol=1e-10)
+    assert np.allclose([N_7, Mx_7, My_7], [N, Mx, My], rtol=1e-10)
+
+
+@pytest.mark.parametrize('quadrature', [3, 7])
+def test_fiber_quadrature_convergence(quadrature):
+    """Test that a coarse mesh with more points is more accurate than a fine
+    mesh with one point per triangle.
+    """
+    # Arrange: the neutral axis crosses the section
+    geo = create_concrete_geometry().translate(-100, -200)
+    strain = [-0.0005, 1e-5, 4e-6]
+    marin = integrator_factory('marin')()
+    fiber = integrator_factory('fiber')()
+
+    # Act
+    _, Mx, My, _ = marin.integrate_strain_response_on_geometry(geo, strain)
+    _, Mx_1, My_1, tri_1 = fiber.integrate_strain_response_on_geometry(
+        geo, strain, mesh_size=0.002
+    )
+    _, Mx_q, My_q, tri_q = fiber.integrate_strain_response_on_geometry(
+        geo, strain, mesh_size=0.01, quadrature=quadrature
+    )
+
+    # Assert
+    error_1 = np.hypot(Mx_1 - Mx, My_1 - My) / np.hypot(Mx, My)
+    error_q = np.hypot(Mx_q - Mx, My_q - My) / np.hypot(Mx, My)
+    assert error_q < error_1
+    assert len(tri_q[0].x) // quadrature < len(tri_1[0].x)
+
+
+def test_fiber_quadrature_invalid():
+    """Test that an invalid number of integration points raises an error."""
+    with pytest.raises(ValueError):
+        FiberIntegrator().prepare_triangulated_data(
+            create_concrete_geometry(), quadrature=4
+        )
+
+
+def test_fiber_quadrature_section():
+    """Test using the quadrature option from the section."""
+    geo = create_rectangular_geometry()
+    sec_marin = GenericSection(geo)
+    sec_fiber = GenericSection(
+        geo, integrator='fiber', mesh_size=0.01, quadrature=7
+    )
+    res_marin = sec_marin.section_calculator.calculate_bending_strength(
+        theta=0.3, n=-1e5
+    )
+    res_fiber = sec_fiber.section_calculator.calculate_bending_strength(
+        theta=0.3, n=-1e5
+    )
+    assert len(sec_fiber.section_calculator.triangulated_data[0].x) % 7 == 0
+    assert np.isclose(res_fiber.m_y, res_marin.m_y, rtol=2e-3)
+    assert np.isclose(res_fiber.m_z, res_marin.m_z, rtol=2e-3)
+
+
+def test_fiber_refinement():
+    """Test the refinement of the fibers near the breakpoints of the law."""
+    # Arrange: the neutral axis crosses the section
+    geo = create_concrete_geometry().translate(-100, -200)
+    strain = [-0.0005, 1e-5, 4e-6]
+    marin = integrator_factory('marin')()
+    fiber = integrator_factory('fiber')()
+    N, Mx, My, _ = marin.integrate_strain_response_on_geometry(geo, strain)
+    tri_fine = fiber.prepare_triangulated_data(
+        geo, mesh_size=0.0005, quadrature=3
+    )
+    tri = fiber.prepare_triangulated_data(geo, mesh_size=0.01, quadrature=3)
+
+    # Act
+    res_fine = fiber.integrate_strain_response_on_geometry(
+        geo, strain, tri=tri_fine
+    )
+    res = fiber.integrate_strain_response_on_geometry(
+        geo, strain, tri=tri, refinement=3
+    )
+    refined = fiber.refine_triangulated_data(tri, strain, 3)
+
+    # Assert
+    # The coarse mesh is returned, not the refined one
+    assert res[3] is tri
+    assert len(refined[0].x) < len(tri_fine[0].x)
+    assert np.isclose(sum(refined[0].area), 200 * 400)
+    # The refined mesh is more accurate than a uniform finer mesh
+    error_fine = np.abs(np.array(res_fine[:3]) - [N, Mx, My])
+    error = np.abs(np.array(res[:3]) - [N, Mx, My])
+    assert np.all(error < error_fine)
+    assert np.allclose(res[:3], [N, Mx, My], rtol=1e-5)
+
+
+def test_fiber_refinement_unchanged():
+    """Test that fibers not crossing breakpoints are not refined."""
+    geo = create_concrete_geometry().translate(-100, -200)
+    fiber = integrator_factory('fiber')()
+    tri = fiber.prepare_triangulated_data(geo, mesh_size=0.01)
+
+    # Without refinement the fibers are returned as they are
+    assert fiber.refine_triangulated_data(tri, [-0.001, 1e-5, 0], 0) is tri
+    # In the parabolic branch there are no breakpoints
+    refined = fiber.refine_triangulated_data(tri, [-0.001, 1e-6, 0], 3)
+    assert refined[0] is tri[0]
+
+
+def test_fiber_refinement_without_triangles():
+    """Test that fibers without the triangles of the mesh are not refined
+    silently.
+    """
+    geo = create_concrete_geometry().translate(-100, -200)
+    fiber = integrator_factory('fiber')()
+    tri = fiber.prepare_triangulated_data(geo, mesh_size=0.01)
+    strain = [-0.0005, 1e-5, 4e-6]
+
+    # The triangles survive a copy of the table
+    refined = fiber.refine_triangulated_data(
+        pickle.loads(pickle.dumps(tri)), strain, 3
+    )
+    assert len(refined[0].x) > len(tri[0].x)
+    # A plain list of the fibers cannot be refined
+    fibers = list(tri)
+    assert fiber.refine_triangulated_data(fibers, strain, 0) is fibers
+    with pytest.raises(ValueError):
+        fiber.refine_triangulated_data(fibers, strain, 3)
+    with pytest.raises(ValueError):
+        fiber.integrate_strain_response_on_geometry(
+            geo, strain, tri=tri[:], refinement=3
+        )
+
+
+def test_fiber_refinement_batch():
+    """Test the refinement integrating a batch of strain profiles."""
+    geo = create_concrete_geometry().translate(-100, -200)
+    strains = [[-0.0005, 1e-5, 4e-6], [-0.001, 1e-6, 0], [0.001, 0, 0]]
+    fiber = integrator_factory('fiber')()
+
+    forces, tri = fiber.integrate_strain_responses(
+        geo, strains, mesh_size=0.01, refinement=2
+    )
+
+    for strain, force in zip(strains, forces):
+        res = fiber.integrate_strain_response_on_geometry(
+            geo, strain, tri=tri, refinement=2
+        )
+        assert np.allclose(force, res[:3])
+
+
+@pytest.mark.parametrize(
+    'lower, upper',
+    [
+        (-10.0, 10.0),
+        (50.0, 150.0),
+        (-150.0, 250.0),
+        (140.0, 190.0),
+    ],
+)
+def test_marin_clip_ring_to_bands(lower, upper):
+    """Test clipping a ring to bands against the shapely intersection."""
+    # Arrange: a U shaped ring, whose upper part is split in two by a band
+    poly = Polygon(
+        ((0, 0), (300, 0), (300, 200), (200, 200), (200, 100), (100, 100),
+         (100, 200), (0, 200))
+    )  # fmt: skip
+    x, y = _polygon_rings(poly)[0]
+    band = box(-1, lower, 301, upper)
+
+    # Act
+    x_bands, y_bands = _clip_ring_to_bands(
+        x, y, np.array([lower, 0.0]), np.array([upper, 200.0])
+    )
+    area_moments, *_ = marin_integration_moments(x_bands, y_bands, 1)
+
+    # Assert
+    assert np.isclose(area_moments[0, 0], poly.intersection(band).area)
+    assert np.isclose(area_moments[1, 0], poly.area)
+
+
+def test_marin_rings_orientation():
+    """Test that the exterior is ccw and the holes cw."""
+    # Arrange
+    poly = Polygon(
+        ((0, 0), (0, 100), (100, 100), (100, 0)),
+        holes=[((10, 10), (90, 10), (90, 90), (10, 90))],
+    )
+
+    # Act
+    rings = _polygon_rings(poly)
+
+    # Assert
+    areas = [np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]) for x, y in rings]
+    assert len(rings) == 2
+    assert areas[0] > 0
+    assert areas[1] < 0
+    assert np.isclose(sum(areas) / 2, poly.area)
+
+
+@pytest.mark.parametrize(
+    'strain',
+    [
+        [-0.002, 1e-5, 0.0],
+        [-0.001, 2e-5, 1e-5],
+        [0.0, -3e-5, 2e-5],
+    ],
+)
+def test_marin_clipped_holed_section(strain):
+    """Test Marin with many strain bands against the fiber integrator."""
+    # Arrange: a holed section with a piecewise linear law
+    concrete = ConcreteMC2010(25)
+    law = UserDefined(
+        np.linspace(-0.0035, 0.0, 15),
+        -concrete.fcd() * np.sin(np.linspace(np.pi / 2, 0.0, 15)),
+    )
+    poly = Polygon(
+        ((-200, -300), (200, -300), (200, 300), (-200, 300)),
+        holes=[((-100, -200), (-100, 200), (100, 200), (100, -200))],
+    )
+    geo = CompoundGeometry([SurfaceGeometry(poly, law)])
+
+    # Act
+    marin = integrator_factory('marin')()
+    fiber = integrator_factory('fiber')()
+    res_marin = marin.integrate_strain_response_on_geometry(geo, strain)
+    res_fiber = fiber.integrate_strain_response_on_geometry(
+        geo, strain, mesh_size=0.0001
+    )
+
+    # Assert
+    assert np.isclose(res_marin[0], res_fiber[0], rtol=1e-2)
+    assert np.allclose(res_marin[1:3], res_fiber[1:3], rtol=1e-2, atol=1e5)
+
+
+def test_prepared_section():
+    """Test the arrays of the prepared section."""
+    # Arrange
+    concrete = ConcreteMC2010(25)
+    steel = ReinforcementMC2010(fyk=450, Es=210000, ftk=450, epsuk=0.0675)
+    poly = Polygon(
+        ((-200, -300), (200, -300), (200, 300), (-200, 300)),
+        holes=[((-100, -200), (-100, 200), (100, 200), (100, -200))],
+    )
+    geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement_line(geo, (-150, -250), (150, -250), 20, steel, 4)
+    geo = CompoundGeometry(
+        [geo, SurfaceGeometry(box(-200, 300, 200, 400), concrete)]
+    )
+
+    # Act
+    prepared = PreparedSection(geo)
+    unpickled = pickle.loads(pickle.dumps(prepared))
+
+    # Assert
+    assert prepared.n_rings == 3
+    assert prepared.n_surfaces == 2
+    assert list(prepared.ring_holes) == [False, True, False]
+    assert list(prepared.ring_surfaces) == [0, 0, 1]
+    assert list(prepared.ring_offsets) == [0, 5, 10, 15]
+    assert len(prepared.materials) == 2
+    assert not prepared.x.flags.writeable
+    areas = [
+        np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1])
+        for x, y, _ in prepared.rings()
+    ]
+    assert np.allclose(areas, [2 * 400 * 600, -2 * 200 * 400, 2 * 400 * 100])
+    groups = list(prepared.point_groups())
+    assert len(groups) == 1
+    assert np.allclose(groups[0][1], -250)
+    assert np.isclose(groups[0][2].sum(), 4 * np.pi * 10**2)
+    assert np.array_equal(unpickled.x, prepared.x)
+    assert unpickled.n_rings == prepared.n_rings
+
+
+@pytest.mark.parametrize('integrator', ['marin', 'fiber'])
+def test_integrate_prepared_section(integrator):
+    """Test that the integrators give the same results with a prepared
+    section.
+    """
+    # Arrange
+    geo = create_rectangular_geometry()
+    section_integrator = integrator_factory(integrator)()
+    strain = [-0.0005, 1e-5, 5e-6]
+
+    # Act
+    *res, _ = section_integrator.integrate_strain_response_on_geometry(
+        geo, strain, mesh_size=0.001
+    )
+    *res_prepared, _ = (
+        section_integrator.integrate_strain_response_on_geometry(
+            geo, strain, prepared=PreparedSection(geo), mesh_size=0.001
+        )
+    )
+
+    # Assert
+    assert np.allclose(res_prepared, res)
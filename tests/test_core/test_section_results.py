@@ -0,0 +1,160 @@
+"""Tests for the results of the section calculations."""
+
+import numpy as np
+import pytest
+from shapely import Polygon
+
+from structuralcodes.core._section_results import (
+    MMInteractionDomain,
+    MomentCurvatureFamilyResults,
+    NMInteractionDomain,
+    NMMInteractionDomain,
+)
+from structuralcodes.geometry import SurfaceGeometry, add_reinforcement_line
+from structuralcodes.materials.concrete import ConcreteMC2010
+from structuralcodes.materials.reinforcement import ReinforcementMC2010
+from structuralcodes.sections import GenericSection
+
+
+def create_box_domain():
+    """Create a NMM domain with the shape of a box."""
+    n = [-2000, 500]
+    m_y = [-100, 100]
+    m_z = [-50, 50]
+    forces = np.array(np.meshgrid(n, m_y, m_z)).reshape(3, -1).T
+    return NMMInteractionDomain(forces=forces)
+
+
+@pytest.mark.parametrize(
+    'forces, expected',
+    [
+        ([0, 0, 0], 0),
+        ([250, 0, 0], 0.5),
+        ([-4000, 0, 0], 2),
+        ([0, -50, 0], 0.5),
+        ([0, 0, 50], 1),
+        ([-1000, 80, -10], 0.8),
+        ([100, 0, -200], 4),
+    ],
+)
+def test_nmm_domain_utilization(forces, expected):
+    """Test the utilization of load points in a NMM domain."""
+    domain = create_box_domain()
+    utilization = domain.get_utilization(forces)
+    assert utilization.shape == (1,)
+    assert np.isclose(utilization[0], expected)
+    assert domain.contains(forces)[0] == (expected <= 1)
+
+
+def test_nmm_domain_utilization_many():
+    """Test the utilization of many load points at once."""
+    domain = create_box_domain()
+    rng = np.random.default_rng(0)
+    forces = rng.uniform(-1, 1, (1000, 3)) * [4000, 200, 100]
+
+    utilization = domain.get_utilization(forces)
+
+    expected = np.max(
+        [
+            np.maximum(forces[:, 0] / 500, forces[:, 0] / -2000),
+            np.abs(forces[:, 1]) / 100,
+            np.abs(forces[:, 2]) / 50,
+        ],
+        axis=0,
+    )
+    assert np.allclose(utilization, expected)
+    # The facets are reused, processing the points in chunks
+    assert np.allclose(domain.get_utilization(forces, chunk_size=7), expected)
+    # Replacing the forces updates the facets
+    domain.forces = domain.forces * 2
+    assert np.allclose(domain.get_utilization(forces), expected / 2)
+
+
+def test_domain_origin_outside():
+    """Test a domain not containing the origin raises an error."""
+    domain = create_box_domain()
+    domain.forces = domain.forces + [3000, 0, 0]
+    with pytest.raises(ValueError):
+        domain.get_utilization([0, 0, 0])
+
+
+def test_mm_domain_utilization():
+    """Test the utilization of load points in a MM domain."""
+    theta = np.linspace(0, 2 * np.pi, 361)
+    forces = np.column_stack(
+        (np.full_like(theta, -100), 200 * np.cos(theta), 100 * np.sin(theta))
+    )
+    domain = MMInteractionDomain(forces=forces, theta=theta)
+
+    utilization = domain.get_utilization(
+        [[0, 100, 0], [-100, 0, -150], [100, 100 * 2**0.5, 50 * 2**0.5]]
+    )
+
+    # The axial force of the load points is not considered
+    assert np.allclose(utilization, [0.5, 1.5, 1], rtol=1e-4)
+
+
+def test_nm_domain_utilization():
+    """Test the utilization of load points in a NM domain."""
+    # Half of a domain, with positive moments
+    angle = np.linspace(0, np.pi, 181)
+    m = 100 * np.sin(angle)
+    forces = np.column_stack((1000 * np.cos(angle), m, np.zeros_like(m)))
+    domain = NMInteractionDomain(forces=forces, theta=0)
+
+    utilization = domain.get_utilization(
+        [[0, 50, 0], [-1000 * 2**-0.5, 100 * 2**-0.5, 0], [0, -50, 0]]
+    )
+
+    assert np.allclose(utilization[:2], [0.5, 1], rtol=1e-4)
+    # The load point is on the other side of the domain
+    assert np.isnan(utilization[2])
+    assert not domain.contains([0, -50, 0])[0]
+
+    # The moment is projected on the axis of the domain
+    domain = NMInteractionDomain(forces=forces[:, [0, 2, 1]], theta=np.pi / 2)
+    assert np.allclose(domain.get_utilization([0, 10, 50]), 0.5, rtol=1e-4)
+
+
+def test_section_domain_utilization():
+    """Test the utilization of the bending strength is one."""
+    concrete = ConcreteMC2010(25)
+    steel = ReinforcementMC2010(fyk=450, Es=210000, ftk=450, epsuk=0.0675)
+    poly = Polygon(((0, 0), (200, 0), (200, 400), (0, 400)))
+    geo = SurfaceGeometry(poly, concrete)
+    geo = add_reinforcement_line(geo, (40, 40), (160, 40), 16, steel, n=4)
+    geo = add_reinforcement_line(geo, (40, 360), (160, 360), 16, steel, n=4)
+    geo = geo.translate(-100, -200)
+    calc = GenericSection(geo).section_calculator
+
+    nmm = calc.calculate_nmm_interaction_domain(num_theta=33)
+    nm = calc.calculate_nm_interaction_domain(theta=np.pi / 2)
+    mm = calc.calculate_mm_interaction_domain(n=-5e5, num_theta=33)
+    res = calc.calculate_bending_strength(theta=np.pi / 2, n=-5e5)
+    forces = [res.n, res.m_y, res.m_z]
+
+    assert np.isclose(nmm.get_utilization(forces)[0], 1, rtol=1e-2)
+    assert np.isclose(nm.get_utilization(forces)[0], 1, rtol=1e-2)
+    assert np.isclose(mm.get_utilization(forces)[0], 1, rtol=1e-2)
+
+
+def test_moment_curvature_family_results():
+    """Test the relations of a family are padded with nan."""
+    chi = np.array([[1.0, 2.0, 3.0], [1.0, 2.0, np.nan]])
+    res = MomentCurvatureFamilyResults(
+        theta=0.5,
+        n=np.array([-100, 0]),
+        chi_y=chi,
+        chi_z=-chi,
+        eps_axial=chi / 10,
+        m_y=chi * 100,
+        m_z=-chi * 100,
+    )
+
+    assert len(res) == 2
+    res_1 = res[1]
+    assert res_1.theta == 0.5
+    assert res_1.n == 0
+    assert np.array_equal(res_1.chi_y, [1, 2])
+    assert np.array_equal(res_1.m_z, [-100, -200])
+    assert len(res[0].eps_axial) == 3